@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+골든 코퍼스 벤치마크 (검색 추출기 + 메타 추출)
+
+bench/corpus/의 고정 페이지 세트(manifest.json)로 엔진별 성능/정확도 측정:
+- pages/sec, 페이지당 파싱 시간 p50/p99, tracemalloc 최대 메모리
+  (selectolax/lxml의 C 라이브러리 내부 할당은 tracemalloc에 잡히지 않음)
+- 골든 결과 비교: 랭킹/광고 수, 랭킹 uniqueKey 목록 해시, 응답 분류, 메타 정보 (불일치 시 실패, exit 1)
+- 속도: 같은 실행에서 측정한 html.parser p50 대비 비율 출력 (기준값 baseline.json의 비율과 함께)
+  절대 시간은 기계마다 달라서 기본은 골든 결과만 판정하고, --gate-speed면 비율이
+  기준값보다 임계치 이상 커질 때도 실패 (baseline.json은 측정한 기계에서 --update-baseline으로 갱신)
+
+코퍼스:
+- 포함된 페이지는 모두 합성 페이지 (bench_extractor.make_search_page 기반, --generate로 재생성)
+  PC/모바일, 광고 비중 높은 페이지, 검색결과 없음, 챌린지 스텁
+  실제 수집 페이지는 포함되어 있지 않음 (manifest.json synthetic_only, baseline.json synthetic_pages)
+- 합성 페이지만으로 통과한 골든 비교는 합성 마크업에서 엔진끼리 결과가 같다는 뜻일 뿐
+  실제 쿠팡 페이지에서의 동등성 보장이 아님 (출력에 경고 표시, --require-recorded면 실패)
+- 저장된 실제 페이지는 개인정보(쿠키/사용자 정보)를 지운 뒤 --add로 추가
+  (save_html, logs/scan_mismatch 등), 골든 결과는 추가 시점의 html.parser 전체 문서 파싱 결과로 기록
+
+사용법:
+  python3 bench_corpus.py                          # 측정 + 골든 비교
+  python3 bench_corpus.py --gate-speed             # 속도 비율도 기준값과 비교 (같은 기계 기준값)
+  python3 bench_corpus.py --require-recorded       # 실제 페이지가 없으면 실패 (동등성 판정용)
+  python3 bench_corpus.py -r 20 --engines scan selectolax
+  python3 bench_corpus.py --update-baseline        # 현재 측정값을 기준값으로 저장
+  python3 bench_corpus.py --add page.html --kind pc
+  python3 bench_corpus.py --generate               # 합성 페이지 재생성
+"""
+
+import sys
+import os
+import gzip
+import json
+import time
+import hashlib
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
+
+import extractor.search_extractor as search_extractor
+from extractor.search_extractor import ProductExtractor, available_parsers, extract_search_meta
+from work.classify import classify_response
+from bench_extractor import make_search_page
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench', 'corpus')
+MANIFEST_FILE = 'manifest.json'
+BASELINE_FILE = 'baseline.json'
+
+# 속도 비교 기준 엔진 (항상 측정, p50 비율의 분모)
+REFERENCE_ENGINE = 'html.parser'
+
+# 기준값 대비 허용 비율 (html.parser 대비 p50 비율 기준, 0.25 = 비율이 25% 커지면 실패)
+DEFAULT_THRESHOLD = 0.25
+
+
+# ============================================================================
+# 합성 페이지 (검색결과 없음, 챌린지 스텁)
+# ============================================================================
+
+def make_no_results_page(query='ㅁㄴㅇㄹ노트북', filler_kb=80):
+    """검색결과 없음 페이지 (상품 리스트 없음)"""
+    filler = ''.join(
+        f'<div class="gnb-menu"><a href="/np/categories/{n}">카테고리 {n}</a></div>\n'
+        for n in range(filler_kb * 1024 // 60)
+    )
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">'
+        f'<title>쿠팡! | {query}</title>'
+        '<script>window.__search = {"searchId":"8f2c00000000","totalProductCount":0};</script>'
+        f'</head><body><div id="__next"><header id="header">{filler}</header>'
+        '<main><div class="search-content"><div class="no-result">'
+        f'<p class="no-result-title">\'{query}\'에 대한 검색결과가 없습니다.</p>'
+        '<ul class="no-result-tips"><li>단어의 철자가 정확한지 확인해 보세요.</li></ul>'
+        f'</div></div></main><footer>{filler}</footer></div></body></html>'
+    )
+
+
+def make_challenge_page(kind='denied'):
+    """챌린지/차단 스텁 (Akamai 차단 페이지, sec-if-cpt 확인 페이지)"""
+    if kind == 'denied':
+        return (
+            '<HTML><HEAD>\n<TITLE>Access Denied</TITLE>\n</HEAD><BODY>\n<H1>Access Denied</H1>\n'
+            'You don\'t have permission to access "http&#58;&#47;&#47;www&#46;coupang&#46;com&#47;np&#47;search" '
+            'on this server.<P>\nReference&#32;&#35;18&#46;6f2d3e17&#46;1700000000&#46;1a2b3c4d\n</BODY>\n</HTML>\n'
+        )
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title></title>'
+        '<script src="/_sec/cp_challenge/sec-cpt-4-2.js" async defer></script></head>'
+        '<body><div id="sec-if-cpt-container" class="sec-if-cpt">'
+        '<iframe id="sec-cpt-if" provider="crypto" data-key="" data-duration="5" '
+        'src="/_sec/cp_challenge/ak-challenge-4-2.htm"></iframe></div></body></html>'
+    )
+
+
+# 합성 코퍼스 구성: (파일명, 종류, 생성 함수)
+SYNTHETIC_PAGES = [
+    ('pc_01', 'pc', lambda: make_search_page(layout='pc', seed=101, next_data_kb=100)),
+    ('pc_02', 'pc', lambda: make_search_page(layout='pc', seed=102, next_data_kb=300)),
+    ('pc_03_short', 'pc', lambda: make_search_page(n_ranking=17, n_ads=3, layout='pc', seed=103)),
+    ('pc_04_large', 'pc', lambda: make_search_page(layout='pc', seed=104, filler_kb=400, next_data_kb=200)),
+    ('mobile_01', 'mobile', lambda: make_search_page(layout='mobile', seed=201)),
+    ('mobile_02', 'mobile', lambda: make_search_page(n_ranking=36, n_ads=6, layout='mobile', seed=202)),
+    ('pc_ads_heavy', 'ads', lambda: make_search_page(n_ranking=36, n_ads=36, layout='pc', seed=301)),
+    ('mobile_ads_heavy', 'ads', lambda: make_search_page(n_ranking=36, n_ads=36, layout='mobile', seed=302)),
+    ('no_results', 'no_results', make_no_results_page),
+    ('challenge_denied', 'challenge', lambda: make_challenge_page('denied')),
+    ('challenge_sec_cpt', 'challenge', lambda: make_challenge_page('sec_cpt')),
+]
+
+
+# ============================================================================
+# 코퍼스 (manifest.json + *.html.gz)
+# ============================================================================
+
+def _keys_digest(products):
+    return hashlib.sha1('\n'.join(p['uniqueKey'] for p in products).encode('utf-8')).hexdigest()
+
+
+def golden_record(content):
+    """페이지 골든 결과 (html.parser 전체 문서 파싱 = 기준 구현)"""
+    html = content.decode('utf-8', errors='replace')
+    region_only = search_extractor.PARSE_REGION_ONLY
+    search_extractor.PARSE_REGION_ONLY = False
+    try:
+        result = ProductExtractor.extract_products_from_html(html, parser='html.parser')
+    finally:
+        search_extractor.PARSE_REGION_ONLY = region_only
+    return {
+        'page_type': classify_response(200, content),
+        'ranking': len(result['ranking']),
+        'ads': len(result['ads']),
+        'keys': _keys_digest(result['ranking']),
+        'meta': extract_search_meta(html),
+    }
+
+
+def load_manifest(corpus_dir):
+    path = os.path.join(corpus_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {'pages': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(corpus_dir, manifest):
+    # 합성 페이지만 있는지 기록 (골든 통과를 실제 페이지 동등성으로 오해하지 않도록)
+    manifest = {'synthetic_only': all(p.get('source') == 'synthetic' for p in manifest['pages']),
+                'pages': manifest['pages']}
+    with open(os.path.join(corpus_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def add_page(corpus_dir, manifest, name, kind, content, source):
+    """페이지 저장 (gzip) + 골든 결과 기록 (같은 이름은 교체)"""
+    filename = f"{name}.html.gz"
+    with gzip.GzipFile(os.path.join(corpus_dir, filename), 'wb', mtime=0) as f:
+        f.write(content)
+    entry = {'file': filename, 'kind': kind, 'source': source, 'bytes': len(content)}
+    entry.update(golden_record(content))
+    manifest['pages'] = [p for p in manifest['pages'] if p['file'] != filename] + [entry]
+    return entry
+
+
+def load_corpus(corpus_dir):
+    """코퍼스 로드
+
+    Returns:
+        list: [(manifest 항목, 본문 bytes), ...]
+    """
+    pages = []
+    for entry in load_manifest(corpus_dir)['pages']:
+        with gzip.open(os.path.join(corpus_dir, entry['file']), 'rb') as f:
+            pages.append((entry, f.read()))
+    return pages
+
+
+def generate_corpus(corpus_dir):
+    """합성 페이지 재생성 (--add로 추가한 페이지는 유지)"""
+    os.makedirs(corpus_dir, exist_ok=True)
+    manifest = load_manifest(corpus_dir)
+    manifest['pages'] = [p for p in manifest['pages'] if p.get('source') != 'synthetic']
+    for name, kind, make in SYNTHETIC_PAGES:
+        entry = add_page(corpus_dir, manifest, name, kind, make().encode('utf-8'), 'synthetic')
+        print(f"  {entry['file']:28s} {entry['bytes'] / 1024:6.0f}KB  {entry['page_type']:10s} "
+              f"랭킹 {entry['ranking']:3d}  광고 {entry['ads']:3d}")
+    save_manifest(corpus_dir, manifest)
+    return 0
+
+
+# ============================================================================
+# 측정
+# ============================================================================
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+def _measure(pages, fn, rounds):
+    """fn(content)을 페이지마다 rounds회 실행: 페이지당 시간 분포 + 최대 메모리"""
+    for _, content in pages:
+        fn(content)  # 워밍업 (import/정규식 캐시)
+
+    durations = []
+    for _ in range(rounds):
+        for _, content in pages:
+            start = time.perf_counter()
+            fn(content)
+            durations.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    for _, content in pages:
+        fn(content)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    durations.sort()
+    return {
+        'pages_per_sec': len(durations) / sum(durations) if durations else 0.0,
+        'p50_ms': _percentile(durations, 0.50) * 1000,
+        'p99_ms': _percentile(durations, 0.99) * 1000,
+        'peak_kb': peak / 1024,
+    }
+
+
+def check_golden(pages, engine):
+    """골든 결과와 다른 페이지 목록"""
+    mismatched = []
+    for entry, content in pages:
+        if engine == 'meta':
+            same = extract_search_meta(content.decode('utf-8', errors='replace')) == entry['meta']
+        else:
+            result = ProductExtractor.extract_products_from_html(content, parser=engine)
+            same = (len(result['ranking']) == entry['ranking'] and len(result['ads']) == entry['ads']
+                    and _keys_digest(result['ranking']) == entry['keys'])
+            same = same and classify_response(200, content) == entry['page_type']
+        if not same:
+            mismatched.append(entry['file'])
+    return mismatched
+
+
+def run_benchmark(pages, engines, rounds):
+    """엔진별 측정 + 골든 비교
+
+    Returns:
+        dict: {engine: {pages_per_sec, p50_ms, p99_ms, peak_kb, mismatched}}
+    """
+    results = {}
+    for engine in engines:
+        if engine == 'meta':
+            fn = lambda content: extract_search_meta(content.decode('utf-8', errors='replace'))
+        else:
+            fn = lambda content, engine=engine: ProductExtractor.extract_products_from_html(content, parser=engine)
+        stats = _measure(pages, fn, rounds)
+        stats['mismatched'] = check_golden(pages, engine)
+        results[engine] = stats
+    return results
+
+
+def relative_p50(engines, engine):
+    """엔진 p50 / 기준 엔진 p50 (같은 실행/기준값 안에서 계산, 기준 없으면 None)"""
+    ref = engines.get(REFERENCE_ENGINE)
+    stats = engines.get(engine)
+    if not ref or not stats or not ref['p50_ms']:
+        return None
+    return stats['p50_ms'] / ref['p50_ms']
+
+
+def compare_baseline(results, baseline, threshold):
+    """기준값 대비 p50 비율 회귀 목록 [(engine, baseline_ratio, current_ratio), ...]
+
+    절대 시간은 기계마다 다르므로 같은 실행의 html.parser p50 대비 비율끼리 비교
+    """
+    regressions = []
+    base_engines = baseline.get('engines', {})
+    for engine in results:
+        if engine == REFERENCE_ENGINE:
+            continue
+        base_ratio = relative_p50(base_engines, engine)
+        current_ratio = relative_p50(results, engine)
+        if base_ratio and current_ratio and current_ratio > base_ratio * (1 + threshold):
+            regressions.append((engine, base_ratio, current_ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='골든 코퍼스 벤치마크')
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='코퍼스 디렉토리')
+    parser.add_argument('--rounds', '-r', type=int, default=5, help='반복 횟수')
+    parser.add_argument('--engines', nargs='+', default=None,
+                        help='측정 대상 (파서 백엔드, meta = extract_search_meta)')
+    parser.add_argument('--gate-speed', action='store_true',
+                        help='html.parser 대비 p50 비율이 기준값보다 임계치 이상 커지면 실패')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'--gate-speed 허용 비율 증가 (기본: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--update-baseline', action='store_true', help='현재 측정값을 기준값으로 저장')
+    parser.add_argument('--generate', action='store_true', help='합성 페이지 재생성')
+    parser.add_argument('--add', nargs='+', metavar='HTML', help='저장된 검색 페이지를 코퍼스에 추가')
+    parser.add_argument('--kind', default='pc', help='--add 페이지 종류 (pc, mobile, ads, no_results, challenge)')
+    parser.add_argument('--require-recorded', action='store_true',
+                        help='실제 수집 페이지(--add)가 없으면 실패 (합성 페이지만으로는 동등성 판정 안함)')
+    args = parser.parse_args()
+
+    if args.generate:
+        return generate_corpus(args.corpus)
+
+    if args.add:
+        manifest = load_manifest(args.corpus)
+        for path in args.add:
+            with open(path, 'rb') as f:
+                content = f.read()
+            name = os.path.splitext(os.path.basename(path))[0]
+            entry = add_page(args.corpus, manifest, name, args.kind, content, 'recorded')
+            print(f"  추가: {entry['file']} ({entry['page_type']}, 랭킹 {entry['ranking']}, 광고 {entry['ads']})")
+        save_manifest(args.corpus, manifest)
+        return 0
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"코퍼스 없음: {args.corpus} (--generate로 생성)")
+        return 1
+
+    engines = args.engines or available_parsers() + ['meta']
+    if REFERENCE_ENGINE not in engines:
+        engines = [REFERENCE_ENGINE] + engines  # 비율 비교 기준
+    total_kb = sum(len(content) for _, content in pages) / 1024
+    synthetic = sum(1 for entry, _ in pages if entry.get('source') == 'synthetic')
+
+    print("=" * 72)
+    print(f"골든 코퍼스 벤치마크: {len(pages)}페이지 ({total_kb:.0f}KB, 합성 {synthetic}) x {args.rounds}회")
+    if synthetic == len(pages):
+        print("  ⚠️ 합성 페이지만 있음: 골든 일치는 합성 마크업 기준 엔진 간 일치일 뿐, 실제 페이지 동등성 보장 아님")
+    print("=" * 72)
+
+    results = run_benchmark(pages, engines, args.rounds)
+
+    baseline_path = os.path.join(args.corpus, BASELINE_FILE)
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    failed = False
+    for engine, stats in results.items():
+        ratio = relative_p50(results, engine)
+        base_ratio = relative_p50(baseline.get('engines', {}), engine)
+        delta = ''
+        if engine != REFERENCE_ENGINE and ratio is not None:
+            delta = f"  (x{ratio:.3f} {REFERENCE_ENGINE}"
+            delta += f", 기준 x{base_ratio:.3f})" if base_ratio else ")"
+        status = 'OK' if not stats['mismatched'] else f"골든 불일치 {len(stats['mismatched'])}"
+        failed |= bool(stats['mismatched'])
+        print(f"  {engine:12s} {stats['pages_per_sec']:8.1f} pages/sec  p50 {stats['p50_ms']:7.2f}ms  "
+              f"p99 {stats['p99_ms']:7.2f}ms  peak {stats['peak_kb'] / 1024:6.1f}MB  [{status}]{delta}")
+        for filename in stats['mismatched']:
+            print(f"      - {filename}")
+
+    if args.update_baseline:
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'rounds': args.rounds,
+                'pages': len(pages),
+                'synthetic_pages': synthetic,
+                'engines': {engine: {k: round(v, 3) for k, v in stats.items() if k != 'mismatched'}
+                            for engine, stats in results.items()},
+            }, f, indent=2)
+            f.write('\n')
+        print(f"\n기준값 저장: {baseline_path}")
+    elif args.gate_speed:
+        regressions = compare_baseline(results, baseline, args.threshold)
+        for engine, base_ratio, current_ratio in regressions:
+            print(f"\n  ❌ {engine}: p50 {REFERENCE_ENGINE} 대비 x{base_ratio:.3f} → x{current_ratio:.3f} "
+                  f"(허용 +{args.threshold:.0%})")
+        failed |= bool(regressions)
+
+    if args.require_recorded and synthetic == len(pages):
+        print(f"\n  ❌ 실제 수집 페이지 없음 (합성 {synthetic}페이지만) → 동등성 판정 불가")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
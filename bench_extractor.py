@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+검색 추출기 벤치마크
+
+- 파서 백엔드별 pages/sec 측정 (동일 페이지 세트)
+- 결과({ranking, ads, total})가 html.parser 전체 문서 파싱(기준 구현)과 동일한지 비교
+- 상품 리스트 구간 파싱으로 건너뛴 페이지당 평균 크기 출력
+- --cards: 카드 인덱스(한 번 순회) vs 링크별 find_parent/select 쿼리 (같은 트리)
+- --verify: scan/lxml/selectolax를 페이지 샘플에 돌려 html.parser(기준 구현)와 불일치 수 집계
+- --pipeline P: 응답 bytes → 추출 경로를 P개 스레드로 실행 (전체 디코딩 vs 구간만 디코딩)
+  페이지당 CPU 시간과 tracemalloc 최대 메모리 비교 (work.py -p 병렬 실행 모사)
+- --meta: extract_search_meta (필드별 1회 탐색 + __NEXT_DATA__ 부분 디코딩) vs 기존 방식
+
+사용법:
+  python3 bench_extractor.py                          # 합성 검색 페이지 사용
+  python3 bench_extractor.py page1.html page2.html    # 저장된 검색 페이지 사용
+  python3 bench_extractor.py -r 20 --parsers html.parser lxml
+  python3 bench_extractor.py --verify --sample 0.2 pages/*.html
+  python3 bench_extractor.py --verify --parsers lxml selectolax pages/*.html
+  python3 bench_extractor.py --cards 72 200
+  python3 bench_extractor.py --meta
+  python3 bench_extractor.py --pipeline 16 --parsers selectolax scan
+"""
+
+import sys
+import os
+import re
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
+
+import extractor.search_extractor as search_extractor
+from extractor.search_extractor import ProductExtractor, available_parsers, verify_parser_backend, extract_search_meta
+from extractor.search_extractor import _soup_index_list, _soup_card_index
+from bs4 import BeautifulSoup
+
+
+# ============================================================================
+# 합성 검색 페이지 (실제 쿠팡 검색 페이지 구조 모사)
+# ============================================================================
+
+def _card_html(layout, product_id, item_id, vendor_item_id, rank, is_ad, name, rng):
+    """상품 카드 1개 HTML"""
+    params = f"itemId={item_id}&amp;vendorItemId={vendor_item_id}&amp;sourceType=search"
+    if rank is not None:
+        params += f"&amp;rank={rank}"
+    params += f"&amp;searchId=8f2c{rng.randrange(16**8):08x}&amp;q=%EB%85%B8%ED%8A%B8%EB%B6%81"
+    href = f"/vp/products/{product_id}?{params}"
+
+    price = f"{rng.randrange(5, 900) * 100:,}원"
+    rating = f"{rng.randrange(30, 51) / 10:.1f}"
+    reviews = f"({rng.randrange(1, 50000):,})"
+
+    if layout == 'mobile':
+        ad = '<span class="AdMark_adMark__m">AD</span>' if is_ad else ''
+        return (
+            f'<li class="plp-default__item">'
+            f'<a href="{href}" class="plp-default__link">'
+            f'<div class="plp-default__thumbnail"><img src="//thumbnail7.coupangcdn.com/{product_id}.jpg" alt=""></div>'
+            f'<div class="plp-default__title name">{name}</div>'
+            f'<div class="plp-default__price"><strong class="price-value">{price}</strong></div>'
+            f'<div class="plp-default__rating"><span class="rating">{rating}</span>'
+            f'<span class="rating-total-count">{reviews}</span></div>'
+            f'</a>{ad}</li>'
+        )
+
+    ad = '<div class="AdMark_adMark__KPMsC"><span>광고</span></div>' if is_ad else ''
+    return (
+        f'<li class="ProductUnit_productUnit__Qd6sv" data-id="{product_id}">'
+        f'<a href="{href}" target="_blank">'
+        f'<figure class="ProductUnit_productImage__Mqcg1">'
+        f'<img src="//thumbnail10.coupangcdn.com/thumbnails/remote/320x320ex/image/{product_id}.jpg" alt="{name}" width="212" height="212">'
+        f'</figure>'
+        f'<div class="ProductUnit_productInfo__1fnb2">'
+        f'<div class="ProductUnit_productName__gre7e name">{name}</div>'
+        f'<div class="PriceArea_priceArea__NntJz"><div class="custom-oos"><strong class="price-value">{price}</strong></div></div>'
+        f'<div class="ProductRating_productRating__jjf7W"><span class="ProductRating_star__RGSlV rating">'
+        f'<em>{rating}</em></span><span class="rating-total-count">{reviews}</span></div>'
+        f'</div></a>{ad}</li>'
+    )
+
+
+def _next_data_script(rng, size_kb):
+    """PC 검색 페이지 __NEXT_DATA__ 스크립트 (pageProps에 상품 JSON)"""
+    products = []
+    size = 0
+    while size < size_kb * 1024:
+        product_id = rng.randrange(10**9, 10**10)
+        product = {
+            'productId': product_id,
+            'name': f"테스트 상품 {len(products)}",
+            'url': f"/vp/products/{product_id}?itemId={rng.randrange(10**10, 10**11)}",
+            'price': {'salePrice': rng.randrange(5, 900) * 100, 'unit': '원'},
+            'badges': ['rocket', 'freeShipping'],
+            'description': '상품 설명 ' * 20,
+        }
+        products.append(product)
+        size += len(json.dumps(product, ensure_ascii=False).encode('utf-8'))
+    next_data = {
+        'props': {'pageProps': {'listSize': 72, 'searchId': '8f2c1a2b3c4d', 'products': products}},
+        'page': '/np/search',
+        'query': {'q': '노트북'},
+        'buildId': f"build-{rng.randrange(16**6):06x}",
+        'isFallback': False,
+    }
+    return ('<script id="__NEXT_DATA__" type="application/json">'
+            f'{json.dumps(next_data, ensure_ascii=False)}</script>')
+
+
+def make_search_page(n_ranking=72, n_ads=10, layout='pc', seed=0, filler_kb=200, next_data_kb=0):
+    """합성 검색 페이지 생성
+
+    Args:
+        n_ranking: 랭킹 상품 수
+        n_ads: 광고 상품 수 (랭킹 사이에 섞임)
+        layout: 'pc' 또는 'mobile'
+        seed: 난수 시드
+        filler_kb: 상품 리스트 외 헤더/스크립트 영역 크기 (KB)
+        next_data_kb: __NEXT_DATA__ 스크립트 크기 (KB, 0이면 없음)
+
+    Returns:
+        str: 검색 페이지 HTML
+    """
+    rng = random.Random(seed)
+    cards = []
+    rank = 0
+    ad_slots = set(rng.sample(range(n_ranking + n_ads), n_ads))
+
+    for i in range(n_ranking + n_ads):
+        product_id = rng.randrange(10**9, 10**10)
+        item_id = rng.randrange(10**10, 10**11)
+        vendor_item_id = rng.randrange(10**10, 10**11)
+        name = f"테스트 상품 {i} &amp; 옵션 {rng.randrange(100)}개입"
+        if i in ad_slots:
+            # 광고: rank 없거나 AdMark 표시
+            ad_rank = None if rng.random() < 0.5 else rank + 1
+            cards.append(_card_html(layout, product_id, item_id, vendor_item_id, ad_rank, True, name, rng))
+        else:
+            rank += 1
+            cards.append(_card_html(layout, product_id, item_id, vendor_item_id, rank, False, name, rng))
+
+    list_id = 'productList' if layout == 'mobile' else 'product-list'
+    filler_line = '<div class="gnb-menu"><a href="/np/categories/%d">카테고리 %d</a><span class="badge">new</span></div>\n'
+    filler = []
+    size = 0
+    n = 0
+    while size < filler_kb * 1024 // 2:
+        line = filler_line % (n, n)
+        filler.append(line)
+        size += len(line)
+        n += 1
+    header = ''.join(filler)
+    footer = ''.join(filler)
+    next_data = _next_data_script(rng, next_data_kb) if next_data_kb else ''
+
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">'
+        '<title>쿠팡! | 노트북</title>'
+        '<script>window.__search = {"searchId":"8f2c1a2b3c4d","totalProductCount":123456};</script>'
+        '</head><body><div id="__next"><header id="header">'
+        f'{header}</header><main><div class="search-content">'
+        f'<ul id="{list_id}" class="ProductList_productList__1dD1I">'
+        f'{"".join(cards)}</ul></div></main><footer>{footer}</footer></div>{next_data}</body></html>'
+    )
+
+
+def load_pages(paths):
+    """HTML 파일 목록 로드 (없으면 합성 페이지 세트)"""
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                pages.append(f.read())
+        return pages
+
+    return [make_search_page(layout=layout, seed=seed)
+            for seed, layout in enumerate(['pc', 'pc', 'pc', 'mobile'])]
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+def reference_results(pages):
+    """기준 결과: html.parser 전체 문서 파싱 (구간 파싱 끔)"""
+    region_only = search_extractor.PARSE_REGION_ONLY
+    search_extractor.PARSE_REGION_ONLY = False
+    try:
+        return [ProductExtractor.extract_products_from_html(html, parser='html.parser') for html in pages]
+    finally:
+        search_extractor.PARSE_REGION_ONLY = region_only
+
+
+def bench_parser(pages, parser, rounds):
+    """파서 백엔드 1개 측정
+
+    Returns:
+        tuple: (pages_per_sec, 결과 리스트, 페이지당 평균 건너뛴 크기)
+    """
+    results = []
+    skipped = 0
+    for html in pages:
+        stats = {}
+        results.append(ProductExtractor.extract_products_from_html(html, parser=parser, stats=stats))
+        skipped += stats.get('bytes_skipped', 0)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html in pages:
+            ProductExtractor.extract_products_from_html(html, parser=parser)
+    elapsed = time.perf_counter() - start
+
+    return (len(pages) * rounds) / elapsed, results, skipped / len(pages)
+
+
+def _per_link_cards(product_list):
+    """링크마다 find_parent + select 쿼리로 카드 필드 조회 (인덱스 이전 방식)"""
+    cards = []
+    for link in product_list.select('a[href*="/products/"]'):
+        product_card = link.find_parent('li') or link.find_parent('div')
+        cards.append(_soup_card_index(product_card) if product_card else None)
+    return cards
+
+
+def run_cards(card_counts, rounds):
+    """카드 인덱스 측정: 카드 수별 페이지당 ms (파싱 제외, html.parser 트리)"""
+    print("=" * 60)
+    print(f"카드 인덱스 vs 링크별 쿼리 (html.parser 트리, 파싱 제외) x {rounds}회")
+    print("=" * 60)
+
+    mismatched = False
+    for n_cards in card_counts:
+        html = make_search_page(n_ranking=n_cards, n_ads=max(1, n_cards // 8), filler_kb=0)
+        soup = BeautifulSoup(html, 'html.parser')
+        product_list = soup.select_one('#productList, #product-list')
+
+        timings = {}
+        for name, fn in (('per-link', _per_link_cards),
+                         ('index', lambda root: [card for _, card in _soup_index_list(root)])):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                cards = fn(product_list)
+            timings[name] = (time.perf_counter() - start) / rounds * 1000
+            timings[name + '_cards'] = cards
+
+        same = timings['per-link_cards'] == timings['index_cards']
+        mismatched |= not same
+        print(f"  {n_cards:4d}장  per-link {timings['per-link']:7.1f}ms  index {timings['index']:6.1f}ms  "
+              f"x{timings['per-link'] / timings['index']:5.1f}  [{'OK' if same else '불일치'}]")
+
+    return 1 if mismatched else 0
+
+
+def _fetch_to_extract(content, parser, decode):
+    """fetch_page 추출 경로 1회 (decode=True: 기존처럼 전체 디코딩 후 str 전달)"""
+    html = content.decode('utf-8', errors='replace') if decode else content
+    stream = ProductExtractor.iter_ranking_products(html, parser=parser)
+    return sum(1 for _ in stream)
+
+
+def _run_pipeline_once(contents, parser, parallel, decode):
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        return list(executor.map(lambda content: _fetch_to_extract(content, parser, decode), contents))
+
+
+def run_pipeline(pages, parsers, parallel, rounds):
+    """응답 bytes → 추출 경로 측정: 페이지당 CPU ms, 최대 메모리 (P개 스레드 동시 실행)"""
+    # 동시에 처리 중인 페이지가 P개 이상 되도록 페이지 세트 반복
+    contents = [html.encode('utf-8') for html in pages] * max(1, parallel * 2 // len(pages))
+
+    print("=" * 60)
+    print(f"fetch → 추출 경로: {len(contents)}페이지, 스레드 {parallel}개 x {rounds}회")
+    print("=" * 60)
+
+    mismatched = False
+    for parser in parsers:
+        timings = {}
+        for mode, decode in (('text', True), ('bytes', False)):
+            counts = _run_pipeline_once(contents, parser, parallel, decode)
+
+            start_cpu = time.process_time()
+            for _ in range(rounds):
+                _run_pipeline_once(contents, parser, parallel, decode)
+            cpu_ms = (time.process_time() - start_cpu) / (rounds * len(contents)) * 1000
+
+            tracemalloc.start()
+            _run_pipeline_once(contents, parser, parallel, decode)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            timings[mode] = (cpu_ms, peak, counts)
+
+        same = timings['text'][2] == timings['bytes'][2]
+        mismatched |= not same
+        (text_cpu, text_peak, _), (bytes_cpu, bytes_peak, _) = timings['text'], timings['bytes']
+        print(f"  {parser:12s} CPU {text_cpu:6.2f} → {bytes_cpu:6.2f}ms/page  "
+              f"peak {text_peak / 1024 / 1024:6.1f} → {bytes_peak / 1024 / 1024:6.1f}MB  "
+              f"[{'OK' if same else '불일치'}]")
+
+    return 1 if mismatched else 0
+
+
+def _legacy_search_meta(html):
+    """기존 extract_search_meta (필드별 정규식 + __NEXT_DATA__ 전체 json.loads, 비교 기준)"""
+    result = {'searchId': '', 'totalProductCount': 0, 'buildId': '', 'listSize': 36}
+
+    match = re.search(r'searchId=([^&"\s<>]+)', html)
+    if match:
+        result['searchId'] = match.group(1)
+    else:
+        match = re.search(r'"searchId"\s*:\s*"([^"]+)"', html)
+        if match:
+            result['searchId'] = match.group(1)
+
+    match = re.search(r'itemsCount[":=]+(\d+)', html)
+    if match:
+        result['listSize'] = int(match.group(1))
+
+    match = re.search(r'"totalProductCount"\s*:\s*(\d+)', html)
+    if match:
+        result['totalProductCount'] = int(match.group(1))
+    else:
+        product_links = re.findall(r'/vp/products/\d+', html)
+        if product_links:
+            result['totalProductCount'] = len(set(product_links))
+
+    match = re.search(r'<script id="__NEXT_DATA__"[^>]*>([^<]+)</script>', html)
+    if match:
+        try:
+            next_data = json.loads(match.group(1))
+            result['buildId'] = next_data.get('buildId', '')
+            page_props = next_data.get('props', {}).get('pageProps', {})
+            if 'listSize' in page_props:
+                result['listSize'] = page_props['listSize']
+        except (json.JSONDecodeError, KeyError):
+            pass
+
+    return result
+
+
+def run_meta(pages, rounds):
+    """메타 추출 측정: 페이지당 ms (기존 방식 vs 현재)"""
+    if not pages:
+        pages = [make_search_page(layout=layout, seed=seed, next_data_kb=kb)
+                 for seed, (layout, kb) in enumerate([('pc', 100), ('pc', 300), ('pc', 600), ('mobile', 0)])]
+
+    print("=" * 60)
+    print(f"메타 추출 벤치마크: {len(pages)}페이지 x {rounds}회")
+    print("=" * 60)
+
+    mismatched = 0
+    for i, html in enumerate(pages):
+        timings = {}
+        for name, fn in (('legacy', _legacy_search_meta), ('scanner', extract_search_meta)):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                fn(html)
+            timings[name] = (time.perf_counter() - start) / rounds * 1000
+        same = _legacy_search_meta(html) == extract_search_meta(html)
+        mismatched += not same
+        print(f"  #{i} {len(html.encode('utf-8')) / 1024:5.0f}KB  legacy {timings['legacy']:6.2f}ms  "
+              f"scanner {timings['scanner']:6.2f}ms  x{timings['legacy'] / timings['scanner']:4.1f}  "
+              f"[{'OK' if same else '불일치'}]")
+
+    return 1 if mismatched else 0
+
+
+def run_verify(pages, sample, parsers=None, seed=0):
+    """파서 백엔드 차분 검증 (페이지 샘플, html.parser 기준)"""
+    rng = random.Random(seed)
+    indexes = [i for i in range(len(pages)) if rng.random() < sample]
+    sampled = [pages[i] for i in indexes]
+    parsers = [p for p in (parsers or available_parsers()) if p != 'html.parser']
+
+    print("=" * 60)
+    print(f"파서 검증 (html.parser 기준): {len(sampled)}/{len(pages)}페이지 샘플")
+    print("=" * 60)
+    mismatches = 0
+    for parser in parsers:
+        report = verify_parser_backend(sampled, parser)
+        mismatches += report['mismatches']
+        fallback = f"  폴백 (구조 불일치): {report['fallbacks']}" if parser == 'scan' else ''
+        print(f"  {parser:12s} 결과 불일치: {report['mismatches']}{fallback}")
+        for idx in report['mismatched']:
+            print(f"    - 페이지 #{indexes[idx]}")
+
+    return 1 if mismatches else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검색 추출기 벤치마크')
+    parser.add_argument('pages', nargs='*', help='검색 페이지 HTML 파일 (없으면 합성 페이지)')
+    parser.add_argument('--rounds', '-r', type=int, default=10, help='반복 횟수')
+    parser.add_argument('--parsers', nargs='+', default=None, help='측정할 파서 백엔드')
+    parser.add_argument('--verify', action='store_true', help='scan/lxml/selectolax vs html.parser 불일치 검사')
+    parser.add_argument('--sample', type=float, default=1.0, help='--verify 샘플 비율 (0.0~1.0)')
+    parser.add_argument('--cards', type=int, nargs='+', default=None,
+                        help='카드 인덱스 측정 (페이지당 카드 수 목록)')
+    parser.add_argument('--meta', action='store_true', help='메타 추출(extract_search_meta) 측정')
+    parser.add_argument('--pipeline', type=int, default=None, metavar='P',
+                        help='응답 bytes → 추출 경로 측정 (스레드 수)')
+    args = parser.parse_args()
+
+    if args.cards:
+        return run_cards(args.cards, args.rounds)
+    if args.meta:
+        return run_meta(load_pages(args.pages) if args.pages else [], args.rounds)
+
+    pages = load_pages(args.pages)
+    if args.pipeline:
+        return run_pipeline(pages, args.parsers or available_parsers(), args.pipeline, args.rounds)
+    if args.verify:
+        return run_verify(pages, args.sample, args.parsers)
+    parsers = args.parsers or available_parsers()
+    total_kb = sum(len(p.encode('utf-8')) for p in pages) / 1024
+
+    print("=" * 60)
+    print(f"검색 추출기 벤치마크: {len(pages)}페이지 ({total_kb:.0f}KB) x {args.rounds}회")
+    print("=" * 60)
+
+    reference = reference_results(pages)
+    baseline_pps = None
+    mismatched = False
+
+    for name in ['html.parser'] + [p for p in parsers if p != 'html.parser']:
+        pps, results, skipped = bench_parser(pages, name, args.rounds)
+
+        if baseline_pps is None:
+            baseline_pps = pps
+        diff = sum(1 for a, b in zip(reference, results) if a != b)
+        if diff:
+            mismatched = True
+        status = 'OK' if not diff else f'불일치 {diff}페이지'
+
+        print(f"  {name:12s} {pps:8.1f} pages/sec  x{pps / baseline_pps:5.2f}  "
+              f"skip {skipped / 1024:6.1f}KB/page  [{status}]")
+
+    return 1 if mismatched else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+상품 레코드 벤치마크
+
+- 상품 1,000개당 메모리: 기존 dict(문자열 ID) vs Product(__slots__, 정수 ID)
+- 매칭 비용: 기존 문자열 비교 _match_product vs 정규화 ID 비교 (타겟 없는 페이지 = 전체 비교)
+
+사용법:
+  python3 bench_product.py
+  python3 bench_product.py -n 5000 -r 20
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
+
+from extractor.product import Product, to_id
+from work.search import _match_product
+
+
+def _legacy_match_product(product, target_product_id, target_item_id=None, target_vendor_item_id=None):
+    """기존 문자열 비교 매칭 (비교 기준)"""
+    p_id = str(product.get('productId', ''))
+    i_id = str(product.get('itemId', ''))
+    v_id = str(product.get('vendorItemId', ''))
+
+    t_p_id = str(target_product_id) if target_product_id else ''
+    t_i_id = str(target_item_id) if target_item_id else ''
+    t_v_id = str(target_vendor_item_id) if target_vendor_item_id else ''
+
+    if t_p_id and t_i_id and t_v_id:
+        if p_id == t_p_id and i_id == t_i_id and v_id == t_v_id:
+            return (True, 'full_match')
+    if t_p_id and t_v_id:
+        if p_id == t_p_id and v_id == t_v_id:
+            return (True, 'product_vendor')
+    if t_p_id and t_i_id:
+        if p_id == t_p_id and i_id == t_i_id:
+            return (True, 'product_item')
+    if t_p_id and p_id == t_p_id:
+        return (True, 'product_only')
+    if t_v_id and v_id == t_v_id:
+        return (True, 'vendor_only')
+    if t_i_id and i_id == t_i_id:
+        return (True, 'item_only')
+    return (False, None)
+
+
+def make_fields(n, seed=0):
+    """검색 페이지 상품과 같은 형태의 필드 목록 (ID는 문자열)"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        product_id = str(rng.randrange(10**9, 10**10))
+        item_id = str(rng.randrange(10**10, 10**11))
+        vendor_item_id = str(rng.randrange(10**10, 10**11))
+        rows.append((product_id, item_id, vendor_item_id,
+                     f"/vp/products/{product_id}?itemId={item_id}&vendorItemId={vendor_item_id}&rank={i % 72 + 1}",
+                     i % 72 + 1, f"테스트 상품 {i}", f"{rng.randrange(5, 900) * 100:,}원",
+                     rng.randrange(30, 51) / 10, rng.randrange(1, 50000)))
+    return rows
+
+
+def build_dicts(rows):
+    return [{
+        'productId': product_id,
+        'itemId': item_id,
+        'vendorItemId': vendor_item_id,
+        'uniqueKey': f"{product_id}_{item_id}_{vendor_item_id}",
+        'name': name,
+        'price': price,
+        'url': url,
+        'rank': rank,
+        'rating': rating,
+        'review_count': review_count,
+        '_page': 1,
+    } for product_id, item_id, vendor_item_id, url, rank, name, price, rating, review_count in rows]
+
+
+def build_products(rows):
+    products = []
+    for product_id, item_id, vendor_item_id, url, rank, name, price, rating, review_count in rows:
+        product = Product(product_id, item_id, vendor_item_id, url, rank, name, price, rating, review_count)
+        product['_page'] = 1
+        products.append(product)
+    return products
+
+
+def measure_memory(build, rows):
+    """레코드 생성으로 늘어난 메모리 (필드 값 문자열 원본은 제외)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = build(rows)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before), records
+
+
+def measure_match(records, match, target, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for record in records:
+            match(record, *target)
+    return (time.perf_counter() - start) / (rounds * len(records)) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description='상품 레코드 벤치마크')
+    parser.add_argument('-n', type=int, default=1000, help='상품 수')
+    parser.add_argument('--rounds', '-r', type=int, default=10, help='매칭 반복 횟수')
+    args = parser.parse_args()
+
+    rows = make_fields(args.n)
+    dict_bytes, dicts = measure_memory(build_dicts, rows)
+    product_bytes, products = measure_memory(build_products, rows)
+
+    print("=" * 60)
+    print(f"상품 레코드 벤치마크: {args.n}개")
+    print("=" * 60)
+    per_k = 1000 / args.n
+    print(f"  메모리 (1,000개당)  dict {dict_bytes * per_k / 1024:7.1f}KB   "
+          f"Product {product_bytes * per_k / 1024:7.1f}KB   x{dict_bytes / product_bytes:4.2f}")
+
+    # 타겟이 없는 페이지: 모든 상품에 대해 전체 우선순위 비교
+    # (search_product는 타겟 ID를 한 번 정규화해서 넘김)
+    target = ('1', '2', '3')
+    normalized = tuple(to_id(t) for t in target)
+    legacy_ns = measure_match(dicts, _legacy_match_product, target, args.rounds)
+    dict_ns = measure_match(dicts, _match_product, normalized, args.rounds)
+    product_ns = measure_match(products, _match_product, normalized, args.rounds)
+    print(f"  매칭 (상품당)       기존 dict {legacy_ns:6.0f}ns   "
+          f"dict {dict_ns:6.0f}ns   Product {product_ns:6.0f}ns   x{legacy_ns / product_ns:4.2f}")
+
+    # 결과 호환성: 같은 타겟에 같은 매칭 결과
+    rng = random.Random(1)
+    mismatched = 0
+    for _ in range(200):
+        source = rng.choice(dicts)
+        target = (source['productId'], rng.choice([None, source['itemId'], '1']),
+                  rng.choice([None, source['vendorItemId'], '1']))
+        for d, p in zip(dicts, products):
+            if _legacy_match_product(d, *target) != _match_product(p, *target):
+                mismatched += 1
+    print(f"  매칭 결과 불일치: {mismatched}")
+    return 1 if mismatched else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,9 +7,19 @@
 import time
 import random
 
-from common.proxy import get_bound_cookie, report_cookie_result
+from common.proxy import get_bound_cookie, report_cookie_result, COOKIE_LOCK_SECONDS
 from common.fingerprint import get_tls_profile
+from common.deadline import Deadline
 from work.search import search_product
+from work.history import get_history
+from work.tiers import observe_search
+
+# 순위 체크 1건 전체 예산 (쿠키 할당 + 검색, 초)
+CHECK_TIMEOUT = 30
+
+# 검색 예산 (초, 쿠키 락 안에서 결과 보고까지 끝나도록 여유를 둠)
+SEARCH_TIMEOUT = 20
+COOKIE_REPORT_MARGIN = 3
 
 
 def _error_result(start_time: float, code: str, message: str, detail: str = None,
@@ -76,20 +86,26 @@ def _success_result(start_time: float, found: bool, rank: int, page: int,
 
 
 def check_rank(keyword: str, product_id: str, item_id: str = None,
-               vendor_item_id: str = None, max_page: int = 13) -> dict:
+               vendor_item_id: str = None, max_page: int = 13,
+               timeout: float = CHECK_TIMEOUT) -> dict:
     """순위 체크 실행
 
+    마감 시간(Deadline)을 쿠키 할당 → 검색 Tier → 재시도 → 각 요청까지 전달
+    (요청 타임아웃은 남은 시간으로 줄어듦, 결과 보고는 마감과 무관하게 실행)
+
     Args:
         keyword: 검색어
         product_id: 상품 ID
         item_id: 아이템 ID (선택)
         vendor_item_id: 벤더 아이템 ID (선택)
         max_page: 최대 검색 페이지 (1-20)
+        timeout: 전체 예산 (초, 기본 CHECK_TIMEOUT)
 
     Returns:
         dict: 순위 체크 결과
     """
     start_time = time.time()
+    deadline = Deadline(timeout)
 
     # 입력값 검증
     if not keyword or not str(keyword).strip():
@@ -103,9 +119,13 @@ def check_rank(keyword: str, product_id: str, item_id: str = None,
     try:
         # 1. 쿠키+프록시 할당 (동일 상품 클릭한 쿠키 제외)
         bound = get_bound_cookie(max_age_minutes=120, platform_type='mobile',
-                                 exclude_product=product_id, verbose=False)
+                                 exclude_product=product_id, verbose=False, deadline=deadline)
         if not bound:
-            return _error_result(start_time, 'NO_COOKIE', 'No available cookies')
+            return _error_result(start_time, 'NO_COOKIE', 'No available cookies',
+                                 detail='DEADLINE_EXCEEDED' if deadline.expired else None)
+
+        # 검색 마감: 쿠키 락은 할당 시점부터 흐르므로 할당 직후에 잡음 (결과 보고 여유 포함, 전체 마감 이내)
+        search_deadline = deadline.within(min(SEARCH_TIMEOUT, COOKIE_LOCK_SECONDS - COOKIE_REPORT_MARGIN))
 
         proxy = bound['proxy']
         proxy_host = bound.get('proxy_host', '')
@@ -160,11 +180,14 @@ def check_rank(keyword: str, product_id: str, item_id: str = None,
         profile_id = tls_profile['profile_id']
         debug_info['profile_id'] = profile_id
 
-        # 4. 검색 실행
+        # 4. 검색 실행 (할당 시점 기준 검색 마감, 순위 이력이 있으면 마지막 발견 페이지 근처부터)
+        history = get_history()
+        hint_page = history.hint_page(keyword, product_id) if history else None
         result = search_product(
             keyword, product_id, cookies, tls_profile, proxy,
             target_item_id=item_id, target_vendor_item_id=vendor_item_id,
-            max_page=max_page, verbose=False, save_html=False
+            max_page=max_page, verbose=False, save_html=False,
+            total_timeout=SEARCH_TIMEOUT, deadline=search_deadline, hint_page=hint_page
         )
 
         found = result['found']
@@ -178,6 +201,15 @@ def check_rank(keyword: str, product_id: str, item_id: str = None,
         is_success = not blocked
         report_cookie_result(cookie_record['id'], is_success)
 
+        # 순위 이력/Tier 학습 기록 (차단은 결과가 불완전하므로 제외)
+        if not blocked:
+            found_page = found['page'] if found else None
+            pages_needed = found_page or pages_searched
+            observe_search(found_page, pages_needed)
+            if history:
+                history.record(keyword, product_id, page=found_page,
+                               rank=result['actual_rank'] if found else None, pages_needed=pages_needed)
+
         # 6. 결과 반환
         if blocked:
             error_detail = result.get('block_error', '')
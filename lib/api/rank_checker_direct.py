@@ -14,6 +14,7 @@ from urllib.parse import quote
 from curl_cffi import requests
 
 from api.cp_signature import generate_x_cp_s
+from extractor.product import Product, product_ids, to_id
 
 # Chrome 143 Mobile TLS 핑거프린트
 TLS_CONFIG = {
@@ -222,31 +223,32 @@ def _extract_products(rdata):
         if not product_id:
             continue
 
-        products.append({
-            'productId': str(product_id),
-            'itemId': str(mandatory.get('itemId', '')),
-            'vendorItemId': str(mandatory.get('vendorItemId', '')),
-            'title': display.get('title', ''),
-            'price': display.get('price', ''),
-            'discountRate': display.get('discountRate', ''),
-            'rating': display.get('rating', ''),
-            'ratingCount': display.get('ratingCount', ''),
-            'rocket': display.get('rocket', False),
-            'rocketWow': display.get('rocketWow', False),
-            'isAd': mandatory.get('isAds', False),
-        })
+        products.append(Product(
+            product_id, mandatory.get('itemId', ''), mandatory.get('vendorItemId', ''),
+            price=display.get('price', ''),
+            rating=display.get('rating', ''),
+            extra={
+                'title': display.get('title', ''),
+                'discountRate': display.get('discountRate', ''),
+                'ratingCount': display.get('ratingCount', ''),
+                'rocket': display.get('rocket', False),
+                'rocketWow': display.get('rocketWow', False),
+                'isAd': mandatory.get('isAds', False),
+            }
+        ))
     return products
 
 
 def _match_product(product, target_product_id, target_item_id=None, target_vendor_item_id=None):
     """상품 매칭"""
-    p_id = str(product.get('productId', ''))
-    i_id = str(product.get('itemId', ''))
-    v_id = str(product.get('vendorItemId', ''))
+    if type(product) is Product:
+        p_id, i_id, v_id = product.product_id, product.item_id, product.vendor_item_id
+    else:
+        p_id, i_id, v_id = product_ids(product)
 
-    t_p_id = str(target_product_id) if target_product_id else ''
-    t_i_id = str(target_item_id) if target_item_id else ''
-    t_v_id = str(target_vendor_item_id) if target_vendor_item_id else ''
+    t_p_id = to_id(target_product_id)
+    t_i_id = to_id(target_item_id)
+    t_v_id = to_id(target_vendor_item_id)
 
     if t_p_id and t_i_id and t_v_id:
         if p_id == t_p_id and i_id == t_i_id and v_id == t_v_id:
@@ -341,7 +343,7 @@ def check_rank(keyword: str, product_id: str, item_id: str = None,
             page_counts[pages] = len(page_products)
 
             for p in page_products:
-                key = f"{p['productId']}_{p['itemId']}"
+                key = (p.product_id, p.item_id)
                 if key not in all_products:
                     p['rank'] = len(all_products) + 1
                     all_products[key] = p
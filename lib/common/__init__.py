@@ -3,7 +3,9 @@
 
 - fingerprint: TLS 핑거프린트 관리 (JSON 기반)
 - proxy: 프록시 API + 쿠키 바인딩
-- cookie: 쿠키 유틸리티
+- cookie: 쿠키 유틸리티, 검색용 쿠키 저장소 (CookieJar)
+- cache: LRU 캐시 (선택적 TTL), 응답 본문 해시
+- deadline: 마감 시간 (요청 타임아웃/재시도 대기를 남은 시간으로 제한)
 
 Note: DB 의존성 없음
 """
@@ -13,17 +15,24 @@ from .fingerprint import (
     build_tls_extra_fp,
     build_tls_headers,
     get_tls_platform_for_match_type,
+    get_profile_platform,
     list_tls_profiles
 )
 from .proxy import get_proxy_list, get_bound_cookie, report_cookie_result
-from .cookie import get_subnet, parse_cookie_data
+from .cookie import get_subnet, parse_cookie_data, CookieJar
+from .cache import LRUCache, content_hash
+from .deadline import Deadline, DeadlineExceeded
 
 __all__ = [
     # fingerprint
     'get_tls_profile', 'build_tls_extra_fp', 'build_tls_headers',
-    'get_tls_platform_for_match_type', 'list_tls_profiles',
+    'get_tls_platform_for_match_type', 'get_profile_platform', 'list_tls_profiles',
     # proxy
     'get_proxy_list', 'get_bound_cookie', 'report_cookie_result',
     # cookie
-    'get_subnet', 'parse_cookie_data',
+    'get_subnet', 'parse_cookie_data', 'CookieJar',
+    # cache
+    'LRUCache', 'content_hash',
+    # deadline
+    'Deadline', 'DeadlineExceeded',
 ]
@@ -0,0 +1,134 @@
+"""
+캐시 유틸리티 모듈
+- 크기 제한 LRU 캐시 (워커 스레드 공유, 선택적 TTL, 적중률/축출/만료 통계)
+- 응답 본문 해시 (캐시 키)
+
+Note: DB 의존성 없음, 순수 유틸리티만 제공
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+def content_hash(data):
+    """응답 본문 해시 (캐시 키용)
+
+    SHA-1 (SHA 가속 명령을 쓰는 CPU에서 blake2b/md5보다 빠름, 보안 용도 아님)
+
+    Args:
+        data: bytes, memoryview 또는 str (str은 UTF-8로 인코딩)
+
+    Returns:
+        bytes: 20바이트 digest
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha1(data, usedforsecurity=False).digest()
+
+
+class LRUCache:
+    """크기 제한 LRU 캐시 (스레드 안전)
+
+    가장 오래 사용하지 않은 항목부터 축출. ttl 지정 시 저장 후 ttl초가 지난 항목은
+    조회에서 만료 처리 (미적중). 값은 그대로 저장/반환하므로
+    호출 측에서 공유 값을 수정하지 않아야 함 (필요하면 복사본 사용).
+
+    사용법:
+        cache = LRUCache(256)            # 또는 LRUCache(256, ttl=300)
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.put(key, value)
+        cache.stats()  # {size, capacity, ttl, hits, misses, evictions, expired, hit_rate}
+    """
+
+    def __init__(self, capacity, ttl=None):
+        """
+        Args:
+            capacity: 최대 항목 수 (0이면 저장 안함)
+            ttl: 항목 유효 시간 (초, None/0이면 만료 없음)
+        """
+        self.capacity = max(0, int(capacity))
+        self.ttl = ttl or None
+        self._data = OrderedDict()  # key → (value, 만료 시각 또는 None)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expired = 0
+
+    def get(self, key, default=None):
+        """조회 (적중 시 최근 사용으로 이동, 만료 항목은 삭제 후 미적중)"""
+        with self._lock:
+            try:
+                value, expires = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                self._expired += 1
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key, value):
+        """저장 (용량 초과 시 가장 오래된 항목 축출, ttl이 있으면 지금부터 ttl초 유효)"""
+        if not self.capacity:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def resize(self, capacity):
+        """용량 변경 (줄어들면 오래된 항목부터 축출)"""
+        with self._lock:
+            self.capacity = max(0, int(capacity))
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def set_ttl(self, ttl):
+        """유효 시간 변경 (이후 저장하는 항목부터 적용, None/0이면 만료 없음)"""
+        with self._lock:
+            self.ttl = ttl or None
+
+    def clear(self):
+        """항목 및 통계 초기화"""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = self._expired = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and (entry[1] is None or entry[1] > time.monotonic())
+
+    def stats(self):
+        """통계 스냅샷
+
+        Returns:
+            dict: {size, capacity, ttl, hits, misses, evictions, expired, hit_rate}
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._data),
+                'capacity': self.capacity,
+                'ttl': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expired': self._expired,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+            }
@@ -2,11 +2,17 @@
 쿠키 유틸리티 모듈
 - IP 서브넷 추출
 - 쿠키 데이터 파싱
+- 검색용 쿠키 저장소 (CookieJar, 동시 페이지 요청 간 공유)
 
 Note: DB 의존성 없음, 순수 유틸리티 함수만 제공
 """
 
 import json
+import threading
+from collections import OrderedDict
+
+# CookieJar 응답 쿠키 최대 개수 ((name, domain, path) 기준, 초과 시 오래된 것부터 제거)
+COOKIE_JAR_MAX = 100
 
 
 def get_subnet(ip):
@@ -49,3 +55,87 @@ def parse_cookie_data(cookie_record):
         if c.get('domain', '').endswith('coupang.com'):
             cookies[c['name']] = c['value']
     return cookies
+
+
+class CookieJar:
+    """검색 한 건의 쿠키 저장소 (스레드 안전)
+
+    - 읽기: snapshot()은 변경되지 않는 {name: value} dict 반환 (쓰기마다 새 dict로 교체, copy-on-write)
+      → 요청 스레드는 락 없이 읽고, 다른 페이지 응답 반영과 경합하지 않음
+    - 쓰기: Set-Cookie를 (name, domain, path) 기준으로 병합 (마지막 쓰기 우선, 중복 저장 없음)
+    - 응답 쿠키는 최대 max_cookies개 (오래 갱신되지 않은 것부터 제거)
+
+    사용법:
+        jar = CookieJar(cookies)                        # 쿠키 레코드의 {name: value}
+        make_request(url, jar.snapshot(), ...)
+        jar.update(response_cookies_full)               # [{name, value, domain, path, ...}]
+        jar.response_cookies()                          # 응답으로 받은 {name: value}
+    """
+
+    __slots__ = ('_base', '_entries', '_snapshot', '_lock', 'max_cookies')
+
+    def __init__(self, cookies=None, max_cookies=None):
+        """
+        Args:
+            cookies: 초기 쿠키 {name: value} (복사해서 보관)
+            max_cookies: 응답 쿠키 최대 개수 (기본 COOKIE_JAR_MAX)
+        """
+        self._base = dict(cookies or {})
+        self._entries = OrderedDict()  # (name, domain, path) → 쿠키 dict (갱신 순서)
+        self._snapshot = self._base
+        self._lock = threading.Lock()
+        self.max_cookies = max_cookies or COOKIE_JAR_MAX
+
+    def snapshot(self):
+        """요청용 쿠키 {name: value} (읽기 전용으로 사용, 수정 금지)"""
+        return self._snapshot
+
+    def update(self, cookies_full):
+        """응답 Set-Cookie 병합
+
+        Args:
+            cookies_full: [{name, value, domain, path, ...}] (parse_response_cookies 두 번째 값)
+
+        Returns:
+            bool: 요청 쿠키 변경 여부
+        """
+        if not cookies_full:
+            return False
+        with self._lock:
+            entries = self._entries
+            snapshot = None
+            evicted = False
+            for cookie in cookies_full:
+                key = (cookie['name'], cookie.get('domain', ''), cookie.get('path', '/'))
+                entries.pop(key, None)
+                entries[key] = cookie  # 속성(expires 등)은 최신으로, 순서는 맨 뒤로
+                if (snapshot or self._snapshot).get(cookie['name']) == cookie['value']:
+                    continue  # 같은 값 재전송 (요청 쿠키 변경 없음)
+                if snapshot is None:
+                    snapshot = dict(self._snapshot)
+                snapshot[cookie['name']] = cookie['value']
+            while len(entries) > self.max_cookies:
+                entries.popitem(last=False)
+                evicted = True
+            if evicted:
+                # 제거된 쿠키가 요청 쿠키에 남지 않도록 다시 구성 (초기 쿠키 + 갱신 순서)
+                snapshot = dict(self._base)
+                for (name, _, _), cookie in entries.items():
+                    snapshot[name] = cookie['value']
+            if snapshot is None:
+                return False
+            self._snapshot = snapshot
+            return True
+
+    def response_cookies(self):
+        """응답으로 받은 쿠키 {name: value} (마지막 쓰기 우선)"""
+        with self._lock:
+            return {name: cookie['value'] for (name, _, _), cookie in self._entries.items()}
+
+    def response_cookies_full(self):
+        """응답으로 받은 쿠키 전체 속성 목록 ((name, domain, path)별 1개, 갱신 순서)"""
+        with self._lock:
+            return list(self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,80 @@
+"""
+마감 시간 (deadline) 유틸리티
+
+순위 체크 한 건의 전체 시간 예산을 호출 체인(쿠키 할당 → Tier → 재시도 → 요청)에 전달:
+- 요청 타임아웃은 고정값 대신 남은 시간으로 줄임 (timeout)
+- 재시도 대기도 남은 시간 안에서만 (sleep)
+- 하위 단계 예산은 상위 마감을 넘지 않음 (within)
+
+Note: time.monotonic 기준 (시스템 시각 변경 영향 없음)
+"""
+
+import time
+
+
+class DeadlineExceeded(Exception):
+    """마감 시간 초과"""
+
+
+class Deadline:
+    """마감 시간 (불변, 스레드 간 공유 가능)
+
+    사용법:
+        deadline = Deadline(30)
+        search_deadline = deadline.within(20)     # 최대 20초, 전체 마감 이내
+        timeout = deadline.timeout(5)              # min(5, 남은 시간), 초과 시 DeadlineExceeded
+        deadline.sleep(0.5)                        # 남은 시간 안에서만 대기
+    """
+
+    __slots__ = ('started_at', 'expires_at')
+
+    def __init__(self, seconds, _started_at=None):
+        """
+        Args:
+            seconds: 지금부터의 시간 예산 (초)
+        """
+        now = time.monotonic()
+        self.started_at = now if _started_at is None else _started_at
+        self.expires_at = now + max(0.0, seconds)
+
+    def within(self, seconds):
+        """하위 단계 마감: 지금부터 seconds 후와 현재 마감 중 빠른 쪽
+
+        Returns:
+            Deadline: 새 마감 (시작 시각은 유지)
+        """
+        child = Deadline(seconds, _started_at=self.started_at)
+        child.expires_at = min(child.expires_at, self.expires_at)
+        return child
+
+    def remaining(self):
+        """남은 시간 (초, 0 이상)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def elapsed(self):
+        """시작 후 경과 시간 (초)"""
+        return time.monotonic() - self.started_at
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+    def timeout(self, cap):
+        """요청 타임아웃: min(cap, 남은 시간)
+
+        Raises:
+            DeadlineExceeded: 남은 시간 없음
+        """
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f'DEADLINE_EXCEEDED ({self.elapsed():.1f}s)')
+        return min(cap, remaining)
+
+    def sleep(self, seconds):
+        """남은 시간 안에서만 대기
+
+        Returns:
+            bool: 대기 후에도 시간이 남았는지
+        """
+        time.sleep(min(seconds, self.remaining()))
+        return not self.expired
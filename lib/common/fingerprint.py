@@ -34,7 +34,7 @@ def get_tls_profile(platform=None, excluded_builds=None):
         excluded_builds: 제외할 chrome_version 목록 (예: ['142.0.0.0'])
 
     Returns:
-        dict: TLS 프로필 레코드 또는 None
+        dict: TLS 프로필 레코드 (platform: 'pc'/'mobile' 포함) 또는 None
     """
     data = _load_profiles()
     excluded_builds = set(excluded_builds or [])
@@ -45,12 +45,12 @@ def get_tls_profile(platform=None, excluded_builds=None):
     if platform in ('pc', None):
         for profile_id, profile in data.get('pc', {}).items():
             if profile.get('chrome_version_full') not in excluded_builds:
-                candidates.append({'profile_id': profile_id, **profile})
+                candidates.append({'profile_id': profile_id, 'platform': 'pc', **profile})
 
     if platform in ('mobile', None):
         for profile_id, profile in data.get('mobile', {}).items():
             if profile.get('chrome_version_full') not in excluded_builds:
-                candidates.append({'profile_id': profile_id, **profile})
+                candidates.append({'profile_id': profile_id, 'platform': 'mobile', **profile})
 
     if not candidates:
         return None
@@ -114,6 +114,23 @@ def build_tls_headers(profile, referer=None):
     return headers
 
 
+def get_profile_platform(profile):
+    """TLS 프로필의 플랫폼
+
+    Args:
+        profile: TLS 프로필 레코드 (platform 필드가 없는 레코드는 sec-ch-ua-mobile로 판단)
+
+    Returns:
+        str: 'pc', 'mobile' 또는 None (프로필 없음)
+    """
+    if not profile:
+        return None
+    platform = profile.get('platform')
+    if platform:
+        return platform
+    return 'mobile' if profile.get('sec_ch_ua_mobile') == '?1' else 'pc'
+
+
 def get_tls_platform_for_match_type(match_type, user_platform=None):
     """match_type에 따라 TLS 플랫폼 결정
 
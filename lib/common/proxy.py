@@ -10,6 +10,7 @@ import random
 import time
 import urllib.request
 from .cookie import get_subnet, parse_cookie_data
+from .deadline import DeadlineExceeded
 
 # API 설정
 PROXY_API_URL = 'http://mkt.techb.kr:3001/api/proxy/status'
@@ -18,6 +19,9 @@ COOKIE_API_URL = 'http://mkt.techb.kr:5151/api/cookies'
 # API 타임아웃 설정
 API_TIMEOUT = 15  # 타임아웃 15초
 
+# 쿠키 할당 락 (할당 후 이 시간 안에 결과 보고)
+COOKIE_LOCK_SECONDS = 30
+
 
 def get_proxy_list(min_remain=30):
     """프록시 API에서 사용 가능한 프록시 목록 조회
@@ -87,8 +91,8 @@ def check_external_ip(proxy_url):
 
 
 def allocate_cookie(minutes=60, platform_type='mobile', max_fail=5, max_success=10,
-                    exclude_product=None, retries=3):
-    """쿠키 API에서 쿠키+프록시 할당 (30초 락)
+                    exclude_product=None, retries=3, deadline=None):
+    """쿠키 API에서 쿠키+프록시 할당 (COOKIE_LOCK_SECONDS 락)
 
     Args:
         minutes: created_at 기준 N분 이내
@@ -97,6 +101,7 @@ def allocate_cookie(minutes=60, platform_type='mobile', max_fail=5, max_success=
         max_success: success_count 최대값
         exclude_product: 제외할 product_id (해당 상품을 클릭한 쿠키 제외)
         retries: 최대 재시도 횟수
+        deadline: Deadline (선택, API 타임아웃/백오프를 남은 시간으로 제한, 초과 시 None)
 
     Returns:
         dict: 쿠키+프록시 레코드 또는 None
@@ -119,7 +124,8 @@ def allocate_cookie(minutes=60, platform_type='mobile', max_fail=5, max_success=
 
     for attempt in range(retries):
         try:
-            req = urllib.request.urlopen(url, timeout=API_TIMEOUT)
+            timeout = deadline.timeout(API_TIMEOUT) if deadline is not None else API_TIMEOUT
+            req = urllib.request.urlopen(url, timeout=timeout)
             resp = json.loads(req.read())
             if resp.get('success'):
                 cookie = resp.get('data')
@@ -138,9 +144,15 @@ def allocate_cookie(minutes=60, platform_type='mobile', max_fail=5, max_success=
                             cookie['age_minutes'] = 0
                     return cookie
             return None  # success=false, 재시도 없이 종료
+        except DeadlineExceeded:
+            return None
         except Exception as e:
             if attempt < retries - 1:
-                time.sleep(0.5 * (attempt + 1))  # 백오프: 0.5, 1, 1.5초
+                # 백오프: 0.5, 1, 1.5초 (마감 시간 이내로만)
+                if deadline is None:
+                    time.sleep(0.5 * (attempt + 1))
+                elif not deadline.sleep(0.5 * (attempt + 1)):
+                    return None
                 continue
             # 최종 실패 - 조용히 처리
             return None
@@ -170,7 +182,8 @@ def report_cookie_result(cookie_id, success, retries=2):
             # 최종 실패 - 조용히 처리
 
 
-def get_bound_cookie(max_age_minutes=60, platform_type='mobile', exclude_product=None, verbose=True):
+def get_bound_cookie(max_age_minutes=60, platform_type='mobile', exclude_product=None, verbose=True,
+                     deadline=None):
     """쿠키+프록시 조합 반환 (Cookie API가 프록시 매칭까지 처리)
 
     Args:
@@ -178,6 +191,7 @@ def get_bound_cookie(max_age_minutes=60, platform_type='mobile', exclude_product
         platform_type: 'pc' (exact/subnet만) 또는 'mobile' (random 폴백 가능)
         exclude_product: 제외할 product_id (해당 상품을 클릭한 쿠키 제외)
         verbose: 디버그 정보 출력
+        deadline: Deadline (선택, 쿠키 할당 API 호출에 적용)
 
     Returns:
         dict: {
@@ -191,7 +205,7 @@ def get_bound_cookie(max_age_minutes=60, platform_type='mobile', exclude_product
     """
     # Cookie API에서 쿠키+프록시 할당 (매칭까지 API가 처리)
     cookie_record = allocate_cookie(minutes=max_age_minutes, platform_type=platform_type,
-                                    exclude_product=exclude_product)
+                                    exclude_product=exclude_product, deadline=deadline)
     if not cookie_record:
         if verbose:
             print(f"  ⚠️ 쿠키 할당 실패 (max_age: {max_age_minutes}분, type: {platform_type})")
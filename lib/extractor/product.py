@@ -0,0 +1,291 @@
+"""
+상품 레코드
+
+검색 추출기(search_extractor, scan_extractor), 검색 모듈(work.search),
+순위 체크(api.rank_checker, api.rank_checker_direct)가 공통으로 쓰는 상품 타입.
+
+- __slots__ 기반 (상품당 dict 대비 메모리 절감)
+- productId/itemId/vendorItemId는 정수로 보관 (숫자가 아닌 값은 문자열 그대로)
+- uniqueKey는 생성 시 한 번 계산
+- 기존 dict 접근(product['productId'], product.get('rating'), product['_page'] = 1 등)은
+  그대로 동작하고 ID는 기존처럼 문자열로 반환
+- 표시 필드(name/price/rating/review_count)는 카드 노드만 들고 있다가 처음 접근할 때 계산 가능
+"""
+
+# 값 없음 표시 (None과 구분: rating=None은 "평점 없음")
+_UNSET = object()
+
+# dict 키 → 속성
+_KEY_ATTRS = {
+    'productId': 'product_id',
+    'itemId': 'item_id',
+    'vendorItemId': 'vendor_item_id',
+    'uniqueKey': 'unique_key',
+    'name': 'name',
+    'price': 'price',
+    'url': 'url',
+    'rank': 'rank',
+    'rating': 'rating',
+    'review_count': 'review_count',
+    '_page': 'source_page',
+    'page': 'page',
+    'actual_rank': 'actual_rank',
+}
+
+# 기본 키 (항상 있음) / 선택 키 (설정한 경우만)
+_BASE_KEYS = ('productId', 'itemId', 'vendorItemId', 'uniqueKey', 'name', 'price', 'url', 'rank', 'rating', 'review_count')
+_OPTIONAL_KEYS = ('_page', 'page', 'actual_rank')
+_ID_KEYS = frozenset(('productId', 'itemId', 'vendorItemId'))
+
+
+def to_id(value):
+    """ID 정규화: 숫자 문자열/정수 → int, 그 외 문자열은 그대로, 빈 값 → None
+
+    '0123'처럼 정수로 바꾸면 원래 문자열이 복원되지 않는 값은 문자열로 유지.
+    """
+    if type(value) is int:
+        return value
+    if value is None or value == '':
+        return None
+    text = str(value)
+    if text.isdigit() and text.isascii() and (text[0] != '0' or text == '0'):
+        return int(text)
+    return text
+
+
+def id_text(value):
+    """정규화된 ID → 기존 문자열 표현 (None → '')"""
+    return '' if value is None else str(value)
+
+
+def product_ids(product):
+    """상품의 (product_id, item_id, vendor_item_id) 정규화 ID (Product 또는 기존 dict)"""
+    if type(product) is Product:
+        return product.product_id, product.item_id, product.vendor_item_id
+    return (to_id(product.get('productId')), to_id(product.get('itemId')),
+            to_id(product.get('vendorItemId')))
+
+
+class Product:
+    """상품 레코드 (dict 호환 접근 지원)
+
+    Attributes:
+        product_id, item_id, vendor_item_id: 정규화 ID (to_id)
+        unique_key: 'productId_itemId_vendorItemId'
+        url, rank: 상품 링크, 페이지 내 rank 파라미터
+        name, price, rating, review_count: 표시 필드 (지연 계산 가능)
+        source_page: 상품이 나온 검색 페이지 (dict 키 '_page')
+        page, actual_rank: 발견 페이지, 전체 순위 (검색 모듈이 설정)
+        extra: 파이프라인별 추가 필드 (title, discountRate 등) 또는 None
+    """
+
+    __slots__ = (
+        'product_id', 'item_id', 'vendor_item_id', 'unique_key', 'url', 'rank',
+        '_name', '_price', '_rating', '_review_count', '_source',
+        'source_page', 'page', 'actual_rank', 'extra',
+    )
+
+    def __init__(self, product_id, item_id=None, vendor_item_id=None, url='', rank=None,
+                 name='', price='', rating=None, review_count=None, extra=None):
+        self.product_id = to_id(product_id)
+        self.item_id = to_id(item_id)
+        self.vendor_item_id = to_id(vendor_item_id)
+        self.unique_key = f"{id_text(self.product_id)}_{id_text(self.item_id)}_{id_text(self.vendor_item_id)}"
+        self.url = url
+        self.rank = rank
+        self._name = name
+        self._price = price
+        self._rating = rating
+        self._review_count = review_count
+        self._source = None
+        self.source_page = _UNSET
+        self.page = _UNSET
+        self.actual_rank = _UNSET
+        self.extra = extra
+
+    @classmethod
+    def lazy(cls, product_id, item_id, vendor_item_id, url, rank, fields):
+        """표시 필드를 처음 접근할 때 계산하는 상품
+
+        Args:
+            fields: () -> (name, price, rating, review_count) 계산 함수
+                    (계산 전까지 페이지 DOM 노드를 참조)
+        """
+        product = cls(product_id, item_id, vendor_item_id, url, rank)
+        product._source = fields
+        return product
+
+    @classmethod
+    def from_dict(cls, data):
+        """기존 상품 dict → Product (알 수 없는 키는 extra)"""
+        product = cls(data.get('productId'), data.get('itemId'), data.get('vendorItemId'),
+                      data.get('url', ''), data.get('rank'),
+                      data.get('name', ''), data.get('price', ''),
+                      data.get('rating'), data.get('review_count'))
+        for key, value in data.items():
+            if key not in _KEY_ATTRS or key in _OPTIONAL_KEYS:
+                product[key] = value
+        return product
+
+    # ------------------------------------------------------------------
+    # 표시 필드 (지연 계산)
+    # ------------------------------------------------------------------
+
+    def materialize(self):
+        """표시 필드 계산 (DOM 참조 해제)"""
+        if self._source is not None:
+            fields = self._source
+            self._source = None
+            self._name, self._price, self._rating, self._review_count = fields()
+        return self
+
+    @property
+    def name(self):
+        if self._source is not None:
+            self.materialize()
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self.materialize()
+        self._name = value
+
+    @property
+    def price(self):
+        if self._source is not None:
+            self.materialize()
+        return self._price
+
+    @price.setter
+    def price(self, value):
+        self.materialize()
+        self._price = value
+
+    @property
+    def rating(self):
+        if self._source is not None:
+            self.materialize()
+        return self._rating
+
+    @rating.setter
+    def rating(self, value):
+        self.materialize()
+        self._rating = value
+
+    @property
+    def review_count(self):
+        if self._source is not None:
+            self.materialize()
+        return self._review_count
+
+    @review_count.setter
+    def review_count(self, value):
+        self.materialize()
+        self._review_count = value
+
+    # ------------------------------------------------------------------
+    # dict 호환 접근
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        attr = _KEY_ATTRS.get(key)
+        if attr is None:
+            if self.extra is not None and key in self.extra:
+                return self.extra[key]
+            raise KeyError(key)
+        value = getattr(self, attr)
+        if value is _UNSET:
+            raise KeyError(key)
+        if key in _ID_KEYS:
+            return id_text(value)
+        return value
+
+    def __setitem__(self, key, value):
+        attr = _KEY_ATTRS.get(key)
+        if attr is None:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+        elif key in _ID_KEYS:
+            setattr(self, attr, to_id(value))
+            self.unique_key = f"{id_text(self.product_id)}_{id_text(self.item_id)}_{id_text(self.vendor_item_id)}"
+        else:
+            setattr(self, attr, value)
+
+    def __delitem__(self, key):
+        if key in _OPTIONAL_KEYS and getattr(self, _KEY_ATTRS[key]) is not _UNSET:
+            setattr(self, _KEY_ATTRS[key], _UNSET)
+        elif key not in _KEY_ATTRS and self.extra is not None and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        if key in _OPTIONAL_KEYS:
+            return getattr(self, _KEY_ATTRS[key]) is not _UNSET
+        if key in _KEY_ATTRS:
+            return True
+        return self.extra is not None and key in self.extra
+
+    def keys(self):
+        keys = list(_BASE_KEYS)
+        keys.extend(key for key in _OPTIONAL_KEYS if getattr(self, _KEY_ATTRS[key]) is not _UNSET)
+        if self.extra:
+            keys.extend(self.extra)
+        return keys
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def clone(self):
+        """같은 내용의 새 Product (표시 필드 확정, extra는 얕은 복사)"""
+        self.materialize()
+        product = Product.__new__(Product)
+        for slot in self.__slots__:
+            setattr(product, slot, getattr(self, slot))
+        if self.extra is not None:
+            product.extra = dict(self.extra)
+        return product
+
+    def to_dict(self):
+        """기존 상품 dict 형태 (json 직렬화용)"""
+        return dict(self.items())
+
+    copy = to_dict
+
+    def __eq__(self, other):
+        if isinstance(other, Product):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Product({self.to_dict()!r})"
+
+    def __getstate__(self):
+        self.materialize()
+        return {slot: getattr(self, slot) for slot in self.__slots__
+                if getattr(self, slot) is not _UNSET}
+
+    def __setstate__(self, state):
+        self.source_page = self.page = self.actual_rank = _UNSET
+        for slot, value in state.items():
+            setattr(self, slot, value)
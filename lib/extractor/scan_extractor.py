@@ -0,0 +1,419 @@
+"""
+Scan Extractor (Python)
+- DOM 없이 검색 페이지를 한 번 훑어서 상품 목록 추출 (fast path)
+- 결과는 ProductExtractor(html.parser)와 동일한 {ranking, ads, total}
+- 페이지 구조가 예상과 다르면 None 반환 → 호출 측에서 BeautifulSoup으로 폴백
+
+동작 방식:
+1. #productList / #product-list 시작 태그 위치 탐색
+2. 그 지점부터 태그 토큰만 순서대로 스캔 (열린 태그 스택만 유지, 트리 미생성)
+   - html.parser + BeautifulSoup 규칙 그대로: 종료 태그는 가장 가까운 같은 태그까지 pop,
+     void 태그(img, br 등)는 자식 없음, script/style 내용은 텍스트 아님
+3. 카드(li, 없으면 div)별로 AdMark / name / price / rating / count 첫 요소를 기록
+4. 리스트 종료 태그에서 멈추고 링크 순서대로 상품 생성
+"""
+
+import re
+from html import unescape
+
+from extractor.product import Product
+
+
+# 상품 리스트 컨테이너 id 속성 (data-id 등 제외)
+# id 값은 대소문자 구분 (BeautifulSoup #productList 선택자와 동일), 속성명은 구분 안함
+_LIST_IDS = ('productList', 'product-list')
+_LIST_ID_RE = re.compile(
+    r'''(?<![\w-])[iI][dD]\s*=\s*(?:"(?:productList|product-list)"|'(?:productList|product-list)'|(?:productList|product-list)(?=[\s/>]))'''
+)
+
+# 토큰: 주석 | script/style 블록 (1: 태그, 2: 속성, 3: 내용) | 선언/처리명령
+#       | 시작/종료 태그 (4: '/', 5: 태그, 6: 속성)
+_TOKEN_RE = re.compile(
+    r'''<!--.*?-->'''
+    r'''|<(script|style)\b((?:[^>"']|"[^"]*"|'[^']*')*)>(.*?)</\1\s*>'''
+    r'''|<[!?][^>]*>'''
+    r'''|<(/?)([a-zA-Z][^\s/>]*)((?:[^>"']|"[^"]*"|'[^']*')*)>''',
+    re.S | re.I
+)
+
+_ATTR_RE = re.compile(
+    r'''(?:^|\s)(class|href)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''',
+    re.I
+)
+
+# BeautifulSoup(html.parser)이 빈 요소로 취급하는 태그
+_VOID_TAGS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link',
+    'menuitem', 'meta', 'param', 'source', 'track', 'wbr', 'basefont', 'bgsound',
+    'command', 'frame', 'image', 'isindex', 'nextid', 'spacer',
+))
+
+# 문자열 컨테이너: 안쪽 문자열은 별도 타입(Script, Stylesheet, TemplateString 등)이 되어
+# 일반 요소의 get_text()에서는 빠지고, 컨테이너 요소 자신의 get_text()에만 포함됨
+_STRING_CONTAINER_TAGS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+
+
+class _Capture:
+    """요소 텍스트 수집 (BeautifulSoup get_text(strip=True)와 동일)
+
+    kind: 이 요소가 수집하는 문자열 타입 (컨테이너 태그명 또는 None = 일반 문자열)
+    """
+    __slots__ = ('parts', 'kind')
+
+    def __init__(self, kind=None):
+        self.parts = []
+        self.kind = kind
+
+    def text(self):
+        return ''.join(self.parts)
+
+
+def _attrs(attr_text):
+    """class, href 속성 추출 (중복 시 마지막 값, html.parser와 동일하게 unescape)"""
+    attrs = {}
+    for m in _ATTR_RE.finditer(attr_text):
+        value = m.group(2)
+        if value is None:
+            value = m.group(3)
+        if value is None:
+            value = m.group(4)
+        attrs[m.group(1).lower()] = unescape(value)
+    return attrs
+
+
+def class_fields(class_attr):
+    """class 속성이 매칭되는 카드 필드 목록 (search_extractor의 DOM 백엔드 카드 파싱과 공용)
+
+    name/price는 '.name' → '[class*="name"]' 순서로 찾으므로 두 슬롯으로 나눔
+    (rating/count는 '.rating, [class*="rating"]'처럼 합집합이라 한 슬롯)
+    """
+    if not class_attr:
+        return ()
+    fields = []
+    if 'AdMark' in class_attr:
+        fields.append('ad')
+    if 'name' in class_attr:
+        if 'name' in class_attr.split():
+            fields.append('name_tok')
+        fields.append('name_sub')
+    if 'price' in class_attr:
+        if 'price-value' in class_attr.split():
+            fields.append('price_tok')
+        fields.append('price_sub')
+    if 'rating' in class_attr:
+        fields.append('rating')
+    if 'count' in class_attr:
+        fields.append('count')
+    return fields
+
+
+def _iter_list_ids(html):
+    """리스트 id 속성 매치 (문서 순서)
+
+    정규식으로 문서 전체를 훑는 대신 id 값 리터럴을 str.find로 찾고 그 앞의 id= 부분만 확인
+    """
+    positions = []
+    for list_id in _LIST_IDS:
+        pos = html.find(list_id)
+        while pos >= 0:
+            positions.append(pos)
+            pos = html.find(list_id, pos + 1)
+
+    for pos in sorted(positions):
+        # 값 앞의 따옴표/공백/'=' 건너뛰고 속성명 'id' 위치 계산
+        k = pos
+        if k > 0 and html[k - 1] in '"\'':
+            k -= 1
+        while k > 0 and html[k - 1].isspace():
+            k -= 1
+        if k == 0 or html[k - 1] != '=':
+            continue
+        k -= 1
+        while k > 0 and html[k - 1].isspace():
+            k -= 1
+        m = _LIST_ID_RE.match(html, k - 2) if k >= 2 else None
+        if m:
+            yield m
+
+
+def _find_list_start(html):
+    """상품 리스트 시작 태그 매치 (없으면 None, 판단 불가면 False)"""
+    for m in _iter_list_ids(html):
+        pos = m.start()
+        tag_start = html.rfind('<', 0, pos)
+        if tag_start < 0:
+            continue
+        # script/주석 안의 문자열은 제외
+        if html.rfind('<script', 0, pos) > html.rfind('</script', 0, pos):
+            continue
+        if html.rfind('<!--', 0, pos) > html.rfind('-->', 0, pos):
+            continue
+        tag = _TOKEN_RE.match(html, tag_start)
+        if not tag or tag.group(5) is None or tag.group(4) or tag.end() <= pos:
+            return False
+        return tag
+    return None
+
+
+# 리스트 종료 태그 탐색용 (루트 태그명별 캐시): 주석/script/style 블록은 건너뜀
+_REGION_END_RE = {}
+
+
+def _region_end_re(root_name):
+    pattern = _REGION_END_RE.get(root_name)
+    if pattern is None:
+        pattern = re.compile(
+            r'''<!--.*?-->'''
+            r'''|<(script|style)\b(?:[^>"']|"[^"]*"|'[^']*')*>.*?</\1\s*>'''
+            r'''|<(/?)''' + re.escape(root_name) + r'''\b((?:[^>"']|"[^"]*"|'[^']*')*)>''',
+            re.S | re.I
+        )
+        _REGION_END_RE[root_name] = pattern
+    return pattern
+
+
+def find_product_list_region(html):
+    """상품 리스트(#productList, #product-list) 요소의 위치
+
+    리스트 시작 태그부터 같은 이름 태그의 깊이를 세어 짝이 맞는 종료 태그까지.
+    DOM 파서는 이 구간만 파싱하면 됨 (나머지 헤더/스크립트/푸터는 토큰화 불필요)
+
+    Args:
+        html: 검색 페이지 HTML
+
+    Returns:
+        tuple: (start, end) 슬라이스 인덱스 또는 None (리스트 없음/종료 태그 없음)
+    """
+    start = _find_list_start(html)
+    if not start:
+        return None
+
+    root_name = start.group(5).lower()
+    if root_name in _VOID_TAGS or start.group(6).endswith('/'):
+        return None
+
+    depth = 1
+    for m in _region_end_re(root_name).finditer(html, start.end()):
+        slash = m.group(2)
+        if slash is None:
+            continue  # 주석, script/style 블록
+        if slash:
+            depth -= 1
+            if depth == 0:
+                return start.start(), m.end()
+        elif not m.group(3).endswith('/'):
+            depth += 1
+    return None
+
+
+def product_list_unclosed(html):
+    """상품 리스트 시작 태그는 있는데 짝이 맞는 종료 태그가 없는지 (잘린 응답 판단용)
+
+    Args:
+        html: 검색 페이지 HTML (bytes는 latin-1로 옮긴 str)
+
+    Returns:
+        bool: 리스트가 열린 채 끝나면 True (리스트 없음/판단 불가면 False)
+    """
+    start = _find_list_start(html)
+    if not start or start.group(5).lower() in _VOID_TAGS or start.group(6).endswith('/'):
+        return False
+    return find_product_list_region(html) is None
+
+
+def scan_products(html, region=None):
+    """검색 페이지 HTML을 스캔해서 상품 목록 추출
+
+    Args:
+        html: 검색 페이지 HTML
+        region: dict를 넘기면 스캔한 리스트 구간 {start, end}을 기록
+
+    Returns:
+        dict: {ranking, ads, total} 또는 None (구조 불일치 → DOM 파서로 폴백 필요)
+    """
+    # 순환 import 방지 (search_extractor가 이 모듈을 import)
+    from extractor.search_extractor import _parse_product_href, _parse_rating, _parse_review_count
+
+    start = _find_list_start(html)
+    if start is None:
+        if 'productList' in html or 'product-list' in html:
+            return None
+        return {'ranking': [], 'ads': [], 'total': 0}
+    if start is False:
+        return None
+
+    root_name = start.group(5).lower()
+    if root_name in _VOID_TAGS:
+        return None
+    if region is not None:
+        region['start'] = start.start()
+
+    # 스택 항목: [tag, card 필드 dict 또는 None, capture 또는 None]
+    stack = [[root_name, {} if root_name in ('li', 'div') else None, None]]
+    captures = []          # 현재 열린 capture 목록
+    containers = []        # 열린 문자열 컨테이너 태그 (가장 안쪽이 문자열 타입 결정)
+    links = []             # (href, card, link capture)
+    pos = start.end()
+    length = len(html)
+
+    while stack:
+        m = _TOKEN_RE.search(html, pos)
+        end = m.start() if m else length
+
+        # 텍스트 노드
+        if end > pos and captures:
+            _add_text(captures, containers[-1] if containers else None, unescape(html[pos:end]))
+
+        if not m:
+            # 리스트가 닫히지 않음 (html.parser는 문서 끝에서 닫지만 판단 보류)
+            return None
+        pos = m.end()
+
+        if m.group(1):
+            # script/style 블록 - 내용(escape 안됨)은 블록 자신의 get_text()에만 포함
+            tag = m.group(1).lower()
+            cap = _mark_fields(stack, _attrs(m.group(2)).get('class', ''), tag)
+            _add_text(captures + [cap] if cap else captures, tag, m.group(3))
+            continue
+
+        name = m.group(5)
+        if name is None:
+            continue  # 주석, doctype 등
+        name = name.lower()
+
+        if m.group(4):
+            # 종료 태그: 가장 가까운 같은 태그까지 pop
+            for idx in range(len(stack) - 1, -1, -1):
+                if stack[idx][0] == name:
+                    break
+            else:
+                # 리스트 바깥 태그의 종료 → 판단 불가
+                return None
+            while len(stack) > idx:
+                tag, _, cap = stack.pop()
+                if cap is not None:
+                    captures.remove(cap)
+                if tag in _STRING_CONTAINER_TAGS:
+                    containers.pop()
+            continue
+
+        attr_text = m.group(6)
+        self_closing = attr_text.endswith('/')
+        attrs = _attrs(attr_text) if attr_text else {}
+        cap = _mark_fields(stack, attrs.get('class', ''), name)
+
+        if name == 'a':
+            href = attrs.get('href', '')
+            if '/products/' in href:
+                card = None
+                for entry in reversed(stack):
+                    if entry[0] == 'li':
+                        card = entry
+                        break
+                if card is None:
+                    # 리스트 안에 li가 없으면 바깥 li를 찾아야 함 → 판단 불가
+                    return None
+                if card[1] is None:
+                    card[1] = {}
+                if cap is None:
+                    cap = _Capture(_string_kind(name))
+                links.append((href, card[1], cap))
+
+        if name in _VOID_TAGS or self_closing:
+            continue
+
+        if cap is not None:
+            captures.append(cap)
+        if name in _STRING_CONTAINER_TAGS:
+            containers.append(name)
+        stack.append([name, {} if name in ('li', 'div') else None, cap])
+
+    if region is not None:
+        region['end'] = pos
+
+    ranking_products = {}
+    ad_products = {}
+
+    for href, card, link_cap in links:
+        parsed = _parse_product_href(href)
+        if not parsed:
+            continue
+
+        product_id, item_id, vendor_item_id, has_rank, rank = parsed
+
+        has_ad_mark = 'ad' in card
+        name_cap = card.get('name_tok') or card.get('name_sub') or link_cap
+        price_cap = card.get('price_tok') or card.get('price_sub')
+        rating_cap = card.get('rating')
+        count_cap = card.get('count')
+
+        product_data = Product(
+            product_id, item_id, vendor_item_id, href, rank,
+            name_cap.text(),
+            price_cap.text() if price_cap else '',
+            _parse_rating(rating_cap.text()) if rating_cap else None,
+            _parse_review_count(count_cap.text()) if count_cap else None
+        )
+        unique_key = product_data.unique_key
+
+        if has_rank and rank is not None and not has_ad_mark:
+            if unique_key not in ranking_products:
+                ranking_products[unique_key] = product_data
+        else:
+            if unique_key not in ad_products:
+                ad_products[unique_key] = product_data
+
+    return {
+        'ranking': list(ranking_products.values()),
+        'ads': list(ad_products.values()),
+        'total': len(ranking_products) + len(ad_products)
+    }
+
+
+def _mark_fields(stack, class_attr, name):
+    """새 요소가 매칭되는 필드를 조상 카드(li/div)에 기록
+
+    각 카드는 필드별로 문서 순서상 첫 하위 요소만 가짐 (select_one과 동일).
+    이미 필드가 있는 조상을 만나면 그 위 조상들도 이미 있으므로 중단.
+
+    Returns:
+        _Capture: 텍스트 수집이 필요한 경우 (name/price/rating/count로 선택됨)
+    """
+    fields = class_fields(class_attr)
+    if not fields:
+        return None
+
+    cap = None
+    for field in fields:
+        for idx in range(len(stack) - 1, -1, -1):
+            entry = stack[idx]
+            if entry[0] != 'li' and entry[0] != 'div':
+                continue
+            card = entry[1]
+            if card is None:
+                card = entry[1] = {}
+            if field in card:
+                break
+            if field == 'ad':
+                card[field] = True
+            else:
+                if cap is None:
+                    cap = _Capture(_string_kind(name))
+                card[field] = cap
+
+    return cap
+
+
+def _string_kind(tag):
+    """요소가 get_text()로 수집하는 문자열 타입"""
+    return tag if tag in _STRING_CONTAINER_TAGS else None
+
+
+def _add_text(captures, kind, text):
+    """텍스트 노드를 같은 문자열 타입을 수집하는 열린 capture에 추가"""
+    text = text.strip()
+    if not text:
+        return
+    for cap in captures:
+        if cap.kind == kind:
+            cap.parts.append(text)
@@ -3,19 +3,157 @@ Product Extractor (Python)
 - Coupang search result page product extraction
 - Ranking products vs ads separation
 - 3-part unique key (product_id + item_id + vendor_item_id)
+- Products as dicts (extract_products_from_html) or Product objects
+  (extract_products, iter_ranking_products)
 - LJC 이벤트용 메타 정보 추출 (searchId, buildId 등)
 """
 
+import os
 import re
 import json
+import random
+import threading
+from datetime import datetime
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, parse_qs
 
+from extractor.product import Product
+from extractor.scan_extractor import scan_products, find_product_list_region, class_fields
+
+# 선택적 파서 백엔드 (미설치 시 html.parser만 사용)
+try:
+    import lxml  # noqa: F401  (BeautifulSoup 'lxml' 트리빌더)
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 
 # ============================================================================
 # LJC 이벤트용 추출 함수
 # ============================================================================
 
+# 메타 스캐너 패턴
+# CPython re는 리터럴 접두어 검색만 빠르므로 (문자 집합/대안 분기로 시작하는 패턴은
+# 문자마다 분기 시도) 필드별 리터럴 접두어 패턴을 미리 컴파일해 각각 한 번만 탐색.
+# searchId는 URL 파라미터/JSON 형식을 한 패턴으로 찾음 (URL 형식이 나오면 중단)
+_SEARCH_ID_RE = re.compile(r'searchId(?:=([^&"\s<>]+)|(?<="searchId)"\s*:\s*"([^"]+)")')
+_ITEMS_COUNT_RE = re.compile(r'itemsCount[":=]+(\d+)')
+_TOTAL_COUNT_RE = re.compile(r'"totalProductCount"\s*:\s*(\d+)')
+_NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>')
+_BUILD_ID_KEY_RE = re.compile(r'"buildId"\s*:\s*')
+_JSON_TOKEN_RE = re.compile(r'"((?:[^"\\]|\\.)*)"(\s*:\s*)?|[{}\[\]]')
+_JSON_DECODER = json.JSONDecoder()
+_MISSING = object()
+
+
+def _next_data_span(html):
+    """__NEXT_DATA__ 스크립트 본문 범위 (start, end) 또는 None
+
+    기존 패턴 <script id="__NEXT_DATA__"[^>]*>([^<]+)</script>와 같은 범위.
+    """
+    for match in _NEXT_DATA_RE.finditer(html):
+        start = match.end()
+        end = html.find('<', start)
+        if end > start and html.startswith('</script>', end):
+            return start, end
+    return None
+
+
+def _json_value(html, pos, end):
+    """pos 위치의 JSON 값 하나만 디코딩 (실패하거나 범위를 넘으면 _MISSING)"""
+    try:
+        value, value_end = _JSON_DECODER.raw_decode(html, pos)
+    except ValueError:
+        return _MISSING
+    return value if value_end <= end else _MISSING
+
+
+def _json_path_pos(html, pos, end, path):
+    """pos의 JSON 객체에서 키 경로(path)의 값 시작 위치 (없으면 -1)
+
+    객체를 앞에서부터 토큰 단위로 훑으며 각 단계의 최상위 키만 인정하고,
+    키를 찾으면 그 값으로 내려감 (찾은 뒤의 나머지는 보지 않음).
+    """
+    for key in path:
+        while pos < end and html[pos] in ' \t\r\n':
+            pos += 1
+        if not html.startswith('{', pos):
+            return -1
+        depth = 0
+        for match in _JSON_TOKEN_RE.finditer(html, pos, end):
+            token = match.group()
+            if token in ('{', '['):
+                depth += 1
+            elif token in ('}', ']'):
+                depth -= 1
+                if depth == 0:
+                    return -1
+            elif depth == 1 and match.group(2) is not None and match.group(1) == key:
+                pos = match.end()
+                break
+        else:
+            return -1
+    return pos
+
+
+def _json_depth(html, pos, end):
+    """pos 위치 토큰의 객체 깊이 (pos~end 사이에서 닫히는 괄호 수, 최상위 객체 안이면 1)"""
+    depth = lowest = 0
+    for match in _JSON_TOKEN_RE.finditer(html, pos, end):
+        token = match.group()
+        if token in ('{', '['):
+            depth += 1
+        elif token in ('}', ']'):
+            depth -= 1
+            lowest = min(lowest, depth)
+    return -lowest
+
+
+def _next_data_fields(html, start, end):
+    """__NEXT_DATA__ 본문에서 buildId, props.pageProps.listSize만 추출
+
+    본문 전체를 디코딩하지 않고 필요한 값만 디코딩:
+    - listSize: 최상위 → props → pageProps 순서로 깊이를 추적해 탐색
+      (Next.js는 props를 맨 앞에 직렬화하므로 앞부분만 훑음)
+    - buildId: 본문의 마지막 "buildId" 키가 최상위 키인지 확인 (Next.js는 props/page/query
+      뒤에 직렬화하므로 뒤쪽만 훑음). 최상위가 아니면 전체 디코딩으로 처리
+
+    Returns:
+        tuple: (buildId, listSize) 각각 없으면 _MISSING
+    """
+    build_id = list_size = _MISSING
+
+    # 잘린 본문 (json.loads 실패와 같게 처리)
+    last = end - 1
+    while last > start and html[last] in ' \t\r\n':
+        last -= 1
+    if html[last] != '}':
+        return build_id, list_size
+
+    pos = _json_path_pos(html, start, end, ('props', 'pageProps', 'listSize'))
+    if pos >= 0:
+        list_size = _json_value(html, pos, end)
+
+    key_pos = html.rfind('"buildId"', start, end)
+    if key_pos >= 0:
+        match = _BUILD_ID_KEY_RE.match(html, key_pos, end)
+        if match and _json_depth(html, key_pos, end) == 1:
+            build_id = _json_value(html, match.end(), end)
+        else:
+            try:
+                next_data = json.loads(html[start:end])
+                build_id = next_data.get('buildId', _MISSING)
+            except (json.JSONDecodeError, AttributeError):
+                pass
+
+    return build_id, list_size
+
+
 def extract_search_meta(html):
     """검색 HTML에서 메타 정보 추출
 
@@ -36,59 +174,78 @@ def extract_search_meta(html):
         'listSize': 36
     }
 
-    # searchId 추출 (URL 파라미터 형식 우선 - 모바일)
-    match = re.search(r'searchId=([^&"\s<>]+)', html)
-    if match:
-        result['searchId'] = match.group(1)
-    else:
-        # PC 형식 (JSON)
-        match = re.search(r'"searchId"\s*:\s*"([^"]+)"', html)
-        if match:
+    # searchId 추출 (URL 파라미터 형식 우선 - 모바일, 없으면 첫 JSON 형식 - PC)
+    json_search_id = ''
+    for match in _SEARCH_ID_RE.finditer(html):
+        if match.group(1):
             result['searchId'] = match.group(1)
+            break
+        if not json_search_id:
+            json_search_id = match.group(2)
+    else:
+        result['searchId'] = json_search_id
 
     # itemsCount 추출 (listSize 용도)
-    match = re.search(r'itemsCount[":=]+(\d+)', html)
+    match = _ITEMS_COUNT_RE.search(html)
     if match:
         result['listSize'] = int(match.group(1))
 
     # totalProductCount 추출 (PC)
-    match = re.search(r'"totalProductCount"\s*:\s*(\d+)', html)
+    match = _TOTAL_COUNT_RE.search(html)
     if match:
         result['totalProductCount'] = int(match.group(1))
     else:
         # 모바일: totalProductCount 없음 - 상품 링크 개수로 추정
-        product_links = re.findall(r'/vp/products/\d+', html)
-        if product_links:
-            unique_products = len(set(product_links))
-            result['totalProductCount'] = unique_products
+        result['totalProductCount'] = len(set(_PRODUCT_ID_RE.findall(html)))
 
-    # __NEXT_DATA__에서 buildId 추출 (PC)
-    match = re.search(r'<script id="__NEXT_DATA__"[^>]*>([^<]+)</script>', html)
-    if match:
-        try:
-            next_data = json.loads(match.group(1))
-            result['buildId'] = next_data.get('buildId', '')
-
-            props = next_data.get('props', {})
-            page_props = props.get('pageProps', {})
-            if 'listSize' in page_props:
-                result['listSize'] = page_props['listSize']
-        except (json.JSONDecodeError, KeyError):
-            pass
+    # __NEXT_DATA__에서 buildId, listSize 추출 (PC, 필요한 키만 디코딩)
+    span = _next_data_span(html)
+    if span:
+        build_id, list_size = _next_data_fields(html, *span)
+        result['buildId'] = '' if build_id is _MISSING else build_id
+        if list_size is not _MISSING:
+            result['listSize'] = list_size
 
     return result
 
 
-def extract_products_from_html(html):
+def extract_products_from_html(html, parser=None):
     """HTML에서 상품 목록 추출 (ProductExtractor.extract_products_from_html과 동일)
 
     Args:
         html: 검색 페이지 HTML
+        parser: 파서 백엔드 (None이면 DEFAULT_PARSER)
 
     Returns:
-        dict: {ranking: [...], ads: [...], total: int}
+        dict: {ranking: [...], ads: [...], total: int} (상품은 dict)
     """
-    return ProductExtractor.extract_products_from_html(html)
+    return ProductExtractor.extract_products_from_html(html, parser=parser)
+
+
+def extract_products(html, parser=None):
+    """HTML에서 상품 목록 추출, 상품은 Product 객체 (ProductExtractor.extract_products와 동일)
+
+    Args:
+        html: 검색 페이지 HTML
+        parser: 파서 백엔드 (None이면 DEFAULT_PARSER)
+
+    Returns:
+        dict: {ranking: [Product, ...], ads: [Product, ...], total: int}
+    """
+    return ProductExtractor.extract_products(html, parser=parser)
+
+
+def iter_ranking_products(html, parser=None):
+    """랭킹 상품을 페이지 순서대로 생성 (ProductExtractor.iter_ranking_products와 동일)
+
+    Args:
+        html: 검색 페이지 HTML
+        parser: 파서 백엔드 (None이면 DEFAULT_PARSER)
+
+    Returns:
+        ProductStream: 랭킹 상품 iterator (+ count_remaining())
+    """
+    return ProductExtractor.iter_ranking_products(html, parser=parser)
 
 
 def find_product_by_id(products, target_product_id):
@@ -123,6 +280,883 @@ def extract_filter_key(url):
     return parsed.query
 
 
+# ============================================================================
+# 파서 백엔드
+# ============================================================================
+# - html.parser: BeautifulSoup 기본 파서 (순수 Python, 기준 구현)
+# - lxml: BeautifulSoup + lxml 트리빌더 (C 파서, 이후 처리는 html.parser와 동일)
+# - selectolax: lexbor 엔진 (C 파서 + C 셀렉터, BeautifulSoup 미사용)
+# - scan: DOM 없이 태그 스캔 (scan_extractor.py), 구조 불일치 시 SCAN_FALLBACK_PARSER로 폴백
+#
+# html.parser가 기준 구현: 정상 검색 페이지에서는 {ranking, ads, total} 결과가 html.parser와 같음
+# (bench_extractor.py로 결과 비교 + pages/sec 측정, bench_extractor.py --verify로 차분 검증)
+#
+# lxml/selectolax는 HTML5 방식 오류 복구라 잘못된/특이한 마크업에서는 html.parser와 트리가 다름:
+# - <p> 암묵 종료: 블록 요소(<div> 등)가 열린 <p>를 닫음 (html.parser는 그대로 중첩)
+# - <textarea> 내용: 태그를 텍스트로 취급 ('<b>x</b>'가 이름에 그대로 들어감, html.parser는 태그로 파싱)
+# - 중첩 <a>: 안쪽 <a>가 바깥 <a>를 닫음 (카드/링크 연결이 달라질 수 있음)
+# - <template> (selectolax): 내용 텍스트 처리가 html.parser get_text()와 다름
+# 운영에서 lxml/selectolax/scan을 쓸 때는 set_scan_verification(work.py --scan-verify)으로
+# 페이지 일부를 html.parser 결과와 비교 (불일치 시 기준 결과 반환 + get_verify_stats 집계)
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax', 'scan')
+DEFAULT_PARSER = 'html.parser'
+
+# 상품 리스트 구간만 DOM 파싱 (찾지 못하면 전체 파싱, 기본 꺼짐 - set_region_parsing)
+# - 꺼져 있으면 DOM 백엔드는 bytes 본문 전체를 디코딩 (리스트 구간만 디코딩은 scan과 이 모드만)
+# - 구간은 리스트 루트 태그의 깊이로 자름: 리스트 안의 짝 없는 종료 태그(</div></span> 등)는
+#   전체 파싱에서는 리스트를 닫지만 구간 파싱에서는 무시되어 결과가 달라질 수 있음
+#   (html.parser 전체 문서 파싱이 기준 결과)
+PARSE_REGION_ONLY = False
+
+# scan 엔진 설정
+SCAN_FALLBACK_PARSER = 'html.parser'  # 구조 불일치 시 사용할 DOM 파서 (검증 기준 파서)
+SCAN_VERIFY_RATE = 0.0                # 검증 샘플링 비율 (0.0~1.0, scan/lxml/selectolax + 기준 파서 결과 비교)
+SCAN_MISMATCH_DIR = None              # 불일치 페이지 저장 경로 (None이면 저장 안함)
+
+# scan 엔진 통계 (워커 쓰레드 공유)
+_scan_stats = {'pages': 0, 'fallbacks': 0, 'verified': 0, 'mismatches': 0}
+_scan_stats_lock = threading.Lock()
+
+# 백엔드별 검증 통계 {parser: {verified, mismatches}} (_scan_stats_lock 사용)
+_verify_stats = {}
+
+# 구간 파싱 통계 (DOM 백엔드)
+_region_stats = {'pages': 0, 'region_pages': 0, 'full_pages': 0, 'bytes_total': 0, 'bytes_skipped': 0}
+_region_stats_lock = threading.Lock()
+
+
+class _RegionMismatch(Exception):
+    """구간 파싱 결과를 신뢰할 수 없음 (링크의 카드 li가 구간 밖) → 전체 파싱"""
+
+
+# BeautifulSoup get_text()가 제외하는 문자열 컨테이너 (Script, Stylesheet 등)
+_NON_TEXT_TAGS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+
+_PRODUCT_ID_RE = re.compile(r'/vp/products/(\d+)')
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+_REVIEW_COUNT_RE = re.compile(r'\(?([\d,]+)\)?')
+
+
+def available_parsers():
+    """현재 환경에서 사용 가능한 파서 백엔드 목록
+
+    Returns:
+        list: ['html.parser', 'lxml', 'selectolax', 'scan'] 중 설치된 것
+    """
+    parsers = ['html.parser']
+    if _HAS_LXML:
+        parsers.append('lxml')
+    if LexborHTMLParser is not None:
+        parsers.append('selectolax')
+    parsers.append('scan')
+    return parsers
+
+
+def set_default_parser(parser):
+    """기본 파서 백엔드 변경
+
+    Args:
+        parser: 'html.parser', 'lxml', 'selectolax', 'scan'
+
+    Raises:
+        ValueError: 알 수 없거나 설치되지 않은 백엔드
+    """
+    global DEFAULT_PARSER
+    _check_parser(parser)
+    DEFAULT_PARSER = parser
+
+
+def set_region_parsing(enabled):
+    """상품 리스트 구간 파싱 사용 여부 (DOM 백엔드)
+
+    Args:
+        enabled: True면 구간만 파싱 (잘못된 마크업에서 전체 파싱과 결과가 다를 수 있음)
+    """
+    global PARSE_REGION_ONLY
+    PARSE_REGION_ONLY = bool(enabled)
+
+
+def set_scan_verification(sample_rate, mismatch_dir=None):
+    """파서 검증 모드 설정 (scan, lxml, selectolax)
+
+    sample_rate 비율의 페이지는 선택한 백엔드 결과와 SCAN_FALLBACK_PARSER 결과를 모두 계산해서
+    비교하고 불일치 수를 get_verify_stats()에 누적 (scan은 get_scan_stats()에도, 반환값은 기준 파서 결과)
+
+    Args:
+        sample_rate: 0.0 (끔) ~ 1.0 (전체 페이지)
+        mismatch_dir: 불일치 페이지 HTML 저장 경로 (None이면 저장 안함)
+    """
+    global SCAN_VERIFY_RATE, SCAN_MISMATCH_DIR
+    SCAN_VERIFY_RATE = max(0.0, min(1.0, float(sample_rate)))
+    SCAN_MISMATCH_DIR = mismatch_dir
+
+
+def get_scan_stats():
+    """scan 엔진 통계 스냅샷
+
+    Returns:
+        dict: {pages, fallbacks, verified, mismatches}
+    """
+    with _scan_stats_lock:
+        return dict(_scan_stats)
+
+
+def get_verify_stats():
+    """백엔드별 검증 통계 스냅샷
+
+    Returns:
+        dict: {parser: {verified, mismatches}} (검증한 백엔드만)
+    """
+    with _scan_stats_lock:
+        return {parser: dict(stats) for parser, stats in _verify_stats.items()}
+
+
+def get_region_stats():
+    """구간 파싱 통계 스냅샷
+
+    Returns:
+        dict: {pages, region_pages, full_pages, bytes_total, bytes_skipped, avg_skipped}
+            - bytes_*: 입력 길이 기준 (str 입력이면 문자 수)
+            - avg_skipped: 페이지당 파싱을 건너뛴 평균 크기
+    """
+    with _region_stats_lock:
+        stats = dict(_region_stats)
+    stats['avg_skipped'] = stats['bytes_skipped'] / stats['pages'] if stats['pages'] else 0
+    return stats
+
+
+def _record_region(total, skipped, stats):
+    with _region_stats_lock:
+        _region_stats['pages'] += 1
+        _region_stats['region_pages' if skipped else 'full_pages'] += 1
+        _region_stats['bytes_total'] += total
+        _region_stats['bytes_skipped'] += skipped
+    if stats is not None:
+        stats['region'] = bool(skipped)
+        stats['bytes_total'] = total
+        stats['bytes_skipped'] = skipped
+
+
+def _count_scan_stat(key):
+    with _scan_stats_lock:
+        _scan_stats[key] += 1
+
+
+def _save_mismatch_page(html, parser='scan'):
+    """불일치 페이지 저장 (분석용)"""
+    if not SCAN_MISMATCH_DIR:
+        return
+    try:
+        os.makedirs(SCAN_MISMATCH_DIR, exist_ok=True)
+        filename = f"{parser}_mismatch_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.html"
+        with open(os.path.join(SCAN_MISMATCH_DIR, filename), 'w', encoding='utf-8') as f:
+            f.write(html)
+    except OSError:
+        pass
+
+
+def _decode(content, encoding):
+    """bytes 페이지 디코딩 (Response.text와 같게 잘못된 바이트는 치환)"""
+    if isinstance(content, str):
+        return content
+    try:
+        return str(content, encoding, 'replace')
+    except LookupError:
+        return str(content, 'utf-8', 'replace')
+
+
+def _region_text(content, encoding):
+    """상품 리스트 구간만 잘라낸 str
+
+    bytes 입력은 구간 위치만 찾고 그 구간만 디코딩 (페이지 전체 디코딩 없음).
+    latin-1은 바이트를 같은 번호의 문자로 옮기기만 하므로 찾은 위치가 곧 바이트 위치이고,
+    구간 탐색 패턴(태그/id)은 ASCII라 UTF-8 멀티바이트 문자 안에서는 매치되지 않음.
+
+    Returns:
+        tuple: (구간 str, 건너뛴 크기) 또는 None (구간 없음)
+    """
+    if isinstance(content, str):
+        region = find_product_list_region(content)
+        if not region:
+            return None
+        begin, end = region
+        return content[begin:end], len(content) - (end - begin)
+
+    region = find_product_list_region(str(content, 'latin-1'))
+    if not region:
+        return None
+    begin, end = region
+    return _decode(memoryview(content)[begin:end], encoding), len(content) - (end - begin)
+
+
+def _extract_scan(html, stats=None, encoding='utf-8'):
+    """scan 엔진 추출 (구조 불일치 시 DOM 파서 폴백, 샘플링 검증)"""
+    _count_scan_stat('pages')
+    total = len(html)
+
+    if isinstance(html, str):
+        region = {}
+        result = scan_products(html, region)
+        skipped = total - (region['end'] - region['start']) if 'end' in region else 0
+    else:
+        # bytes: 리스트 구간만 디코딩해서 스캔 (구간이 없으면 전체)
+        region = _region_text(html, encoding)
+        if region:
+            result = scan_products(region[0])
+            skipped = region[1]
+        else:
+            result = scan_products(_decode(html, encoding))
+            skipped = 0
+
+    if result is None:
+        _count_scan_stat('fallbacks')
+        return ProductExtractor.extract_products(html, parser=SCAN_FALLBACK_PARSER, stats=stats, encoding=encoding)
+
+    if stats is not None:
+        stats['region'] = True
+        stats['bytes_total'] = total
+        stats['bytes_skipped'] = skipped
+
+    if _verify_sampled('scan'):
+        _count_scan_stat('verified')
+        reference = _verify_result(html, result, 'scan', encoding)
+        if reference != result:
+            _count_scan_stat('mismatches')
+        return reference
+
+    return result
+
+
+def _verify_sampled(parser):
+    """이 페이지를 검증할지 (기준 파서 자신은 검증 안함)"""
+    return SCAN_VERIFY_RATE > 0 and parser != SCAN_FALLBACK_PARSER and random.random() < SCAN_VERIFY_RATE
+
+
+def _verify_result(html, result, parser, encoding='utf-8'):
+    """백엔드 결과를 기준 파서 결과와 비교 (통계 누적, 불일치 페이지 저장)
+
+    Returns:
+        dict: 기준 파서 결과
+    """
+    reference = ProductExtractor.extract_products(html, parser=SCAN_FALLBACK_PARSER, encoding=encoding)
+    mismatch = reference != result
+    with _scan_stats_lock:
+        stats = _verify_stats.setdefault(parser, {'verified': 0, 'mismatches': 0})
+        stats['verified'] += 1
+        stats['mismatches'] += mismatch
+    if mismatch:
+        _save_mismatch_page(_decode(html, encoding), parser)
+    return reference
+
+
+def verify_parser_backend(pages, parser='scan', reference=None):
+    """파서 백엔드와 기준 파서 결과 비교 (오프라인 검증)
+
+    Args:
+        pages: 검색 페이지 HTML 목록
+        parser: 검증할 백엔드 ('scan', 'lxml', 'selectolax')
+        reference: 비교 기준 파서 (None이면 SCAN_FALLBACK_PARSER)
+
+    Returns:
+        dict: {pages, fallbacks, mismatches, mismatched: [페이지 인덱스]} (fallbacks는 scan만)
+    """
+    reference = reference or SCAN_FALLBACK_PARSER
+    _check_parser(parser)
+    report = {'pages': 0, 'fallbacks': 0, 'mismatches': 0, 'mismatched': []}
+
+    for idx, html in enumerate(pages):
+        report['pages'] += 1
+        if parser == 'scan':
+            result = scan_products(html)
+            if result is None:
+                report['fallbacks'] += 1
+                continue
+        else:
+            result = _extract_dom(_dom_page_entries(html, parser), parser)
+        if result != ProductExtractor.extract_products(html, parser=reference):
+            report['mismatches'] += 1
+            report['mismatched'].append(idx)
+
+    return report
+
+
+def verify_scan_engine(pages, parser=None):
+    """scan 엔진과 DOM 파서 결과 비교 (verify_parser_backend(pages, 'scan', parser))"""
+    return verify_parser_backend(pages, 'scan', parser)
+
+
+def _check_parser(parser):
+    if parser not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {parser} (choices: {', '.join(PARSER_BACKENDS)})")
+    if parser not in available_parsers():
+        raise ValueError(f"Parser backend not installed: {parser}")
+
+
+def _parse_product_href(href):
+    """상품 링크 href 파싱
+
+    Returns:
+        tuple: (product_id, item_id, vendor_item_id, has_rank, rank) 또는 None
+    """
+    # Only /vp/products/ format
+    if '/vp/products/' not in href:
+        return None
+
+    # Extract product_id
+    product_id_match = _PRODUCT_ID_RE.search(href)
+    if not product_id_match:
+        return None
+
+    product_id = product_id_match.group(1)
+
+    # Parse URL parameters
+    parsed = urlparse(href)
+    params = parse_qs(parsed.query)
+
+    item_id = params.get('itemId', [''])[0]
+    vendor_item_id = params.get('vendorItemId', [''])[0]
+
+    # Check rank parameter
+    has_rank = 'rank' in params
+    rank = None
+
+    if has_rank:
+        try:
+            rank = int(params['rank'][0])
+        except (ValueError, IndexError):
+            pass
+
+    return product_id, item_id, vendor_item_id, has_rank, rank
+
+
+def _parse_rating(rating_text):
+    """평점 텍스트 → float 또는 None"""
+    rating_match = _RATING_RE.search(rating_text)
+    if rating_match:
+        return float(rating_match.group(1))
+    return None
+
+
+def _parse_review_count(review_text):
+    """리뷰 수 텍스트 → int 또는 None ((1,234) 또는 1234 형식)"""
+    review_match = _REVIEW_COUNT_RE.search(review_text)
+    if review_match:
+        return int(review_match.group(1).replace(',', ''))
+    return None
+
+
+# ============================================================================
+# 카드 인덱스 (상품 리스트를 한 번 순회해서 카드별 필드 요소 기록)
+# ============================================================================
+# 카드(li/div)별 필드: 문서 순서상 첫 하위 요소 (select_one과 동일)
+#   ad: [class*="AdMark"]
+#   name_tok / name_sub: .name / [class*="name"]
+#   price_tok / price_sub: .price-value / [class*="price"]
+#   rating: .rating, [class*="rating"]
+#   count: .rating-total-count, [class*="count"]
+
+_CARD_TAGS = ('li', 'div')
+
+
+def _mark_card_fields(stack, fields, node):
+    """요소가 매칭되는 필드를 조상 카드에 기록
+
+    이미 필드가 있는 조상을 만나면 그 위 조상들도 이미 있으므로 중단.
+    """
+    for field in fields:
+        for idx in range(len(stack) - 1, -1, -1):
+            card = stack[idx][1]
+            if card is None:
+                continue
+            if field in card:
+                break
+            card[field] = node
+
+
+def _stack_card(stack, tag):
+    """스택(조상 목록)에서 가장 가까운 tag 카드 인덱스 (없으면 None)"""
+    for idx in range(len(stack) - 1, -1, -1):
+        if stack[idx][2] == tag:
+            return stack[idx][1]
+    return None
+
+
+def _card_fields(card, link, text):
+    """카드 인덱스에서 (이름, 가격, 평점, 리뷰 수) 추출
+
+    Args:
+        card: 카드 필드 dict 또는 None (카드 없음)
+        link: 상품 링크 요소 (이름 요소가 없으면 링크 텍스트 사용)
+        text: 요소 → get_text(strip=True) 텍스트 함수
+    """
+    if card is None:
+        return '', '', None, None
+
+    name_el = card.get('name_tok') or card.get('name_sub') or link
+    price_el = card.get('price_tok') or card.get('price_sub')
+    rating_el = card.get('rating')
+    review_el = card.get('count')
+
+    return (
+        text(name_el),
+        text(price_el) if price_el is not None else '',
+        _parse_rating(text(rating_el)) if rating_el is not None else None,
+        _parse_review_count(text(review_el)) if review_el is not None else None,
+    )
+
+
+def _soup_text(node):
+    return node.get_text(strip=True)
+
+
+def _soup_class(node):
+    """class 속성 문자열 (soupsieve [class*=...]와 동일하게 공백으로 연결)"""
+    value = node.get('class')
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    return ' '.join(value)
+
+
+def _soup_card_index(product_card):
+    """BeautifulSoup 백엔드: 상품 리스트 밖 카드는 select 쿼리로 필드 기록"""
+    card = {}
+    fields = (
+        ('ad', '[class*="AdMark"]'),
+        ('name_tok', '.name'),
+        ('name_sub', '[class*="name"]'),
+        ('price_tok', '.price-value'),
+        ('price_sub', '[class*="price"]'),
+        ('rating', '.rating, [class*="rating"]'),
+        ('count', '.rating-total-count, [class*="count"]'),
+    )
+    for field, selector in fields:
+        node = product_card.select_one(selector)
+        if node is not None:
+            card[field] = node
+    return card
+
+
+def _soup_index(html, parser, region_only=False):
+    """BeautifulSoup 백엔드: 상품 링크와 카드 인덱스
+
+    Returns:
+        list: [(링크, 카드 필드 dict 또는 None), ...] 또는 None (상품 리스트 없음)
+    """
+    soup = BeautifulSoup(html, parser)
+
+    # Find product list container
+    product_list = soup.select_one('#productList, #product-list')
+    if not product_list:
+        return None
+
+    return _soup_index_list(product_list, region_only)
+
+
+def _soup_index_list(product_list, region_only=False):
+    """상품 리스트 하위 요소를 문서 순서로 한 번 순회해서 카드 인덱스 생성
+
+    조상 스택을 유지하면서 class가 매칭되는 요소를 조상 카드에 기록.
+    링크의 카드는 link.find_parent('li') or link.find_parent('div')와 동일.
+    """
+    # 상품 리스트 밖 조상 카드 (리스트 안에 li/div가 없을 때만 사용)
+    outer = {}
+
+    def outer_card(tag):
+        if tag not in outer:
+            node = product_list.find_parent(tag)
+            outer[tag] = _soup_card_index(node) if node is not None else None
+        return outer[tag]
+
+    root_name = product_list.name
+    stack = [(product_list, {} if root_name in _CARD_TAGS else None, root_name)]
+    links = []
+
+    for node in product_list.descendants:
+        name = node.name
+        if name is None:
+            continue  # 문자열
+        parent = node.parent
+        while stack[-1][0] is not parent:
+            stack.pop()
+
+        fields = class_fields(_soup_class(node))
+        if fields:
+            _mark_card_fields(stack, fields, node)
+
+        if name == 'a' and '/products/' in (node.get('href') or ''):
+            card = _stack_card(stack, 'li')
+            if card is None:
+                if region_only:
+                    raise _RegionMismatch()
+                card = outer_card('li')
+                if card is None:
+                    card = _stack_card(stack, 'div')
+                    if card is None:
+                        card = outer_card('div')
+            links.append((node, card))
+
+        stack.append((node, {} if name in _CARD_TAGS else None, name))
+
+    return links
+
+
+def _selectolax_parent(node, tag):
+    """selectolax 노드의 가장 가까운 tag 조상 (BeautifulSoup find_parent와 동일)"""
+    parent = node.parent
+    while parent is not None:
+        if parent.tag == tag:
+            return parent
+        parent = parent.parent
+    return None
+
+
+def _selectolax_text(node):
+    """BeautifulSoup get_text(strip=True)와 동일한 텍스트 (script/style 등 제외)"""
+    parts = []
+    for child in node.traverse(include_text=True):
+        if child.tag == '-text' and child.parent.tag not in _NON_TEXT_TAGS:
+            text = child.text_content.strip()
+            if text:
+                parts.append(text)
+    return ''.join(parts)
+
+
+def _selectolax_select_one(card, selector):
+    """카드 하위 요소 중 첫 매칭 (lexbor css()는 카드 자신도 포함하므로 제외)"""
+    for node in card.css(selector):
+        if node.mem_id != card.mem_id:
+            return node
+    return None
+
+
+def _selectolax_card_index(product_card):
+    """selectolax 백엔드: 상품 리스트 밖 카드는 css 쿼리로 필드 기록"""
+    card = {}
+    fields = (
+        ('ad', '[class*="AdMark"]'),
+        ('name_tok', '.name'),
+        ('name_sub', '[class*="name"]'),
+        ('price_tok', '.price-value'),
+        ('price_sub', '[class*="price"]'),
+        ('rating', '.rating, [class*="rating"]'),
+        ('count', '.rating-total-count, [class*="count"]'),
+    )
+    for field, selector in fields:
+        node = _selectolax_select_one(product_card, selector)
+        if node is not None:
+            card[field] = node
+    return card
+
+
+def _selectolax_index(html, region_only=False):
+    """selectolax 백엔드: 상품 링크와 카드 인덱스 (_soup_index와 동일한 한 번 순회)"""
+    tree = LexborHTMLParser(html)
+
+    product_list = tree.css_first('#productList, #product-list')
+    if product_list is None:
+        return None
+
+    outer = {}
+
+    def outer_card(tag):
+        if tag not in outer:
+            node = _selectolax_parent(product_list, tag)
+            outer[tag] = _selectolax_card_index(node) if node is not None else None
+        return outer[tag]
+
+    root_name = product_list.tag
+    stack = [(product_list.mem_id, {} if root_name in _CARD_TAGS else None, root_name)]
+    links = []
+
+    nodes = product_list.traverse()
+    next(nodes)  # 리스트 자신
+    for node in nodes:
+        name = node.tag
+        if name[0] in '_-':
+            continue  # 주석 등
+        parent_id = node.parent.mem_id
+        while stack[-1][0] != parent_id:
+            stack.pop()
+
+        attrs = node.attributes
+        fields = class_fields(attrs.get('class') or '')
+        if fields:
+            _mark_card_fields(stack, fields, node)
+
+        if name == 'a' and '/products/' in (attrs.get('href') or ''):
+            card = _stack_card(stack, 'li')
+            if card is None:
+                if region_only:
+                    raise _RegionMismatch()
+                card = outer_card('li')
+                if card is None:
+                    card = _stack_card(stack, 'div')
+                    if card is None:
+                        card = outer_card('div')
+            links.append((node, card))
+
+        stack.append((node.mem_id, {} if name in _CARD_TAGS else None, name))
+
+    return links
+
+
+class _DomEntry:
+    """상품 링크 1개 (카드 필드 텍스트는 필요할 때 계산)"""
+
+    __slots__ = ('href', 'parsed', 'unique_key', 'link', 'card')
+
+    def __init__(self, href, parsed, link, card):
+        self.href = href
+        self.parsed = parsed
+        # Unique key: product_id + item_id + vendor_item_id
+        self.unique_key = f"{parsed[0]}_{parsed[1]}_{parsed[2]}"
+        self.link = link
+        self.card = card
+
+    @property
+    def ranking_candidate(self):
+        """rank 파라미터가 있는 링크 (AdMark 확인 전)"""
+        return self.parsed[3] and self.parsed[4] is not None
+
+    @property
+    def has_ad_mark(self):
+        return self.card is not None and 'ad' in self.card
+
+
+def _dom_backend(parser):
+    """파서별 (index, get_href, text) 함수"""
+    if parser == 'selectolax':
+        return (_selectolax_index, lambda link: link.attributes.get('href') or '', _selectolax_text)
+    return (lambda html, region_only: _soup_index(html, parser, region_only),
+            lambda link: link.get('href', ''), _soup_text)
+
+
+def _dom_entries(html, parser, region_only=False):
+    """상품 링크 목록 (파싱 + 카드 인덱스까지, 필드 텍스트 추출 전)
+
+    Args:
+        html: 검색 페이지 HTML 또는 상품 리스트 구간
+        parser: 파서 백엔드
+        region_only: 구간 파싱 여부 (카드 li가 구간 밖이면 _RegionMismatch)
+
+    Returns:
+        list: [_DomEntry, ...] (문서 순서)
+    """
+    index, get_href, _ = _dom_backend(parser)
+    links = index(html, region_only)
+    if links is None:
+        return []
+
+    entries = []
+    for link, card in links:
+        href = get_href(link)
+
+        parsed = _parse_product_href(href)
+        if not parsed:
+            continue
+
+        entries.append(_DomEntry(href, parsed, link, card))
+    return entries
+
+
+def _dom_page_entries(html, parser, stats=None, encoding='utf-8'):
+    """DOM 백엔드 카드 인덱스 (PARSE_REGION_ONLY면 상품 리스트 구간 우선, 못 찾거나 불일치면 전체 문서)
+
+    bytes 입력 디코딩 범위:
+    - 구간 파싱: 구간만 디코딩
+    - 전체 문서 파싱 (기본): 본문 전체 디코딩 - 파싱 결과가 전체 문서에 좌우되므로 구간만 디코딩할 수 없음
+      (300KB 페이지 디코딩 약 0.6ms, selectolax 파싱의 5% 미만)
+    """
+    total = len(html)
+    region = _region_text(html, encoding) if PARSE_REGION_ONLY else None
+    if region:
+        text, skipped = region
+        try:
+            entries = _dom_entries(text, parser, region_only=True)
+            _record_region(total, skipped, stats)
+            return entries
+        except _RegionMismatch:
+            pass
+
+    _record_region(total, 0, stats)
+    return _dom_entries(_decode(html, encoding), parser)
+
+
+def _product_data(entry, name, price, rating, review_count):
+    product_id, item_id, vendor_item_id, _, rank = entry.parsed
+    return Product(product_id, item_id, vendor_item_id, entry.href, rank, name, price, rating, review_count)
+
+
+def _lazy_product(entry, text):
+    """표시 필드를 처음 접근할 때 카드 인덱스에서 계산하는 Product"""
+    product_id, item_id, vendor_item_id, _, rank = entry.parsed
+    card, link = entry.card, entry.link
+    return Product.lazy(product_id, item_id, vendor_item_id, entry.href, rank,
+                        lambda: _card_fields(card, link, text))
+
+
+def _extract_dom(entries, parser):
+    """DOM 백엔드 추출 결과 (html.parser, lxml, selectolax)
+
+    Returns:
+        dict: {ranking, ads, total}
+    """
+    text = _dom_backend(parser)[2]
+
+    ranking_products = {}
+    ad_products = {}
+
+    for entry in entries:
+        # Pure ranking products (has rank, no ad mark)
+        if entry.ranking_candidate and not entry.has_ad_mark:
+            target = ranking_products
+        else:
+            target = ad_products
+
+        # 중복 링크는 첫 번째만 사용 (필드 추출 생략)
+        if entry.unique_key in target:
+            continue
+        target[entry.unique_key] = _product_data(entry, *_card_fields(entry.card, entry.link, text))
+
+    return {
+        'ranking': list(ranking_products.values()),
+        'ads': list(ad_products.values()),
+        'total': len(ranking_products) + len(ad_products)
+    }
+
+
+def _extract_dom_page(html, parser, stats=None, encoding='utf-8', verify=None):
+    """DOM 백엔드 페이지 추출 (검증 샘플이면 기준 파서 결과 반환)
+
+    Args:
+        verify: 검증 여부 (None이면 SCAN_VERIFY_RATE로 샘플링)
+    """
+    result = _extract_dom(_dom_page_entries(html, parser, stats, encoding), parser)
+    if verify is None:
+        verify = _verify_sampled(parser)
+    if verify:
+        result = _verify_result(html, result, parser, encoding)
+    return result
+
+
+class ProductStream:
+    """랭킹 상품을 페이지 순서대로 하나씩 생성 (타겟 발견 시 나머지 추출 생략)
+
+    extract_products(...)['ranking']과 같은 순서/내용 (Product 객체).
+    DOM 백엔드는 지연 Product를 생성 (이름/가격/평점/리뷰는 처음 접근할 때 계산),
+    count_remaining()은 남은 링크의 href와 AdMark만 확인해서 랭킹 상품 수를 셈.
+    scan 백엔드와 검증 샘플 페이지(lxml/selectolax)는 한 번에 추출한 결과를 순서대로 돌려줌.
+
+    사용법:
+        stream = ProductStream(html)
+        for product in stream:
+            if is_target(product):
+                break
+        total = stream.yielded + stream.count_remaining()
+    """
+
+    def __init__(self, html, parser=None, stats=None, encoding='utf-8'):
+        parser = parser or DEFAULT_PARSER
+        _check_parser(parser)
+        self.yielded = 0
+
+        if parser == 'scan':
+            self._products = iter(_extract_scan(html, stats, encoding)['ranking'])
+            self._entries = None
+        elif _verify_sampled(parser):
+            self._products = iter(_extract_dom_page(html, parser, stats, encoding, verify=True)['ranking'])
+            self._entries = None
+        else:
+            self._products = None
+            self._entries = iter(_dom_page_entries(html, parser, stats, encoding))
+            self._text = _dom_backend(parser)[2]
+            self._seen = set()
+
+    def __iter__(self):
+        return self
+
+    def _next_ranking_entry(self):
+        for entry in self._entries:
+            if not entry.ranking_candidate or entry.unique_key in self._seen:
+                continue
+            if entry.has_ad_mark:
+                continue
+            self._seen.add(entry.unique_key)
+            return entry
+        return None
+
+    def __next__(self):
+        if self._entries is None:
+            product = next(self._products)
+        else:
+            entry = self._next_ranking_entry()
+            if entry is None:
+                raise StopIteration
+            product = _lazy_product(entry, self._text)
+        self.yielded += 1
+        return product
+
+    def count_remaining(self):
+        """아직 생성하지 않은 랭킹 상품 수 (스트림을 소진함)"""
+        if self._entries is None:
+            return sum(1 for _ in self._products)
+        count = 0
+        while self._next_ranking_entry() is not None:
+            count += 1
+        return count
+
+
+def _duplicate_index(results, details=None):
+    """uniqueKey 역색인 (페이지 결과를 한 번만 순회)
+
+    Args:
+        results: [{success, page, rankingProducts}, ...]
+        details: dict를 넘기면 {uniqueKey: [{page, url, name, rank}, ...]}를 채움
+
+    Returns:
+        tuple: (전체 상품 수, {uniqueKey: [(page, position), ...]}, {page: set(uniqueKey)})
+    """
+    total = 0
+    index = {}
+    page_products = {}
+
+    for result in results:
+        if not (result.get('success') and result.get('rankingProducts')):
+            continue
+        page_num = result['page']
+        products = result['rankingProducts']
+        keys = set()
+
+        for position, p in enumerate(products):
+            key = p['uniqueKey']
+            keys.add(key)
+            occurrences = index.get(key)
+            if occurrences is None:
+                index[key] = occurrences = []
+            occurrences.append((page_num, position))
+
+            if details is not None:
+                details.setdefault(key, []).append({
+                    'page': page_num,
+                    'url': p['url'],
+                    'name': p['name'],
+                    'rank': p['rank']
+                })
+
+        total += len(products)
+        page_products[page_num] = keys
+
+    return total, index, page_products
+
+
+def _occurrence_pages(occurrences):
+    """등장 위치 목록 → 중복 없는 페이지 목록 (등장 순서)"""
+    return list(dict.fromkeys(page for page, _ in occurrences))
+
+
 # ============================================================================
 # 기존 ProductExtractor 클래스
 # ============================================================================
@@ -132,164 +1166,97 @@ class ProductExtractor:
     """Extract product information from Coupang HTML"""
 
     @staticmethod
-    def extract_products_from_html(html):
+    def extract_products_from_html(html, parser=None, stats=None, encoding='utf-8'):
         """
         Extract products from HTML content
 
+        Products in ranking/ads are plain dicts, as before Product was introduced.
+        Use extract_products for Product objects (no per-product dict copy).
+
         Args:
-            html: HTML string from Coupang search page
+            html: HTML string (or raw response bytes) from Coupang search page
+            parser: Parser backend ('html.parser', 'lxml', 'selectolax', 'scan').
+                    None uses DEFAULT_PARSER.
+            stats: Optional dict filled with {region, bytes_total, bytes_skipped}
+            encoding: Encoding of bytes input (ignored for str)
 
         Returns:
             dict with ranking, ads, total counts
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        result = ProductExtractor.extract_products(html, parser=parser, stats=stats, encoding=encoding)
+        return {
+            'ranking': [product.to_dict() for product in result['ranking']],
+            'ads': [product.to_dict() for product in result['ads']],
+            'total': result['total']
+        }
 
-        # Find product list container
-        product_list = soup.select_one('#productList, #product-list')
-        if not product_list:
-            return {'ranking': [], 'ads': [], 'total': 0}
+    @staticmethod
+    def extract_products(html, parser=None, stats=None, encoding='utf-8'):
+        """
+        Extract products from HTML content as Product objects
 
-        # Find all product links
-        links = product_list.select('a[href*="/products/"]')
+        Same content and order as extract_products_from_html. Product also
+        supports dict-style access (product['productId']); to_dict() gives
+        the plain dict.
 
-        ranking_products = {}
-        ad_products = {}
+        DOM backends parse the whole document by default, so raw response bytes
+        are decoded in full (about 0.6 ms for a 300 KB page, under 5% of even the
+        selectolax parse). Only the scan backend and PARSE_REGION_ONLY
+        (set_region_parsing) decode just the #productList region.
 
-        for link in links:
-            href = link.get('href', '')
+        Args:
+            html: HTML string (or raw response bytes) from Coupang search page
+            parser: Parser backend ('html.parser', 'lxml', 'selectolax', 'scan').
+                    None uses DEFAULT_PARSER.
+            stats: Optional dict filled with {region, bytes_total, bytes_skipped}
+            encoding: Encoding of bytes input (ignored for str)
 
-            # Only /vp/products/ format
-            if '/vp/products/' not in href:
-                continue
+        Returns:
+            dict with ranking, ads (lists of Product), total counts
+        """
+        parser = parser or DEFAULT_PARSER
+        _check_parser(parser)
 
-            # Extract product_id
-            product_id_match = re.search(r'/vp/products/(\d+)', href)
-            if not product_id_match:
-                continue
+        if parser == 'scan':
+            return _extract_scan(html, stats, encoding)
 
-            product_id = product_id_match.group(1)
-
-            # Parse URL parameters
-            parsed = urlparse(href)
-            params = parse_qs(parsed.query)
-
-            item_id = params.get('itemId', [''])[0]
-            vendor_item_id = params.get('vendorItemId', [''])[0]
-
-            # Unique key: product_id + item_id + vendor_item_id
-            unique_key = f"{product_id}_{item_id}_{vendor_item_id}"
-
-            # Check rank parameter
-            has_rank = 'rank' in params
-            rank = None
-
-            if has_rank:
-                try:
-                    rank = int(params['rank'][0])
-                except (ValueError, IndexError):
-                    pass
-
-            # Check AdMark class
-            product_card = link.find_parent('li') or link.find_parent('div')
-            has_ad_mark = False
-
-            if product_card:
-                ad_mark = product_card.select('[class*="AdMark"]')
-                has_ad_mark = len(ad_mark) > 0
-
-            # Extract name and price
-            name_el = None
-            price_el = None
-            rating = None
-            review_count = None
-
-            if product_card:
-                name_el = (product_card.select_one('.name') or
-                          product_card.select_one('[class*="name"]') or
-                          link)
-                price_el = (product_card.select_one('.price-value') or
-                           product_card.select_one('[class*="price"]'))
-
-                # Extract rating (평점)
-                rating_el = product_card.select_one('.rating, [class*="rating"]')
-                if rating_el:
-                    rating_text = rating_el.get_text(strip=True)
-                    rating_match = re.search(r'(\d+\.?\d*)', rating_text)
-                    if rating_match:
-                        rating = float(rating_match.group(1))
-
-                # Extract review count (리뷰 수)
-                review_el = product_card.select_one('.rating-total-count, [class*="count"]')
-                if review_el:
-                    review_text = review_el.get_text(strip=True)
-                    # (1,234) 또는 1234 형식
-                    review_match = re.search(r'\(?([\d,]+)\)?', review_text)
-                    if review_match:
-                        review_count = int(review_match.group(1).replace(',', ''))
-
-            product_data = {
-                'productId': product_id,
-                'itemId': item_id,
-                'vendorItemId': vendor_item_id,
-                'uniqueKey': unique_key,
-                'name': name_el.get_text(strip=True) if name_el else '',
-                'price': price_el.get_text(strip=True) if price_el else '',
-                'url': href,
-                'rank': rank,
-                'rating': rating,
-                'review_count': review_count
-            }
+        return _extract_dom_page(html, parser, stats, encoding)
 
-            # Pure ranking products (has rank, no ad mark)
-            if has_rank and rank is not None and not has_ad_mark:
-                if unique_key not in ranking_products:
-                    ranking_products[unique_key] = product_data
-            else:
-                if unique_key not in ad_products:
-                    ad_products[unique_key] = product_data
+    @staticmethod
+    def iter_ranking_products(html, parser=None, stats=None, encoding='utf-8'):
+        """
+        Yield ranking products in page order (see ProductStream)
 
-        return {
-            'ranking': list(ranking_products.values()),
-            'ads': list(ad_products.values()),
-            'total': len(ranking_products) + len(ad_products)
-        }
+        Args:
+            html: HTML string (or raw response bytes) from Coupang search page
+            parser: Parser backend (None uses DEFAULT_PARSER)
+            stats: Optional dict filled with {region, bytes_total, bytes_skipped}
+            encoding: Encoding of bytes input (ignored for str)
+
+        Returns:
+            ProductStream
+        """
+        return ProductStream(html, parser=parser, stats=stats, encoding=encoding)
 
     @staticmethod
     def check_duplicates(results):
         """
         Check for duplicate products across multiple pages
 
+        Builds an inverted index (uniqueKey -> occurrences) in one pass over
+        the pages, so lookups per key do not rescan every page.
+
         Args:
             results: List of result dicts with rankingProducts
 
         Returns:
             dict with duplicate statistics
+                - index: {uniqueKey: [(page, position), ...]} in page order
+                - duplicateKeys: {uniqueKey: [pages...]} for keys seen more than once
         """
-        all_product_keys = []
-        page_products = {}
         product_details = {}
-
-        for result in results:
-            if result.get('success') and result.get('rankingProducts'):
-                page_num = result['page']
-                product_keys = [p['uniqueKey'] for p in result['rankingProducts']]
-                all_product_keys.extend(product_keys)
-                page_products[page_num] = set(product_keys)
-
-                for p in result['rankingProducts']:
-                    key = p['uniqueKey']
-                    if key not in product_details:
-                        product_details[key] = []
-
-                    product_details[key].append({
-                        'page': page_num,
-                        'url': p['url'],
-                        'name': p['name'],
-                        'rank': p['rank']
-                    })
-
-        total_products = len(all_product_keys)
-        unique_products = len(set(all_product_keys))
+        total_products, index, page_products = _duplicate_index(results, product_details)
+        unique_products = len(index)
         duplicate_count = total_products - unique_products
 
         return {
@@ -298,9 +1265,67 @@ class ProductExtractor:
             'duplicates': duplicate_count,
             'duplicate_rate': (duplicate_count / total_products * 100) if total_products > 0 else 0,
             'pageProducts': page_products,
-            'productDetails': product_details
+            'productDetails': product_details,
+            'index': index,
+            'duplicateKeys': {key: _occurrence_pages(occurrences)
+                              for key, occurrences in index.items() if len(occurrences) > 1},
         }
 
+    @staticmethod
+    def analyze_duplicates(searches):
+        """
+        Duplicate / pagination drift summary across many searches
+
+        Only the inverted index is built per search (no per-product details),
+        so hundreds of keywords x 13+ pages stay linear in the number of products.
+
+        Args:
+            searches: {label: results} or iterable of (label, results),
+                      results as in check_duplicates
+
+        Returns:
+            dict: {searches, total, unique, duplicates, duplicate_rate,
+                   cross_page_keys, max_page_span, by_search: {label: summary}}
+                - cross_page_keys: keys that appear on more than one page
+                - max_page_span: largest page distance between occurrences of a key
+        """
+        items = searches.items() if isinstance(searches, dict) else searches
+        by_search = {}
+        totals = {'total': 0, 'unique': 0, 'duplicates': 0, 'cross_page_keys': 0, 'max_page_span': 0}
+
+        for label, results in items:
+            total, index, _ = _duplicate_index(results)
+            cross_page_keys = 0
+            max_span = 0
+            for occurrences in index.values():
+                if len(occurrences) < 2:
+                    continue
+                pages = [page for page, _ in occurrences]
+                span = max(pages) - min(pages)
+                if span:
+                    cross_page_keys += 1
+                    max_span = max(max_span, span)
+
+            duplicates = total - len(index)
+            summary = {
+                'total': total,
+                'unique': len(index),
+                'duplicates': duplicates,
+                'duplicate_rate': (duplicates / total * 100) if total > 0 else 0,
+                'cross_page_keys': cross_page_keys,
+                'max_page_span': max_span,
+            }
+            by_search[label] = summary
+
+            for key in ('total', 'unique', 'duplicates', 'cross_page_keys'):
+                totals[key] += summary[key]
+            totals['max_page_span'] = max(totals['max_page_span'], max_span)
+
+        totals['searches'] = len(by_search)
+        totals['duplicate_rate'] = (totals['duplicates'] / totals['total'] * 100) if totals['total'] > 0 else 0
+        totals['by_search'] = by_search
+        return totals
+
     @staticmethod
     def print_duplicates(duplicate_stats):
         """Print duplicate statistics"""
@@ -315,25 +1340,18 @@ class ProductExtractor:
         if duplicate_stats['duplicates'] > 0:
             print(f"\n[WARNING] {duplicate_stats['duplicates']}개 중복 상품 발견!")
 
-            # Count occurrences
-            product_counter = {}
-            for page_products in duplicate_stats['pageProducts'].values():
-                for key in page_products:
-                    product_counter[key] = product_counter.get(key, 0) + 1
-
-            # Find duplicates
-            duplicates = [(key, count) for key, count in product_counter.items() if count > 1]
+            # 중복 키 → 등장 페이지 (역색인에서 바로 조회)
+            duplicate_keys = duplicate_stats.get('duplicateKeys')
+            if duplicate_keys is None:
+                duplicate_keys = {key: _occurrence_pages([(d['page'], 0) for d in details])
+                                  for key, details in duplicate_stats['productDetails'].items()
+                                  if len(details) > 1}
 
             print("\n[DUPLICATE PRODUCTS WITH FULL URLS]:")
-            for key, count in duplicates:
-                print(f"\n  Key {key}: {count}번 등장")
-
-                # Find pages with this duplicate
-                pages_with_duplicate = []
-                for page_num, product_set in duplicate_stats['pageProducts'].items():
-                    if key in product_set:
-                        pages_with_duplicate.append(page_num)
-
+            for key, pages_with_duplicate in duplicate_keys.items():
+                if len(pages_with_duplicate) < 2:
+                    continue  # 같은 페이지 안의 중복만 있는 키 (페이지 간 중복 아님)
+                print(f"\n  Key {key}: {len(pages_with_duplicate)}번 등장")
                 print(f"    Pages: {', '.join(map(str, pages_with_duplicate))}")
 
                 # Print details
@@ -2,9 +2,18 @@
 작업 실행 모듈 (lib/work/)
 
 - search: 상품 검색 (rank_api 핵심)
+- search_async: 상품 검색 asyncio 버전 (AsyncSession)
+- search_cache: 검색 결과 페이지 캐시 (검색어+페이지+플랫폼, TTL)
 - request: HTTP 요청
+- executor: 공용 페이지 요청 실행기 (전체/프록시별 동시 요청 수 제한)
+- cancel: 요청 취소 토큰/절약 통계
+- errors: 요청 에러 분류 (curl 에러 코드/HTTP 상태 → 에러 종류)
+- retry: 검색별 재시도 예산, 지수 증가 + 지터 대기, 재시도/복구 통계
+- history: 순위 이력 (마지막 발견 페이지 → 검색 Tier 순서)
+- tiers: 검색 Tier 구성 학습 (발견 페이지 분포 → Tier 경계)
 - click: 상품 클릭
 - common: 공통 함수/상수
 """
 
-from .search import search_product
+from .search import search_product, search_products
+from .search_async import search_product_async, search_products_async
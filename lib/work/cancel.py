@@ -0,0 +1,181 @@
+"""
+요청 취소 모듈
+
+검색 중 발견/차단 시 진행 중인 페이지 요청을 실제로 중단:
+- CancelToken: 협조적 취소 신호 (fetch_page/make_request, 비동기 버전도 같은 토큰 사용)
+- make_request는 libcurl 진행 콜백에서 토큰을 확인하고 전송을 중단 (RequestCancelled)
+  연결/프록시 CONNECT/TLS/첫 바이트 대기 중에도 중단 (수신 데이터가 없어도 호출됨)
+- make_request_async는 취소 콜백으로 요청 태스크를 바로 취소
+- 절약 통계: 중단한 요청 수, 중단 전 수신 바이트, 건너뛴 파싱 수,
+  완료 요청 평균 크기/시간 기준 절약 추정치
+"""
+
+import asyncio
+import threading
+
+
+class RequestCancelled(Exception):
+    """취소 토큰으로 중단한 요청
+
+    Attributes:
+        received: 중단 전 수신 바이트
+        elapsed: 요청 시작부터 중단까지 시간 (초)
+    """
+
+    def __init__(self, received=0, elapsed=0.0, reason=''):
+        super().__init__(f'CANCELLED{f"_{reason}" if reason else ""}')
+        self.received = received
+        self.elapsed = elapsed
+        self.reason = reason
+
+
+class CancelToken:
+    """협조적 취소 신호 (스레드 안전)
+
+    사용법:
+        token = CancelToken()
+        fetch_page(..., cancel=token)   # 워커 스레드
+        token.cancel('found')           # 다른 스레드에서 취소
+    """
+
+    __slots__ = ('_event', '_lock', '_callbacks', 'reason')
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self.reason = ''
+
+    def cancel(self, reason=''):
+        """취소 (첫 사유만 기록, 등록된 콜백 호출)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def add_callback(self, callback):
+        """취소 시 호출할 함수 등록 (취소한 스레드에서 호출, 이미 취소됐으면 바로 호출)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback):
+        """등록한 콜백 해제 (없으면 무시)"""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def wait(self, timeout):
+        """취소되거나 timeout이 지날 때까지 대기 (재시도 지연용)
+
+        Returns:
+            bool: 취소 여부
+        """
+        return self._event.wait(timeout)
+
+    async def wait_async(self, timeout):
+        """wait의 asyncio 버전 (이벤트 루프를 막지 않음)
+
+        Returns:
+            bool: 취소 여부
+        """
+        loop = asyncio.get_running_loop()
+        woken = loop.create_future()
+
+        def wake():
+            try:
+                loop.call_soon_threadsafe(lambda: woken.done() or woken.set_result(True))
+            except RuntimeError:  # 이벤트 루프 종료됨
+                pass
+
+        self.add_callback(wake)
+        try:
+            await asyncio.wait_for(woken, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.remove_callback(wake)
+        return self.cancelled
+
+
+# ============================================================================
+# 절약 통계 (프로세스 공용)
+# ============================================================================
+_lock = threading.Lock()
+_stats = {
+    'fetched': 0,           # 끝까지 받은 요청 수
+    'fetched_bytes': 0,
+    'fetched_seconds': 0.0,
+    'aborted': 0,           # 전송 중 중단한 요청 수
+    'aborted_bytes': 0,     # 중단 전 수신 바이트
+    'aborted_seconds': 0.0,
+    'skipped': 0,           # 시작 전/재시도 전 취소한 요청 수
+    'skipped_parses': 0,    # 응답은 받았지만 파싱을 건너뛴 수
+}
+
+
+def record_fetch(size, seconds):
+    """끝까지 받은 요청 기록 (평균 크기/시간 = 절약 추정 기준)"""
+    with _lock:
+        _stats['fetched'] += 1
+        _stats['fetched_bytes'] += size
+        _stats['fetched_seconds'] += seconds
+
+
+def record_abort(received, seconds):
+    """전송 중 중단한 요청 기록"""
+    with _lock:
+        _stats['aborted'] += 1
+        _stats['aborted_bytes'] += received
+        _stats['aborted_seconds'] += seconds
+
+
+def record_skip(parse=False):
+    """요청 전 취소 (parse=True: 응답 수신 후 파싱만 건너뜀)"""
+    with _lock:
+        _stats['skipped_parses' if parse else 'skipped'] += 1
+
+
+def get_cancel_stats():
+    """취소 통계 스냅샷
+
+    절약 추정치는 끝까지 받은 요청의 평균 크기/시간 기준:
+    - saved_bytes: 중단 요청 (평균 - 수신) + 시작 전 취소 요청 평균
+    - saved_seconds: 중단 요청 (평균 - 경과) + 시작 전 취소 요청 평균
+
+    Returns:
+        dict: {fetched, aborted, skipped, skipped_parses, aborted_bytes,
+               avg_bytes, avg_seconds, saved_bytes, saved_seconds}
+    """
+    with _lock:
+        s = dict(_stats)
+    avg_bytes = s['fetched_bytes'] / s['fetched'] if s['fetched'] else 0.0
+    avg_seconds = s['fetched_seconds'] / s['fetched'] if s['fetched'] else 0.0
+    return {
+        'fetched': s['fetched'],
+        'aborted': s['aborted'],
+        'skipped': s['skipped'],
+        'skipped_parses': s['skipped_parses'],
+        'aborted_bytes': s['aborted_bytes'],
+        'avg_bytes': avg_bytes,
+        'avg_seconds': avg_seconds,
+        'saved_bytes': max(0.0, avg_bytes * s['aborted'] - s['aborted_bytes']) + avg_bytes * s['skipped'],
+        'saved_seconds': max(0.0, avg_seconds * s['aborted'] - s['aborted_seconds']) + avg_seconds * s['skipped'],
+    }
+
+
+def reset_cancel_stats():
+    """통계 초기화"""
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0.0 if key.endswith('seconds') else 0
@@ -0,0 +1,79 @@
+"""
+응답 분류 모듈
+
+검색 응답(상태 코드 + 원본 bytes)을 디코딩 없이 페이지 유형으로 분류:
+- ok: 상품 리스트가 있는 정상 검색 페이지
+- no_results: 쿠팡 "검색결과가 없습니다" 페이지 (정상 응답, 추천 상품이 있을 수 있음)
+- empty: 상품 리스트 없는 200 응답 (CHALLENGE_MAX_SIZE 초과, 챌린지 표식 없음)
+  → 기존과 같이 성공(상품 0개)으로 처리 (짧은/특이한 검색어 등)
+- challenge: 차단/봇 확인 페이지 (403, 챌린지 스크립트 표식, 리스트 없는 작은 응답)
+- error_page: 그 외 상품 리스트 없는 200 외 응답 (5xx, CDN 오류 안내 페이지 등)
+- truncated: 문서 끝(</html>)이 없고 상품 리스트 루트도 닫히지 않은 응답
+  (</html>만 빠진 응답은 리스트가 온전하면 ok - 리스트 안에서 잘린 경우만 실패로 처리)
+"""
+
+import re
+
+from extractor.scan_extractor import product_list_unclosed
+
+# 페이지 유형
+PAGE_OK = 'ok'
+PAGE_NO_RESULTS = 'no_results'
+PAGE_EMPTY = 'empty'
+PAGE_CHALLENGE = 'challenge'
+PAGE_ERROR = 'error_page'
+PAGE_TRUNCATED = 'truncated'
+
+# 상품 리스트 없이 이 크기 이하면 챌린지로 판단 (기존 size <= 5000 기준)
+CHALLENGE_MAX_SIZE = 5000
+
+# 문서 끝 확인 범위 (</html> 뒤에 붙는 스크립트/주석 허용)
+# - 여기서 </html>이 없을 때만 리스트 루트 종료 태그 확인 (문서 전체 탐색은 이 경우만)
+TAIL_SIZE = 4096
+
+# 패턴 (bytes, 리터럴 접두어로 시작해야 re의 빠른 탐색 경로를 탐)
+# - 상품 리스트: #productList / #product-list (클래스명 productList_...도 리스트 신호로 인정)
+# - "에 대한 검색결과가 없습니다"는 "검색결과가 없습니다"를 포함하므로 한 번만 탐색
+# - 챌린지 표식은 봇 확인 페이지에만 있는 것만 사용 (CDN 이름 같은 일반 문자열은 5xx/오류 페이지에도 있음)
+_LIST_MARKER_RE = re.compile(rb'product(?:List|-list)')
+_NO_RESULTS_MARKER = '검색결과가 없습니다'.encode('utf-8')
+_CHALLENGE_MARKER_RE = re.compile(
+    rb'Access Denied|sec-if-cpt|bm-verify|/_sec/cp_challenge|captcha-delivery'
+)
+_HTML_END_RE = re.compile(rb'</html\s*>', re.I)
+
+
+def classify_response(status_code, content):
+    """검색 응답 분류
+
+    Args:
+        status_code: HTTP 상태 코드
+        content: 응답 본문 (bytes)
+
+    Returns:
+        str: PAGE_OK, PAGE_NO_RESULTS, PAGE_EMPTY, PAGE_CHALLENGE, PAGE_ERROR, PAGE_TRUNCATED 중 하나
+    """
+    if status_code == 403:
+        return PAGE_CHALLENGE
+
+    size = len(content)
+    has_list = _LIST_MARKER_RE.search(content) is not None
+
+    if status_code == 200 and _NO_RESULTS_MARKER in content:
+        return PAGE_NO_RESULTS
+
+    if not has_list:
+        # 리스트 없는 응답만 챌린지 표식 확인 (보통 작은 페이지)
+        if size <= CHALLENGE_MAX_SIZE or _CHALLENGE_MARKER_RE.search(content):
+            return PAGE_CHALLENGE
+        return PAGE_EMPTY if status_code == 200 else PAGE_ERROR
+
+    if status_code != 200:
+        return PAGE_ERROR
+
+    # bytes → latin-1 str: 위치/ASCII 태그가 그대로 (디코딩 오류 없음)
+    if not _HTML_END_RE.search(content, max(0, size - TAIL_SIZE)) \
+            and product_list_unclosed(str(content, 'latin-1')):
+        return PAGE_TRUNCATED
+
+    return PAGE_OK
@@ -0,0 +1,133 @@
+"""
+페이지 요청 에러 분류
+
+예외 문자열 검색 대신 curl 에러 코드(curl_cffi 예외의 .code)와 HTTP 상태/응답 분류로
+에러 종류(kind)를 한 번만 결정:
+- 재시도 여부: RETRYABLE_KINDS (프록시 에러는 재시도 안 함, 죽은 프록시에 예산/시간 낭비 방지)
+- 차단 판단: BLOCKING_KINDS (챌린지 페이지, HTTP/2 스트림 에러)
+- 1페이지 조기 종료: PROXY_FAILURE_KINDS (타임아웃, 연결 실패, 프록시 에러)
+- 종류별 에러 통계 (요청 시도 단위)
+
+페이지 결과의 'error'는 기존 문자열 그대로 유지하고 'error_kind'를 추가로 기록
+"""
+
+import re
+import threading
+
+# 전송 에러 (curl 에러 코드 기준)
+ERR_CONNECT = 'connect'         # 연결 실패/DNS (curl 6, 7)
+ERR_TLS = 'tls'                 # TLS 핸드셰이크/인증서 (curl 35, 58, 59, 60, 77, 80, 83, 90, 91)
+ERR_TIMEOUT = 'timeout'         # 요청 타임아웃 (curl 28)
+ERR_RECV = 'recv'               # 송수신 중 연결 끊김 (curl 18, 52, 55, 56)
+ERR_H2_STREAM = 'h2_stream'     # HTTP/2 스트림 에러 (curl 92)
+ERR_PROXY = 'proxy'             # 프록시 연결/터널 실패 (curl 5, 97, CONNECT 단계 56)
+# 응답 에러 (HTTP 상태/응답 분류 기준)
+ERR_HTTP_4XX = 'http_4xx'
+ERR_HTTP_5XX = 'http_5xx'
+ERR_CHALLENGE = 'challenge'     # 챌린지/차단 페이지 (403 포함)
+ERR_TRUNCATED = 'truncated'     # 잘린 응답
+# 그 외
+ERR_DEADLINE = 'deadline'       # 마감 시간 초과 (요청 안 함/중단)
+ERR_CANCELLED = 'cancelled'     # 취소 토큰으로 중단
+ERR_OTHER = 'other'
+
+_CURL_KINDS = {
+    5: ERR_PROXY, 97: ERR_PROXY,
+    6: ERR_CONNECT, 7: ERR_CONNECT,
+    28: ERR_TIMEOUT,
+    35: ERR_TLS, 58: ERR_TLS, 59: ERR_TLS, 60: ERR_TLS, 77: ERR_TLS, 80: ERR_TLS, 83: ERR_TLS,
+    90: ERR_TLS, 91: ERR_TLS,
+    18: ERR_RECV, 52: ERR_RECV, 55: ERR_RECV, 56: ERR_RECV,
+    92: ERR_H2_STREAM,
+}
+
+# 같은 요청을 다시 보내면 성공할 수 있는 에러
+RETRYABLE_KINDS = frozenset({ERR_CONNECT, ERR_TLS, ERR_TIMEOUT, ERR_RECV, ERR_H2_STREAM})
+
+# 차단으로 처리하는 에러 (검색 중단)
+BLOCKING_KINDS = frozenset({ERR_CHALLENGE, ERR_H2_STREAM})
+
+# 1페이지에서 발생하면 프록시 문제로 보고 조기 종료하는 에러
+PROXY_FAILURE_KINDS = frozenset({ERR_TIMEOUT, ERR_CONNECT, ERR_PROXY})
+
+# 코드 속성이 없는 예외의 메시지에서 curl 에러 코드 추출 ('curl: (28) ...')
+_CURL_CODE_RE = re.compile(r'curl: \((\d+)\)')
+
+
+def curl_error_code(exc):
+    """예외의 curl 에러 코드 (없으면 0)"""
+    code = getattr(exc, 'code', 0)
+    try:
+        code = int(code or 0)
+    except (TypeError, ValueError):
+        code = 0
+    if not code:
+        match = _CURL_CODE_RE.search(str(exc))
+        if match:
+            code = int(match.group(1))
+    return code
+
+
+def classify_exception(exc):
+    """요청 예외 → 에러 종류
+
+    Args:
+        exc: make_request 예외 (curl_cffi RequestException/CurlError 등)
+
+    Returns:
+        tuple: (kind, curl 에러 코드)
+    """
+    code = curl_error_code(exc)
+    kind = _CURL_KINDS.get(code, ERR_OTHER)
+    # CONNECT 단계 수신 실패는 프록시 터널 실패 (curl_cffi ProxyError와 같은 기준)
+    if code == 56 and 'CONNECT' in str(exc):
+        kind = ERR_PROXY
+    return kind, code
+
+
+def classify_status(status_code, challenge=False, truncated=False):
+    """실패 응답 → 에러 종류
+
+    Args:
+        status_code: HTTP 상태 코드
+        challenge: 챌린지 페이지로 분류됨 (work.classify PAGE_CHALLENGE)
+        truncated: 잘린 응답으로 분류됨 (work.classify PAGE_TRUNCATED)
+    """
+    if challenge:
+        return ERR_CHALLENGE
+    if truncated:
+        return ERR_TRUNCATED
+    if 500 <= status_code < 600:
+        return ERR_HTTP_5XX
+    if 400 <= status_code < 500:
+        return ERR_HTTP_4XX
+    return ERR_OTHER
+
+
+# ============================================================================
+# 에러 통계 (프로세스 공용, 요청 시도 단위)
+# ============================================================================
+_lock = threading.Lock()
+_counts = {}
+
+
+def record_error(kind):
+    """실패한 요청 시도 기록"""
+    with _lock:
+        _counts[kind] = _counts.get(kind, 0) + 1
+
+
+def get_error_stats():
+    """종류별 에러 수 스냅샷 (많은 순)
+
+    Returns:
+        dict: {kind: count}
+    """
+    with _lock:
+        return dict(sorted(_counts.items(), key=lambda item: -item[1]))
+
+
+def reset_error_stats():
+    """통계 초기화"""
+    with _lock:
+        _counts.clear()
@@ -0,0 +1,258 @@
+"""
+페이지 요청 실행기 (프로세스 공용)
+
+search_product 호출마다 Tier별 ThreadPoolExecutor를 만들지 않고
+오래 사는 워커 스레드 하나에 페이지 작업을 제출:
+- 전체 동시 요청 수 제한 (워커 스레드 수 = 최대 in-flight)
+- 프록시별 동시 요청 수 제한 (같은 프록시 작업은 한도 안에서만 실행, 나머지는 대기열)
+- 대기열 깊이/사용률/대기 시간 통계
+
+제출 결과는 concurrent.futures.Future (as_completed/wait/cancel 그대로 사용)
+"""
+
+import time
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+# 전체 동시 요청 수 (워커 스레드 수)
+FETCH_MAX_IN_FLIGHT = 64
+
+# 프록시별 동시 요청 수 (Tier 3 = 8페이지 동시 요청과 동일)
+FETCH_PER_PROXY = 8
+
+
+class _Job:
+    __slots__ = ('future', 'proxy', 'fn', 'args', 'kwargs', 'queued_at')
+
+    def __init__(self, future, proxy, fn, args, kwargs):
+        self.future = future
+        self.proxy = proxy
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.queued_at = time.perf_counter()
+
+
+class FetchExecutor:
+    """프록시별 동시성 제한이 있는 공용 요청 실행기 (스레드 안전)
+
+    워커 스레드는 첫 제출 시 필요한 만큼 만들고 계속 재사용 (daemon).
+    대기열은 제출 순서대로 실행하되, 한도에 걸린 프록시의 작업은 건너뛰고
+    다음 작업을 먼저 실행함 (한 프록시가 전체 워커를 점유하지 않음).
+
+    사용법:
+        executor = get_fetch_executor()
+        future = executor.submit(proxy, fetch_page, page, query, ...)
+        future.result()
+        executor.stats()  # {in_flight, queued, utilization, ...}
+    """
+
+    def __init__(self, max_in_flight=FETCH_MAX_IN_FLIGHT, per_proxy=FETCH_PER_PROXY):
+        """
+        Args:
+            max_in_flight: 전체 동시 실행 작업 수
+            per_proxy: 프록시별 동시 실행 작업 수 (0이면 제한 없음)
+        """
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.per_proxy = max(0, int(per_proxy))
+        self._cond = threading.Condition()
+        self._pending = deque()
+        self._proxy_in_flight = {}
+        self._in_flight = 0
+        self._workers = 0
+        self._idle = 0
+        # 통계
+        self._submitted = 0
+        self._completed = 0
+        self._cancelled = 0
+        self._peak_in_flight = 0
+        self._peak_queued = 0
+        self._wait_total = 0.0
+        self._started = 0
+
+    def submit(self, proxy, fn, *args, **kwargs):
+        """작업 제출
+
+        Args:
+            proxy: 프록시 URL (동시성 제한 키, None이면 직접 연결 묶음)
+            fn: 실행 함수
+            *args, **kwargs: fn 인자
+
+        Returns:
+            Future: 실행 전 cancel() 하면 실행하지 않음
+        """
+        future = Future()
+        with self._cond:
+            self._pending.append(_Job(future, proxy, fn, args, kwargs))
+            self._submitted += 1
+            self._peak_queued = max(self._peak_queued, len(self._pending))
+            if self._idle:
+                self._wake()
+            elif self._workers < self.max_in_flight:
+                self._spawn()
+        return future
+
+    def set_limits(self, max_in_flight=None, per_proxy=None):
+        """동시성 한도 변경 (줄어들면 실행 중 작업이 끝난 뒤 반영)
+
+        Args:
+            max_in_flight: 전체 동시 실행 작업 수 (None이면 유지)
+            per_proxy: 프록시별 동시 실행 작업 수 (None이면 유지, 0이면 제한 없음)
+        """
+        with self._cond:
+            if max_in_flight is not None:
+                self.max_in_flight = max(1, int(max_in_flight))
+            if per_proxy is not None:
+                self.per_proxy = max(0, int(per_proxy))
+            while self._pending and self._workers < self.max_in_flight:
+                self._spawn()
+            self._idle = 0
+            self._cond.notify_all()
+
+    def stats(self):
+        """통계 스냅샷
+
+        Returns:
+            dict: {
+                workers: 워커 스레드 수,
+                in_flight: 실행 중 작업 수,
+                queued: 대기 작업 수,
+                max_in_flight, per_proxy: 현재 한도,
+                utilization: in_flight / max_in_flight,
+                busy_proxies: 실행 중 작업이 있는 프록시 수,
+                capped_proxies: 프록시 한도에 걸린 프록시 수,
+                submitted, completed, cancelled: 누적 작업 수,
+                peak_in_flight, peak_queued: 최대값,
+                avg_wait_ms: 평균 대기열 대기 시간
+            }
+        """
+        with self._cond:
+            capped = sum(1 for n in self._proxy_in_flight.values() if self.per_proxy and n >= self.per_proxy)
+            return {
+                'workers': self._workers,
+                'in_flight': self._in_flight,
+                'queued': len(self._pending),
+                'max_in_flight': self.max_in_flight,
+                'per_proxy': self.per_proxy,
+                'utilization': self._in_flight / self.max_in_flight,
+                'busy_proxies': len(self._proxy_in_flight),
+                'capped_proxies': capped,
+                'submitted': self._submitted,
+                'completed': self._completed,
+                'cancelled': self._cancelled,
+                'peak_in_flight': self._peak_in_flight,
+                'peak_queued': self._peak_queued,
+                'avg_wait_ms': self._wait_total / self._started * 1000 if self._started else 0.0,
+            }
+
+    def _spawn(self):
+        """워커 스레드 추가 (락 안에서 호출)"""
+        self._workers += 1
+        threading.Thread(target=self._worker, name=f'fetch-{self._workers}', daemon=True).start()
+
+    def _wake(self):
+        """대기 중인 워커 하나 깨우기 (락 안에서 호출, 깨운 워커는 idle에서 바로 제외)"""
+        self._idle -= 1
+        self._cond.notify()
+
+    def _next_job(self):
+        """실행 가능한 첫 작업 꺼내기 (락 안에서 호출, 없으면 None)
+
+        취소된 작업은 대기열에서 제거하고, 한도에 걸린 프록시 작업은 건너뜀
+        """
+        pending = self._pending
+        if any(job.future.cancelled() for job in pending):
+            kept = []
+            for job in pending:
+                if job.future.cancelled():
+                    # 취소 완료 알림 (wait/as_completed가 완료로 인식)
+                    job.future.set_running_or_notify_cancel()
+                    self._cancelled += 1
+                else:
+                    kept.append(job)
+            pending.clear()
+            pending.extend(kept)
+        for job in pending:
+            if not self.per_proxy or self._proxy_in_flight.get(job.proxy, 0) < self.per_proxy:
+                pending.remove(job)
+                return job
+        return None
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._workers > self.max_in_flight:
+                        self._workers -= 1
+                        return
+                    job = self._next_job()
+                    if job is not None:
+                        break
+                    self._idle += 1
+                    self._cond.wait()
+
+                if not job.future.set_running_or_notify_cancel():
+                    self._cancelled += 1
+                    continue
+                self._in_flight += 1
+                self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+                self._proxy_in_flight[job.proxy] = self._proxy_in_flight.get(job.proxy, 0) + 1
+                self._wait_total += time.perf_counter() - job.queued_at
+                self._started += 1
+
+            try:
+                result = job.fn(*job.args, **job.kwargs)
+            except BaseException as e:
+                job.future.set_exception(e)
+            else:
+                job.future.set_result(result)
+
+            with self._cond:
+                self._in_flight -= 1
+                self._completed += 1
+                remaining = self._proxy_in_flight[job.proxy] - 1
+                if remaining:
+                    self._proxy_in_flight[job.proxy] = remaining
+                else:
+                    del self._proxy_in_flight[job.proxy]
+                # 이 프록시 한도에 막혀 있던 작업이 있을 수 있음
+                if self._pending and self._idle:
+                    self._wake()
+
+
+# ============================================================================
+# 프로세스 공용 인스턴스
+# ============================================================================
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_fetch_executor():
+    """프로세스 공용 요청 실행기 (첫 호출 시 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = FetchExecutor(FETCH_MAX_IN_FLIGHT, FETCH_PER_PROXY)
+    return _executor
+
+
+def set_fetch_limits(max_in_flight=None, per_proxy=None):
+    """공용 실행기 동시성 한도 변경
+
+    Args:
+        max_in_flight: 전체 동시 요청 수 (None이면 유지)
+        per_proxy: 프록시별 동시 요청 수 (None이면 유지, 0이면 제한 없음)
+    """
+    global FETCH_MAX_IN_FLIGHT, FETCH_PER_PROXY
+    if max_in_flight is not None:
+        FETCH_MAX_IN_FLIGHT = max(1, int(max_in_flight))
+    if per_proxy is not None:
+        FETCH_PER_PROXY = max(0, int(per_proxy))
+    get_fetch_executor().set_limits(FETCH_MAX_IN_FLIGHT, FETCH_PER_PROXY)
+
+
+def get_fetch_stats():
+    """공용 실행기 통계 스냅샷 (FetchExecutor.stats 참고)"""
+    return get_fetch_executor().stats()
@@ -0,0 +1,246 @@
+"""
+순위 이력 모듈 (로컬 SQLite)
+
+같은 (키워드, 상품 ID) 체크가 반복 할당되므로 마지막 발견 페이지를 기록해 두고
+다음 검색의 첫 Tier를 그 페이지 근처로 잡음 (search_product hint_page):
+- 첫 Tier = 마지막 발견 페이지 ± HINT_NEIGHBORS를 포함하는 구간 (1페이지부터 한도 안이면 1페이지부터)
+- 첫 Tier 앞 페이지는 발견 후에도 받아서 actual_rank 유지, 나머지 페이지는 다음 Tier
+- Tier당 페이지 수는 학습 Tier와 같은 한도 (work.tiers max_pages = 프록시별 동시 요청 한도)
+
+기본 꺼짐 (work.py --history로 DB 경로를 지정해야 활성화)
+
+Note: 이력은 로컬 파일만 사용 (API/DB 의존성 없음), 여러 워커 스레드가 공유
+"""
+
+import os
+import time
+import sqlite3
+import threading
+
+from work.tiers import get_tier_model, TIER_WINDOW
+
+# 이력 유효 기간 (초, 이보다 오래된 기록은 힌트로 쓰지 않음)
+HISTORY_MAX_AGE = 7 * 24 * 3600
+
+# 힌트 페이지 뒤로 함께 요청할 페이지 수 (순위 변동 대비)
+HINT_NEIGHBORS = 1
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS rank_history (
+    keyword     TEXT    NOT NULL,
+    product_id  TEXT    NOT NULL,
+    page        INTEGER,            -- 마지막 발견 페이지 (미발견이면 NULL)
+    rank        INTEGER,            -- 마지막 actual_rank
+    checked_at  REAL    NOT NULL,
+    found_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (keyword, product_id)
+);
+CREATE TABLE IF NOT EXISTS search_outcomes (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    found_page   INTEGER,           -- 발견 페이지 (미발견이면 NULL)
+    pages_needed INTEGER NOT NULL,  -- 검색 종료에 필요했던 페이지 수
+    checked_at   REAL    NOT NULL
+);
+'''
+
+
+class RankHistory:
+    """순위 이력 저장소 (스레드 안전)
+
+    사용법:
+        history = RankHistory('data/rank_history.db')
+        page = history.hint_page(keyword, product_id)   # 마지막 발견 페이지 또는 None
+        history.record(keyword, product_id, page=9, rank=612)
+        history.stats()  # {lookups, hits, records, hit_rate}
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: SQLite 파일 경로 (':memory:' 가능, 상위 디렉토리는 자동 생성)
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+        self._lookups = 0
+        self._hits = 0
+        self._records = 0
+
+    @staticmethod
+    def _key(keyword, product_id):
+        return (str(keyword).strip(), str(product_id).strip())
+
+    def lookup(self, keyword, product_id, max_age=None):
+        """마지막 기록 조회
+
+        Args:
+            max_age: 유효 기간 (초, 기본 HISTORY_MAX_AGE)
+
+        Returns:
+            dict: {page, rank, checked_at, found_count} 또는 None (기록 없음/만료)
+        """
+        max_age = HISTORY_MAX_AGE if max_age is None else max_age
+        with self._lock:
+            self._lookups += 1
+            row = self._conn.execute(
+                'SELECT page, rank, checked_at, found_count FROM rank_history '
+                'WHERE keyword = ? AND product_id = ?', self._key(keyword, product_id)
+            ).fetchone()
+            if row is None or time.time() - row[2] > max_age:
+                return None
+            if row[0]:
+                self._hits += 1
+        return {'page': row[0], 'rank': row[1], 'checked_at': row[2], 'found_count': row[3]}
+
+    def hint_page(self, keyword, product_id):
+        """검색 힌트 페이지 (마지막 발견 페이지, 없으면 None)"""
+        entry = self.lookup(keyword, product_id)
+        return entry['page'] if entry else None
+
+    def record(self, keyword, product_id, page=None, rank=None, pages_needed=None):
+        """검색 결과 기록 (미발견은 page=None → 다음 검색은 기본 Tier)
+
+        Args:
+            pages_needed: 검색 종료에 필요했던 페이지 수 (Tier 학습용 결과 로그, 기본: page)
+        """
+        now = time.time()
+        with self._lock:
+            self._records += 1
+            self._conn.execute(
+                'INSERT INTO search_outcomes (found_page, pages_needed, checked_at) VALUES (?, ?, ?)',
+                (page, pages_needed or page or 0, now)
+            )
+            if self._records % 1000 == 0:
+                # 결과 로그는 최근 TIER_WINDOW건만 유지
+                self._conn.execute('DELETE FROM search_outcomes WHERE id <= '
+                                   '(SELECT MAX(id) FROM search_outcomes) - ?', (TIER_WINDOW,))
+            self._conn.execute(
+                'INSERT INTO rank_history (keyword, product_id, page, rank, checked_at, found_count) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (keyword, product_id) DO UPDATE SET '
+                'page = excluded.page, rank = excluded.rank, checked_at = excluded.checked_at, '
+                'found_count = found_count + excluded.found_count',
+                (*self._key(keyword, product_id), page, rank, now, 1 if page else 0)
+            )
+
+    def recent_outcomes(self, limit=None):
+        """최근 검색 결과 로그 (Tier 학습용)
+
+        Args:
+            limit: 최대 건수 (기본 TIER_WINDOW)
+
+        Returns:
+            list: 시간순 (found_page, pages_needed) 목록
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT found_page, pages_needed FROM search_outcomes ORDER BY id DESC LIMIT ?',
+                (limit or TIER_WINDOW,)
+            ).fetchall()
+        return rows[::-1]
+
+    def prune(self, max_age=None):
+        """만료 기록 삭제
+
+        Returns:
+            int: 삭제 건수
+        """
+        max_age = HISTORY_MAX_AGE if max_age is None else max_age
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM rank_history WHERE checked_at < ?',
+                                        (time.time() - max_age,))
+            return cursor.rowcount
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM rank_history').fetchone()[0]
+
+    def stats(self):
+        """통계 스냅샷
+
+        Returns:
+            dict: {lookups, hits, records, hit_rate}
+        """
+        with self._lock:
+            return {
+                'lookups': self._lookups,
+                'hits': self._hits,
+                'records': self._records,
+                'hit_rate': self._hits / self._lookups if self._lookups else 0.0,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _split(pages, size):
+    """페이지 목록을 size개 이하 배치로 고르게 나눔 (끝에 1페이지짜리 Tier가 남지 않게, 빈 목록이면 [])"""
+    if not pages:
+        return []
+    count = -(-len(pages) // size)
+    base, extra = divmod(len(pages), count)
+    batches, pos = [], 0
+    for i in range(count):
+        n = base + (1 if i < extra else 0)
+        batches.append(pages[pos:pos + n])
+        pos += n
+    return batches
+
+
+def plan_batches(max_page=13, hint_page=None):
+    """검색 Tier 구성
+
+    - 기본: 학습 Tier (work.tiers, 표본 부족이면 [1], [2-5], [6-13])
+    - 힌트: 첫 Tier = 힌트 ± HINT_NEIGHBORS가 들어간 Tier당 최대 페이지 수 구간
+      - 1 ~ 힌트+HINT_NEIGHBORS가 한도 안이면 [1 ~ 힌트+HINT_NEIGHBORS]
+      - 넘으면 [힌트+HINT_NEIGHBORS-한도+1 ~ 힌트+HINT_NEIGHBORS], 앞 페이지는 다음 Tier
+        (발견돼도 actual_rank 계산에 필요한 앞 페이지는 받음 - _SearchState.start_tier)
+      - 나머지 페이지 (앞 페이지 먼저)는 한도 이하로 고르게 나눔
+      (예: 한도 8, 힌트 2 → [1-3], [4-8], [9-13] / 힌트 8 → [2-9], [1, 10-13])
+
+    Args:
+        max_page: 최대 페이지 (13페이지까지)
+        hint_page: 마지막 발견 페이지 (선택)
+
+    Returns:
+        list: 페이지 배치 목록 (빈 배치 제외)
+    """
+    last_page = min(max_page, 13)
+    if hint_page and 1 < hint_page <= last_page:
+        limit = get_tier_model().max_pages
+        end = min(hint_page + HINT_NEIGHBORS, last_page)
+        start = max(1, end - limit + 1)
+        rest = list(range(1, start)) + list(range(end + 1, last_page + 1))
+        return [list(range(start, end + 1))] + _split(rest, limit)
+    return get_tier_model().plan(last_page)
+
+
+# ============================================================================
+# 프로세스 공용 인스턴스 (set_history_db로 활성화)
+# ============================================================================
+_history = None
+
+
+def set_history_db(path):
+    """공용 이력 저장소 설정 (저장된 결과 로그로 Tier 모델도 채움)
+
+    Args:
+        path: SQLite 파일 경로 (None/빈 문자열이면 끔)
+    """
+    global _history
+    if _history is not None:
+        _history.close()
+    _history = RankHistory(path) if path else None
+    if _history is not None:
+        get_tier_model().load(_history.recent_outcomes())
+
+
+def get_history():
+    """공용 이력 저장소 (비활성이면 None)"""
+    return _history
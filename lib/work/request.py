@@ -6,11 +6,21 @@ Custom TLS 방식 전용 (impersonate 미사용)
 
 import time
 import string
+import asyncio
 from datetime import datetime
 from http.cookies import SimpleCookie
 from curl_cffi import requests
+from curl_cffi.curl import Curl, CURL_WRITEFUNC_ERROR
+from curl_cffi.const import CurlOpt
+
+# 진행 콜백(XFERINFOFUNCTION) 등록용 cffi 핸들 (curl_cffi Curl.setopt는 함수 포인터 옵션 미지원)
+try:
+    from curl_cffi._wrapper import ffi as _curl_ffi, lib as _curl_lib
+except ImportError:  # curl_cffi 내부 구조가 바뀌면 수신 청크 취소만 사용
+    _curl_ffi = _curl_lib = None
 
 from common.fingerprint import build_tls_extra_fp, build_tls_headers
+from work.cancel import RequestCancelled
 
 # ============================================================================
 # 전역 설정
@@ -42,7 +52,33 @@ def generate_trace_id():
     return ''.join(reversed(result))
 
 
-def make_request(url, cookies, tls_profile, proxy, referer=None, timeout=None):
+def _request_options(cookies, tls_profile, proxy, referer=None, timeout=None, deadline=None):
+    """요청 옵션 (Custom TLS, 동기/비동기 공용)"""
+    if timeout is None:
+        timeout = REQUEST_TIMEOUT
+    if deadline is not None:
+        timeout = deadline.timeout(timeout)
+
+    headers = build_tls_headers(tls_profile, referer)
+
+    # Custom TLS 방식 (tls_profiles 테이블 사용)
+    ja3_text = tls_profile['ja3_text']
+    akamai_text = tls_profile['akamai_text']
+    extra_fp = build_tls_extra_fp(tls_profile)
+
+    return {
+        'headers': headers,
+        'cookies': cookies,
+        'ja3': ja3_text,
+        'akamai': akamai_text,
+        'extra_fp': extra_fp,
+        'proxy': proxy,
+        'timeout': timeout,
+        'verify': False,
+    }
+
+
+def make_request(url, cookies, tls_profile, proxy, referer=None, timeout=None, cancel=None, deadline=None):
     """HTTP GET 요청 (Custom TLS)
 
     Args:
@@ -52,31 +88,130 @@ def make_request(url, cookies, tls_profile, proxy, referer=None, timeout=None):
         proxy: 프록시 URL (socks5://host:port)
         referer: Referer 헤더
         timeout: 타임아웃 (초)
+        cancel: CancelToken (선택, 취소 시 연결/대기/수신 단계와 무관하게 전송 중단)
+        deadline: Deadline (선택, 타임아웃을 남은 시간으로 줄임)
 
     Returns:
         Response 객체
+
+    Raises:
+        RequestCancelled: 전송 중 취소됨
+        DeadlineExceeded: 요청 전 마감 시간 초과
     """
-    if timeout is None:
-        timeout = REQUEST_TIMEOUT
+    options = _request_options(cookies, tls_profile, proxy, referer, timeout, deadline)
+    if cancel is None:
+        return requests.get(url, **options)
 
-    headers = build_tls_headers(tls_profile, referer)
+    receiver = _CancellableReceiver(cancel)
+    try:
+        if _curl_ffi is None:
+            resp = requests.get(url, content_callback=receiver, **options)
+        else:
+            # 진행 콜백은 수신 데이터가 없어도 호출됨 (연결/CONNECT/TLS/첫 바이트 대기 중 취소)
+            curl_options = {CurlOpt.NOPROGRESS: 0, CurlOpt.XFERINFOFUNCTION: receiver.progress}
+            with requests.Session(curl=_ProgressCurl(), curl_options=curl_options) as session:
+                resp = session.get(url, content_callback=receiver, **options)
+    except Exception as e:
+        if cancel.cancelled:
+            raise receiver.cancelled() from e
+        raise
+    return receiver.finish(resp)
+
+
+async def make_request_async(session, url, cookies, tls_profile, proxy, referer=None, timeout=None,
+                             cancel=None, deadline=None):
+    """HTTP GET 요청 (Custom TLS, AsyncSession)
+
+    세션 쿠키 저장소는 사용하지 않음 (요청마다 cookies만 전송, make_request와 동일)
+    취소 토큰은 요청 태스크 취소로 처리 (libcurl multi에서 핸들 제거 → 전송 단계와 무관하게 바로 중단)
 
-    # Custom TLS 방식 (tls_profiles 테이블 사용)
-    ja3_text = tls_profile['ja3_text']
-    akamai_text = tls_profile['akamai_text']
-    extra_fp = build_tls_extra_fp(tls_profile)
+    Args:
+        session: curl_cffi AsyncSession
+        url, cookies, tls_profile, proxy, referer, timeout, cancel, deadline: make_request와 동일
+
+    Returns:
+        Response 객체
+
+    Raises:
+        RequestCancelled: 전송 중 취소됨
+        DeadlineExceeded: 요청 전 마감 시간 초과
+    """
+    options = _request_options(cookies, tls_profile, proxy, referer, timeout, deadline)
+    if cancel is None:
+        return await session.get(url, discard_cookies=True, **options)
+
+    receiver = _CancellableReceiver(cancel)
+    loop = asyncio.get_running_loop()
+    request = asyncio.ensure_future(session.get(url, discard_cookies=True, content_callback=receiver, **options))
+
+    def abort():
+        try:
+            loop.call_soon_threadsafe(request.cancel)
+        except RuntimeError:  # 이벤트 루프 종료됨
+            pass
+
+    cancel.add_callback(abort)
+    try:
+        resp = await request
+    except asyncio.CancelledError:
+        # 토큰 취소로 요청 태스크만 취소된 경우 (바깥 태스크 취소는 그대로 전파)
+        task = asyncio.current_task()
+        if cancel.cancelled and not getattr(task, 'cancelling', lambda: 0)():
+            raise receiver.cancelled() from None
+        raise
+    except Exception as e:
+        if cancel.cancelled:
+            raise receiver.cancelled() from e
+        raise
+    finally:
+        cancel.remove_callback(abort)
+    return receiver.finish(resp)
+
+
+class _ProgressCurl(Curl):
+    """진행 콜백(XFERINFOFUNCTION)을 등록할 수 있는 Curl (요청 1건용)"""
+
+    def setopt(self, option, value):
+        if option == CurlOpt.XFERINFOFUNCTION:
+            # cffi 콜백은 요청이 끝날 때까지 참조 유지 (GC되면 libcurl이 해제된 포인터 호출)
+            self._xferinfo = _curl_ffi.callback('int(void *, int64_t, int64_t, int64_t, int64_t)', value)
+            return _curl_lib._curl_easy_setopt(self._curl, option, self._xferinfo)
+        return super().setopt(option, value)
+
+
+class _CancellableReceiver:
+    """요청 중 취소 확인
+
+    - 진행 콜백: 전송 단계와 무관하게 libcurl이 주기적으로 호출 (0이 아니면 전송/연결 중단)
+    - 수신 콜백: 청크마다 확인 (CURL_WRITEFUNC_ERROR → libcurl이 전송/연결 중단)
+    """
+
+    __slots__ = ('cancel', 'chunks', 'received', 'start')
+
+    def __init__(self, cancel):
+        self.cancel = cancel
+        self.chunks = []
+        self.received = 0
+        self.start = time.perf_counter()
+
+    def __call__(self, chunk):
+        if self.cancel.cancelled:
+            return CURL_WRITEFUNC_ERROR
+        self.chunks.append(chunk)
+        self.received += len(chunk)
+        return len(chunk)
+
+    def progress(self, clientp, dltotal, dlnow, ultotal, ulnow):
+        return 1 if self.cancel.cancelled else 0
+
+    def cancelled(self):
+        """취소로 중단된 요청 예외 (중단 전 수신 바이트/경과 시간)"""
+        return RequestCancelled(self.received, time.perf_counter() - self.start, self.cancel.reason)
 
-    return requests.get(
-        url,
-        headers=headers,
-        cookies=cookies,
-        ja3=ja3_text,
-        akamai=akamai_text,
-        extra_fp=extra_fp,
-        proxy=proxy,
-        timeout=timeout,
-        verify=False
-    )
+    def finish(self, resp):
+        """받은 청크로 응답 본문 구성"""
+        resp.content = b''.join(self.chunks)
+        return resp
 
 
 def parse_set_cookie_header(set_cookie_str):
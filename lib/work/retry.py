@@ -0,0 +1,110 @@
+"""
+재시도 예산/대기 모듈
+
+검색 한 건(check)의 재시도를 예산 안에서만 허용:
+- RetryBudget: 페이지 요청 재시도(fetch_page 내부 재시도 + Tier 후 실패 페이지 재시도) 공용 예산
+- backoff_delay: 지수 증가 + 지터 대기 (고정 0.5초 대신, 동시 재시도가 같은 시각에 몰리지 않게)
+- 통계: 사용한 재시도 수 / 복구한 페이지 수 / 예산 부족으로 포기한 재시도 수
+"""
+
+import random
+import threading
+
+# 검색 한 건의 재시도 예산 (요청 수)
+RETRY_BUDGET = 10
+
+# 재시도 대기: RETRY_BASE_DELAY × 2^attempt (최대 RETRY_MAX_DELAY), 절반은 지터
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 2.0
+
+
+def backoff_delay(attempt):
+    """재시도 대기 시간 (초)
+
+    Args:
+        attempt: 재시도 순번 (0부터)
+
+    Returns:
+        float: delay/2 ~ delay 사이 (delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY × 2^attempt))
+    """
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class RetryBudget:
+    """검색 한 건의 재시도 예산 (스레드 안전, 같은 검색의 페이지 요청이 공유)
+
+    사용법:
+        budget = RetryBudget()
+        if budget.spend():   # 예산이 남아 있으면 1 차감
+            ...재시도...
+    """
+
+    __slots__ = ('total', 'spent', 'denied', '_lock')
+
+    def __init__(self, total=None):
+        """
+        Args:
+            total: 재시도 가능 횟수 (기본 RETRY_BUDGET)
+        """
+        self.total = RETRY_BUDGET if total is None else max(0, int(total))
+        self.spent = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def spend(self):
+        """재시도 1회 차감
+
+        Returns:
+            bool: 재시도 가능 여부 (예산 소진이면 False)
+        """
+        with self._lock:
+            if self.spent >= self.total:
+                self.denied += 1
+                ok = False
+            else:
+                self.spent += 1
+                ok = True
+        with _stats_lock:
+            _stats['spent' if ok else 'denied'] += 1
+        return ok
+
+    @property
+    def remaining(self):
+        return self.total - self.spent
+
+
+# ============================================================================
+# 재시도 통계 (프로세스 공용)
+# ============================================================================
+_stats_lock = threading.Lock()
+_stats = {
+    'spent': 0,         # 사용한 재시도 수
+    'denied': 0,        # 예산 부족으로 포기한 재시도 수
+    'recovered': 0,     # 재시도로 성공한 페이지 수
+}
+
+
+def record_recovered():
+    """재시도로 성공한 페이지 기록"""
+    with _stats_lock:
+        _stats['recovered'] += 1
+
+
+def get_retry_stats():
+    """재시도 통계 스냅샷
+
+    Returns:
+        dict: {spent, denied, recovered, per_recovery: 복구 페이지당 재시도 수}
+    """
+    with _stats_lock:
+        s = dict(_stats)
+    s['per_recovery'] = s['spent'] / s['recovered'] if s['recovered'] else 0.0
+    return s
+
+
+def reset_retry_stats():
+    """통계 초기화"""
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
@@ -4,144 +4,172 @@
 Coupang 상품 검색 및 순위 확인
 """
 
+import time
 from urllib.parse import quote
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed, wait, FIRST_COMPLETED
 
 from work.request import make_request, parse_response_cookies, generate_trace_id, timestamp
+from work.executor import get_fetch_executor
+from work.cancel import CancelToken, RequestCancelled, record_fetch, record_abort, record_skip
+from work.retry import RetryBudget, backoff_delay, record_recovered
+from work.errors import (
+    classify_exception, classify_status, record_error, RETRYABLE_KINDS, BLOCKING_KINDS, PROXY_FAILURE_KINDS,
+    ERR_H2_STREAM, ERR_PROXY, ERR_TRUNCATED, ERR_DEADLINE, ERR_CANCELLED, ERR_OTHER,
+)
+from common.deadline import Deadline, DeadlineExceeded
+from work.history import plan_batches
+from work.classify import classify_response, PAGE_OK, PAGE_NO_RESULTS, PAGE_EMPTY, PAGE_CHALLENGE, PAGE_TRUNCATED
 from extractor.search_extractor import ProductExtractor
+from extractor.product import Product, product_ids, to_id, id_text
+from common.cache import LRUCache, content_hash
+from common.cookie import CookieJar
+from common.fingerprint import get_profile_platform
+from work.search_cache import get_search_cache
 
+# ============================================================================
+# 페이지 캐시 (응답 본문 해시 → 추출한 랭킹 상품)
+# 같은 본문을 다시 파싱하지 않음 (기본 꺼짐)
+# - 실제 응답은 요청마다 searchId/traceId가 본문에 들어가 본문 해시가 거의 겹치지 않음
+# - 켜면 매 페이지 본문 해시 + 전체 추출/표시 필드 확정 + 상품 복사가 들어가서
+#   타겟 발견 시 추출 중단(스트림)과 표시 필드 지연 계산을 쓰지 않음
+# ============================================================================
+PAGE_CACHE_SIZE = 0  # 최대 페이지 수 (0이면 캐시 안함)
+
+_page_cache = LRUCache(PAGE_CACHE_SIZE)
 
-def fetch_page(page_num, query, trace_id, cookies, tls_profile, proxy, save_html=False, max_retries=2):
-    """단일 페이지 검색 (TLS 에러 시 재시도)
+
+def set_page_cache_size(size):
+    """페이지 캐시 크기 변경
 
     Args:
-        page_num: 페이지 번호
-        query: 검색어
-        trace_id: 쿠팡 traceId
-        cookies: 쿠키 딕셔너리
-        tls_profile: TLS 프로필 레코드 (tls_profiles 테이블)
-        proxy: 프록시 URL
-        save_html: HTML 원본 저장 여부
-        max_retries: TLS 에러 시 재시도 횟수 (기본: 2)
+        size: 최대 페이지 수 (0이면 캐시 끔)
+    """
+    global PAGE_CACHE_SIZE
+    PAGE_CACHE_SIZE = max(0, int(size))
+    _page_cache.resize(PAGE_CACHE_SIZE)
+
+
+def get_page_cache_stats():
+    """페이지 캐시 통계 스냅샷
 
     Returns:
-        dict: {page, success, products, size, error, response_cookies, response_cookies_full, html, retried}
+        dict: {size, capacity, hits, misses, evictions, hit_rate}
     """
-    import time
-
-    url = f'https://www.coupang.com/np/search?q={quote(query)}&traceId={trace_id}&channel=user&listSize=72&page={page_num}'
-
-    # 재시도 대상 에러 패턴
-    # 동일 프록시로 다른 페이지가 성공하면 일시적 네트워크 문제일 수 있음
-    RETRYABLE_ERRORS = [
-        'curl: (35)',           # TLS connect error
-        'TLS connect error',
-        'TLSV1_ALERT',
-        'SSL routines',
-        'curl: (56)',           # Recv failure
-        'curl: (28)',           # Timeout
-        'timed out',
-        'curl: (7)',            # Connection refused
-        'Could not connect',
-        'curl: (92)',           # HTTP/2 stream error
-        'HTTP/2 stream',
-    ]
-
-    last_error = None
-    retried = 0
-
-    for attempt in range(max_retries + 1):
-        try:
-            resp = make_request(url, cookies, tls_profile, proxy)
-            size = len(resp.content)
-
-            response_cookies, response_cookies_full = parse_response_cookies(resp)
-
-            if resp.status_code == 200 and size > 5000:
-                html_text = resp.text
-                result = ProductExtractor.extract_products_from_html(html_text)
-
-                # "검색결과 없음" 페이지 감지 (쿠팡 정상 응답이지만 상품 없음)
-                is_no_results_page = (
-                    '에 대한 검색결과가 없습니다' in html_text or
-                    '검색결과가 없습니다' in html_text
-                )
-
-                return {
-                    'page': page_num,
-                    'success': True,
-                    'products': result['ranking'],
-                    'size': size,
-                    'response_cookies': response_cookies,
-                    'response_cookies_full': response_cookies_full,
-                    'html': html_text if save_html else None,
-                    'is_no_results_page': is_no_results_page,
-                    'retried': retried
-                }
-            elif resp.status_code == 403:
-                return {
-                    'page': page_num,
-                    'success': False,
-                    'products': [],
-                    'error': 'BLOCKED_403',
-                    'response_cookies': response_cookies,
-                    'response_cookies_full': response_cookies_full,
-                    'html': None,
-                    'retried': retried
-                }
-            elif size <= 5000:
-                return {
-                    'page': page_num,
-                    'success': False,
-                    'products': [],
-                    'error': f'CHALLENGE_{size}B',
-                    'response_cookies': response_cookies,
-                    'response_cookies_full': response_cookies_full,
-                    'html': None,
-                    'retried': retried
-                }
-            else:
-                return {
-                    'page': page_num,
-                    'success': False,
-                    'products': [],
-                    'error': f'STATUS_{resp.status_code}',
-                    'response_cookies': response_cookies,
-                    'response_cookies_full': response_cookies_full,
-                    'html': None,
-                    'retried': retried
-                }
+    return _page_cache.stats()
 
-        except Exception as e:
-            error_msg = str(e)[:150]
-            last_error = error_msg
 
-            # 재시도 가능한 에러인지 확인
-            is_retryable = any(pattern in error_msg for pattern in RETRYABLE_ERRORS)
+# 마감 시간 초과로 요청하지 않은/중단한 페이지 에러
+DEADLINE_ERROR = 'DEADLINE_EXCEEDED'
 
-            if is_retryable and attempt < max_retries:
-                retried += 1
-                time.sleep(0.5)  # 짧은 대기 후 재시도
-                continue
 
-            # 재시도 불가능하거나 최대 재시도 도달
-            return {
-                'page': page_num,
-                'success': False,
-                'products': [],
-                'error': error_msg,
-                'response_cookies': {},
-                'response_cookies_full': [],
-                'html': None,
-                'retried': retried
-            }
-
-    # max_retries 도달 (모든 재시도 실패)
+def _search_url(query, trace_id, page_num):
+    return f'https://www.coupang.com/np/search?q={quote(query)}&traceId={trace_id}&channel=user&listSize=72&page={page_num}'
+
+
+def _page_result(page_num, resp, matcher=None, save_html=False, retried=0, retry_truncated=False, cache_key=None):
+    """응답 → 페이지 결과 (fetch_page 결과 형식)
+
+    Args:
+        retry_truncated: 잘린 응답이면 결과 대신 None 반환 (호출 측에서 재시도)
+        cache_key: (검색어, 플랫폼) - 지정 시 성공 페이지를 검색 결과 페이지 캐시에 저장
+
+    Returns:
+        dict 또는 None
+    """
+    size = len(resp.content)
+
+    response_cookies, response_cookies_full = parse_response_cookies(resp)
+
+    # 원본 bytes로 페이지 유형 분류 (디코딩/추출 전)
+    page_type = classify_response(resp.status_code, resp.content)
+
+    if page_type in (PAGE_OK, PAGE_NO_RESULTS, PAGE_EMPTY):
+        # 원본 bytes 그대로 추출 (상품 리스트 구간만 디코딩)
+        if cache_key is not None and page_type != PAGE_EMPTY:
+            # 캐시에는 페이지 전체 랭킹 저장 (다음 검색의 타겟은 다를 수 있음)
+            ranking = _full_ranking(resp.content, resp.encoding)
+            get_search_cache().put(cache_key[0], page_num, cache_key[1], page_type, ranking, size)
+            products, product_count, match = _match_ranking(ranking, matcher)
+        else:
+            products, product_count, match = _extract_ranking(resp.content, matcher, resp.encoding)
+
+        return {
+            'page': page_num,
+            'success': True,
+            'page_type': page_type,
+            'products': products,
+            'product_count': product_count,
+            'match': match,
+            'size': size,
+            'response_cookies': response_cookies,
+            'response_cookies_full': response_cookies_full,
+            # HTML 원본은 발견 페이지만 사용 (스크린샷용) → 매칭 페이지만 디코딩
+            'html': resp.text if save_html and match else None,
+            'retried': retried
+        }
+
+    error_kind = classify_status(resp.status_code, challenge=page_type == PAGE_CHALLENGE,
+                                 truncated=page_type == PAGE_TRUNCATED)
+    record_error(error_kind)
+
+    if error_kind == ERR_TRUNCATED and retry_truncated:
+        # 잘린 응답은 수신 실패와 같게 재시도
+        return None
+
+    if page_type == PAGE_CHALLENGE:
+        error = 'BLOCKED_403' if resp.status_code == 403 else f'CHALLENGE_{size}B'
+    elif page_type == PAGE_TRUNCATED:
+        error = f'TRUNCATED_{size}B'
+    else:
+        error = f'STATUS_{resp.status_code}'
+
     return {
         'page': page_num,
         'success': False,
+        'page_type': page_type,
         'products': [],
-        'error': last_error or 'MAX_RETRIES',
+        'error': error,
+        'error_kind': error_kind,
+        'response_cookies': response_cookies,
+        'response_cookies_full': response_cookies_full,
+        'html': None,
+        'retried': retried
+    }
+
+
+def _retry_delay(deadline=None, attempt=0):
+    """재시도 전 대기 시간 (지수 증가 + 지터, 마감 시간 이내로만)"""
+    delay = backoff_delay(attempt)
+    return delay if deadline is None else min(delay, deadline.remaining())
+
+
+def _spend_retry(retry_budget):
+    """재시도 예산 차감 (예산 없으면 항상 허용)"""
+    return retry_budget is None or retry_budget.spend()
+
+
+def _retry_wait(cancel, delay):
+    """재시도 전 대기 (취소되면 바로 반환)"""
+    if cancel is None:
+        time.sleep(delay)
+    else:
+        cancel.wait(delay)
+
+
+def _request_cookies(cookies):
+    """요청 쿠키 {name: value} (CookieJar면 현재 스냅샷)"""
+    return cookies.snapshot() if type(cookies) is CookieJar else cookies
+
+
+def _error_result(page_num, error, retried=0, kind=ERR_OTHER):
+    """요청 예외/재시도 소진 결과 (kind: work.errors 에러 종류)"""
+    return {
+        'page': page_num,
+        'success': False,
+        'page_type': None,
+        'products': [],
+        'error': error,
+        'error_kind': kind,
         'response_cookies': {},
         'response_cookies_full': [],
         'html': None,
@@ -149,68 +177,993 @@ def fetch_page(page_num, query, trace_id, cookies, tls_profile, proxy, save_html
     }
 
 
-def _match_product(product, target_product_id, target_item_id=None, target_vendor_item_id=None):
-    """상품 매칭 우선순위 체크
+def _search_cache_key(query, tls_profile, save_html=False):
+    """검색 결과 페이지 캐시 키 (검색어, 플랫폼), 캐시 꺼짐/HTML 저장 검색이면 None"""
+    if save_html or not get_search_cache().enabled:
+        return None
+    return query, get_profile_platform(tls_profile)
+
+
+def _cached_page_result(page_num, cache_key, matcher=None):
+    """검색 결과 페이지 캐시 적중 시 페이지 결과 (fetch_page 결과 형식, size 0, 미적중이면 None)"""
+    if cache_key is None:
+        return None
+    entry = get_search_cache().get(cache_key[0], page_num, cache_key[1])
+    if entry is None:
+        return None
+    products, product_count, match = _match_ranking(entry['ranking'], matcher)
+    return {
+        'page': page_num,
+        'success': True,
+        'page_type': entry['page_type'],
+        'products': products,
+        'product_count': product_count,
+        'match': match,
+        'size': 0,
+        'cached': True,
+        'response_cookies': {},
+        'response_cookies_full': [],
+        'html': None,
+        'retried': 0
+    }
 
-    우선순위:
-    1. product_id + item_id + vendor_item_id (완전 매칭)
-    2. product_id + vendor_item_id
-    3. product_id + item_id
-    4. product_id만
-    5. vendor_item_id만
-    6. item_id만
+
+def _cancelled_result(page_num, cancel, retried=0):
+    """취소로 중단한 페이지 결과"""
+    return _error_result(page_num, f'CANCELLED_{cancel.reason}' if cancel.reason else 'CANCELLED', retried,
+                         ERR_CANCELLED)
+
+
+def fetch_page(page_num, query, trace_id, cookies, tls_profile, proxy, save_html=False, max_retries=2,
+               matcher=None, cancel=None, deadline=None, retry_budget=None):
+    """단일 페이지 검색 (TLS 에러 시 재시도)
+
+    Args:
+        page_num: 페이지 번호
+        query: 검색어
+        trace_id: 쿠팡 traceId
+        cookies: 쿠키 딕셔너리 또는 CookieJar (시도마다 최신 스냅샷 사용)
+        tls_profile: TLS 프로필 레코드 (tls_profiles 테이블)
+        proxy: 프록시 URL
+        save_html: HTML 원본 저장 여부 (매칭 상품이 있는 페이지만)
+        max_retries: TLS 에러 시 재시도 횟수 (기본: 2, 재시도 대기는 지수 증가 + 지터)
+        matcher: TargetMatcher (선택)
+                 지정 시 모든 타겟이 매칭되는 상품에서 추출을 멈추고 products는 그 상품까지만 포함
+        cancel: CancelToken (선택, 취소 시 전송 중단/파싱/재시도 생략 → 'CANCELLED_{사유}' 에러)
+        deadline: Deadline (선택, 요청 타임아웃/재시도 대기를 남은 시간으로 제한,
+                  초과 시 재시도 없이 DEADLINE_EXCEEDED 에러)
+        retry_budget: RetryBudget (선택, 재시도마다 1 차감, 소진 시 재시도 없이 마지막 에러 반환)
+
+    검색 결과 페이지 캐시(work.search_cache)가 켜져 있으면 (검색어, 페이지, 플랫폼)으로 먼저 조회
+    (적중 시 요청 없이 cached=True, size=0 결과) 하고 성공 페이지는 저장
 
     Returns:
-        tuple: (매칭 여부, 매칭 타입) 또는 (False, None)
+        dict: {page, success, page_type, products, product_count, match, size, error, error_kind,
+               response_cookies, response_cookies_full, html, retried}
+            - page_type: 응답 분류 (work.classify PAGE_*, 요청 예외 시 None)
+            - error_kind: 실패 종류 (work.errors ERR_*, 성공 시 없음)
+            - product_count: 페이지의 랭킹 상품 수 (추출을 멈춰도 전체 수)
+            - match: {타겟 인덱스: (상품, 매칭 타입)} (타겟별 페이지 내 첫 매칭, 없으면 빈 dict)
+    """
+    fetch = _PageFetch(page_num, query, trace_id, tls_profile, save_html, max_retries, matcher,
+                       cancel, deadline, retry_budget)
+    while fetch.begin():
+        try:
+            resp = make_request(fetch.url, _request_cookies(cookies), tls_profile, proxy,
+                                cancel=cancel, deadline=deadline)
+            retry = fetch.on_response(resp)
+        except Exception as e:
+            retry = fetch.on_error(e)
+        if retry:
+            _retry_wait(cancel, fetch.delay)  # 짧은 대기 후 재시도
+    return fetch.result
+
+
+class _PageFetch:
+    """단일 페이지 요청 진행 상태 (fetch_page/fetch_page_async 공용)
+
+    캐시 조회, 취소/마감 확인, 응답 분류, 재시도 여부/대기 시간, 결과 생성을 담당.
+    요청/대기(I/O)는 호출 측이 실행:
+
+        fetch = _PageFetch(page_num, query, trace_id, tls_profile, ...)
+        while fetch.begin():
+            try:
+                retry = fetch.on_response(make_request(fetch.url, ...))
+            except Exception as e:
+                retry = fetch.on_error(e)
+            if retry:
+                sleep(fetch.delay)  # 취소되면 바로 깨우기
+        return fetch.result
+    """
+
+    __slots__ = ('page_num', 'save_html', 'max_retries', 'matcher', 'cancel', 'deadline', 'retry_budget',
+                 'cache_key', 'url', 'attempt', 'retried', 'delay', 'last_error', 'last_kind', 'result', '_start')
+
+    def __init__(self, page_num, query, trace_id, tls_profile, save_html=False, max_retries=2, matcher=None,
+                 cancel=None, deadline=None, retry_budget=None):
+        """
+        Args:
+            fetch_page와 동일 (cookies/proxy는 요청하는 호출 측에서 사용)
+        """
+        self.page_num = page_num
+        self.save_html = save_html
+        self.max_retries = max_retries
+        self.matcher = matcher
+        self.cancel = cancel
+        self.deadline = deadline
+        self.retry_budget = retry_budget
+        self.cache_key = _search_cache_key(query, tls_profile, save_html)
+        self.url = _search_url(query, trace_id, page_num)
+        self.attempt = 0
+        self.retried = 0
+        self.delay = 0.0  # 다음 시도 전 대기 시간 (초)
+        self.last_error = None
+        self.last_kind = ERR_OTHER
+        self._start = 0.0
+        # 검색 결과 페이지 캐시 적중이면 요청 없이 결과 확정
+        self.result = _cached_page_result(page_num, self.cache_key, matcher)
+
+    def begin(self):
+        """다음 요청 시도 전 확인
+
+        Returns:
+            bool: 요청 진행 여부 (False면 result 확정)
+        """
+        if self.result is not None:
+            return False
+        if self.attempt > self.max_retries:
+            # max_retries 도달 (모든 재시도 실패)
+            return self._finish(_error_result(self.page_num, self.last_error or 'MAX_RETRIES', self.retried,
+                                              self.last_kind))
+        if self.cancel is not None and self.cancel.cancelled:
+            record_skip()
+            return self._finish(_cancelled_result(self.page_num, self.cancel, self.retried))
+        if self.deadline is not None and self.deadline.expired:
+            return self._finish(_error_result(self.page_num, DEADLINE_ERROR, self.retried, ERR_DEADLINE))
+        self._start = time.perf_counter()
+        return True
+
+    def on_response(self, resp):
+        """응답 처리
+
+        Returns:
+            bool: 재시도 여부 (True면 delay만큼 대기 후 begin부터 다시)
+        """
+        record_fetch(len(resp.content), time.perf_counter() - self._start)
+
+        if self.cancel is not None and self.cancel.cancelled:
+            # 수신 직후 취소됨: 파싱 생략
+            record_skip(parse=True)
+            return self._finish(_cancelled_result(self.page_num, self.cancel, self.retried))
+
+        can_retry = self.attempt < self.max_retries and (self.retry_budget is None or self.retry_budget.remaining > 0)
+        result = _page_result(self.page_num, resp, self.matcher, self.save_html, self.retried,
+                              retry_truncated=can_retry, cache_key=self.cache_key)
+        if result is None:
+            self.last_error, self.last_kind = f'TRUNCATED_{len(resp.content)}B', ERR_TRUNCATED
+            if not _spend_retry(self.retry_budget):
+                return self._finish(_error_result(self.page_num, self.last_error, self.retried, self.last_kind))
+            return self._retry()
+        return self._finish(result)
+
+    def on_error(self, exc):
+        """요청 예외 처리 (응답 처리 중 예외 포함)
+
+        Returns:
+            bool: 재시도 여부
+        """
+        if isinstance(exc, RequestCancelled):
+            record_abort(exc.received, exc.elapsed)
+            return self._finish(_cancelled_result(self.page_num, self.cancel, self.retried))
+        if isinstance(exc, DeadlineExceeded):
+            return self._finish(_error_result(self.page_num, DEADLINE_ERROR, self.retried, ERR_DEADLINE))
+
+        error_msg = str(exc)[:150]
+        self.last_error = error_msg
+
+        # 남은 시간으로 줄인 타임아웃에 걸린 경우는 프록시 문제가 아님
+        if self.deadline is not None and self.deadline.expired:
+            return self._finish(_error_result(self.page_num, DEADLINE_ERROR, self.retried, ERR_DEADLINE))
+
+        # curl 에러 코드로 분류 (재시도 가능 여부)
+        self.last_kind, _ = classify_exception(exc)
+        record_error(self.last_kind)
+        if self.last_kind in RETRYABLE_KINDS and self.attempt < self.max_retries and _spend_retry(self.retry_budget):
+            return self._retry()
+
+        # 재시도 불가능하거나 최대 재시도 도달
+        return self._finish(_error_result(self.page_num, error_msg, self.retried, self.last_kind))
+
+    def _retry(self):
+        self.delay = _retry_delay(self.deadline, self.retried)
+        self.retried += 1
+        self.attempt += 1
+        return True
+
+    def _finish(self, result):
+        self.result = result
+        return False
+
+
+def _extract_ranking(html, matcher=None, encoding='utf-8'):
+    """랭킹 상품 추출 (matcher 지정 시 모든 타겟이 매칭된 상품에서 조기 종료)
+
+    Args:
+        html: 검색 페이지 HTML (str 또는 응답 원본 bytes)
+        matcher: TargetMatcher (선택)
+        encoding: bytes 입력의 인코딩
+
+    Returns:
+        tuple: (상품 리스트, 페이지 랭킹 상품 수, {타겟 인덱스: (상품, 매칭 타입)})
+    """
+    if PAGE_CACHE_SIZE:
+        return _extract_ranking_cached(html, matcher, encoding)
+
+    if matcher is None:
+        products = ProductExtractor.extract_products(html, encoding=encoding)['ranking']
+        return products, len(products), {}
+
+    stream = ProductExtractor.iter_ranking_products(html, encoding=encoding)
+    products = []
+    matches = {}
+    for product in stream:
+        products.append(product)
+        if _add_matches(matches, product, matcher):
+            # 나머지는 개수만 확인 (페이지별 상품 수 유지)
+            return products, stream.yielded + stream.count_remaining(), matches
+    return products, len(products), matches
+
+
+def _extract_ranking_cached(html, matcher=None, encoding='utf-8'):
+    """페이지 캐시를 거치는 랭킹 상품 추출
+
+    캐시에는 페이지 전체 랭킹 상품(표시 필드 확정)을 저장하고 호출마다 복사본을 반환
+    (검색 모듈이 _page, actual_rank 등을 기록하므로 공유 객체는 수정하지 않음)
     """
-    p_id = str(product.get('productId', ''))
-    i_id = str(product.get('itemId', ''))
-    v_id = str(product.get('vendorItemId', ''))
+    return _match_ranking(_full_ranking(html, encoding), matcher)
+
+
+def _full_ranking(html, encoding='utf-8'):
+    """페이지 전체 랭킹 상품 튜플 (표시 필드 확정, 페이지 캐시가 켜져 있으면 캐시 경유)"""
+    key = (content_hash(html), encoding) if PAGE_CACHE_SIZE else None
+    ranking = _page_cache.get(key) if key is not None else None
+    if ranking is None:
+        ranking = tuple(product.materialize() for product in
+                        ProductExtractor.extract_products(html, encoding=encoding)['ranking'])
+        if key is not None:
+            _page_cache.put(key, ranking)
+    return ranking
+
 
-    t_p_id = str(target_product_id) if target_product_id else ''
-    t_i_id = str(target_item_id) if target_item_id else ''
-    t_v_id = str(target_vendor_item_id) if target_vendor_item_id else ''
+def _match_ranking(ranking, matcher=None):
+    """공유 랭킹 튜플 → (상품 복사본 리스트, 상품 수, 매칭) (모든 타겟 매칭 시 조기 종료)"""
+    products = []
+    matches = {}
+    for product in ranking:
+        product = product.clone()
+        products.append(product)
+        if matcher is not None and _add_matches(matches, product, matcher):
+            return products, len(ranking), matches
+    return products, len(ranking), matches
 
+
+def _add_matches(matches, product, matcher):
+    """상품의 타겟 매칭을 페이지 매칭에 추가 (타겟별 첫 매칭만)
+
+    Returns:
+        bool: 모든 타겟이 매칭됨 (추출 중단 가능)
+    """
+    hits = matcher(product)
+    if not hits:
+        return False
+    for idx, match_type in hits:
+        if idx not in matches:
+            matches[idx] = (product, match_type)
+    return len(matches) == len(matcher)
+
+
+def _match_type(p_id, i_id, v_id, t_p_id, t_i_id, t_v_id):
+    """정규화 ID 매칭 우선순위 (_match_product 참고)
+
+    Returns:
+        str: 매칭 타입 또는 None
+    """
     # 1순위: 3개 모두 매칭
     if t_p_id and t_i_id and t_v_id:
         if p_id == t_p_id and i_id == t_i_id and v_id == t_v_id:
-            return (True, 'full_match')
+            return 'full_match'
 
     # 2순위: product_id + vendor_item_id
     if t_p_id and t_v_id:
         if p_id == t_p_id and v_id == t_v_id:
-            return (True, 'product_vendor')
+            return 'product_vendor'
 
     # 3순위: product_id + item_id
     if t_p_id and t_i_id:
         if p_id == t_p_id and i_id == t_i_id:
-            return (True, 'product_item')
+            return 'product_item'
 
     # 4순위: product_id만
     if t_p_id and p_id == t_p_id:
-        return (True, 'product_only')
+        return 'product_only'
 
     # 5순위: vendor_item_id만
     if t_v_id and v_id == t_v_id:
-        return (True, 'vendor_only')
+        return 'vendor_only'
 
     # 6순위: item_id만
     if t_i_id and i_id == t_i_id:
-        return (True, 'item_only')
+        return 'item_only'
+
+    return None
+
+
+def _match_product(product, target_product_id, target_item_id=None, target_vendor_item_id=None):
+    """상품 매칭 우선순위 체크
+
+    우선순위:
+    1. product_id + item_id + vendor_item_id (완전 매칭)
+    2. product_id + vendor_item_id
+    3. product_id + item_id
+    4. product_id만
+    5. vendor_item_id만
+    6. item_id만
+
+    Returns:
+        tuple: (매칭 여부, 매칭 타입) 또는 (False, None)
+    """
+    # 정규화 ID로 비교 (Product는 정수 ID 그대로, dict는 변환)
+    if type(product) is Product:
+        p_id, i_id, v_id = product.product_id, product.item_id, product.vendor_item_id
+    else:
+        p_id, i_id, v_id = product_ids(product)
+
+    match_type = _match_type(p_id, i_id, v_id, to_id(target_product_id), to_id(target_item_id),
+                             to_id(target_vendor_item_id))
+    return (True, match_type) if match_type else (False, None)
 
-    return (False, None)
+
+def _target_ids(target):
+    """타겟 → 정규화 ID (product_id, item_id, vendor_item_id)
+
+    Args:
+        target: dict {product_id, item_id, vendor_item_id} 또는 (product_id, item_id, vendor_item_id)
+    """
+    if isinstance(target, dict):
+        return (to_id(target.get('product_id')), to_id(target.get('item_id')),
+                to_id(target.get('vendor_item_id')))
+    target = tuple(target) + (None, None)
+    return to_id(target[0]), to_id(target[1]), to_id(target[2])
+
+
+class TargetMatcher:
+    """여러 타겟 상품 매칭 (ID 해시 인덱스)
+
+    상품마다 타겟 수 × 6단계 우선순위를 비교하지 않고, 상품의 ID 3개로
+    productId/vendorItemId/itemId 인덱스에서 후보 타겟만 찾은 뒤
+    후보에 대해서만 우선순위를 판단 (_match_type, 단일 타겟과 같은 규칙)
+
+    사용법:
+        matcher = TargetMatcher([{'product_id': '123', 'vendor_item_id': '456'}, ...])
+        matcher(product)  # [(타겟 인덱스, 매칭 타입), ...] (인덱스 순)
+    """
+
+    __slots__ = ('targets', '_by_product', '_by_item', '_by_vendor')
+
+    def __init__(self, targets):
+        self.targets = [_target_ids(t) for t in targets]
+        self._by_product = {}
+        self._by_item = {}
+        self._by_vendor = {}
+        for idx, (t_p_id, t_i_id, t_v_id) in enumerate(self.targets):
+            if t_p_id:
+                self._by_product.setdefault(t_p_id, []).append(idx)
+            if t_i_id:
+                self._by_item.setdefault(t_i_id, []).append(idx)
+            if t_v_id:
+                self._by_vendor.setdefault(t_v_id, []).append(idx)
+
+    def __len__(self):
+        return len(self.targets)
+
+    def __call__(self, product):
+        if type(product) is Product:
+            p_id, i_id, v_id = product.product_id, product.item_id, product.vendor_item_id
+        else:
+            p_id, i_id, v_id = product_ids(product)
+
+        by_product = self._by_product.get(p_id)
+        by_item = self._by_item.get(i_id)
+        by_vendor = self._by_vendor.get(v_id)
+        if not (by_product or by_item or by_vendor):
+            return ()  # 대부분의 상품 (후보 타겟 없음)
+
+        candidates = by_product or by_item or by_vendor
+        if (by_product is not None) + (by_item is not None) + (by_vendor is not None) > 1:
+            candidates = sorted(set().union(by_product or (), by_item or (), by_vendor or ()))
+        hits = []
+        for idx in candidates:
+            match_type = _match_type(p_id, i_id, v_id, *self.targets[idx])
+            if match_type:
+                hits.append((idx, match_type))
+        return hits
+
+
+def _pages_label(pages):
+    """Tier 페이지 표시 (예: '1페이지', '2-9페이지', '1, 10-13페이지')"""
+    ranges = []
+    for p in pages:
+        if ranges and p == ranges[-1][1] + 1:
+            ranges[-1][1] = p
+        else:
+            ranges.append([p, p])
+    return ', '.join(str(a) if a == b else f'{a}-{b}' for a, b in ranges) + '페이지'
+
+
+def _page_position(products, product):
+    """페이지 내 순위 (rank 파라미터 순, 같으면 추출 순서, 1부터)
+
+    Args:
+        products: 페이지 추출 상품 (매칭 상품까지)
+        product: products 안의 상품
+    """
+    key = product.get('rank') or 999
+    position = 1
+    after = False
+    for other in products:
+        if other is product:
+            after = True
+            continue
+        other_key = other.get('rank') or 999
+        if other_key < key or (other_key == key and not after):
+            position += 1
+    return position
+
+
+class _SearchState:
+    """검색 진행 상태 (동기/비동기 검색 공용)
+
+    페이지 결과를 받아 발견/차단/검색결과 없음 판단, 쿠키/트래픽 집계,
+    최종 결과 dict 생성을 담당. 요청 실행 방식(스레드/asyncio)과 무관함.
+    """
+
+    def __init__(self, query, targets, cookies, max_page=13, verbose=True, save_html=False, total_timeout=20,
+                 deadline=None, hint_page=None, keep_products=False):
+        self.start_time = time.time()
+        self.query = query
+        self.max_page = max_page
+        self.verbose = verbose
+        self.save_html = save_html
+        # 검색 마감: total_timeout과 상위 마감(check_rank 전체 예산) 중 빠른 쪽
+        self.deadline = deadline.within(total_timeout) if deadline is not None else Deadline(total_timeout)
+
+        self.trace_id = generate_trace_id()
+        if verbose:
+            print(f"\n[{timestamp()}] 검색 중... (traceId: {self.trace_id})")
+
+        # 워커에서 상품 매칭 (모든 타겟이 매칭된 상품에서 추출 중단, 타겟 ID는 한 번만 정규화)
+        self.matcher = TargetMatcher(targets)
+        self.found = [None] * len(self.matcher)  # 타겟별 발견 상품
+        self.found_html = [None] * len(self.matcher)  # 타겟별 상품 발견 페이지 HTML
+        self.id_match_type = [None] * len(self.matcher)  # 타겟별 매칭 타입
+        self.found_position = [None] * len(self.matcher)  # 타겟별 발견 페이지 내 순위
+        # 전체 상품 보관은 선택 (actual_rank는 페이지별 상품 수 누적 + 페이지 내 순위로 계산)
+        self.keep_products = keep_products
+        self.all_products = []
+        self.products_seen = 0
+        self.blocked = False
+        self.block_error = ''
+        self.page_errors = []  # 각 페이지별 에러 수집
+        self.page_counts = {}  # 페이지별 상품 수 {1: 72, 2: 72, ...}
+        self.total_bytes = 0
+        self.pages_searched = 0  # 성공적으로 검색한 페이지 수
+        # 검색 결과 없음 플래그 (1페이지 0개면 조기 종료)
+        self.no_results = False
+
+        # 배치 정의 (기본 [1], [2-5], [6-13], 이력 힌트가 있으면 힌트 ±1페이지 구간 먼저 - plan_batches)
+        self.batches = plan_batches(max_page, hint_page)
+        self.tiers_searched = 0
+
+        # 쿠키 저장소: 요청은 스냅샷을 읽고 응답 쿠키는 (name, domain, path) 기준 병합 (다음 요청에 반영)
+        self.cookies = CookieJar(cookies)
+
+        # 재시도 예산: 페이지 내부 재시도 + 실패 페이지 재시도 공용 (검색 한 건 단위)
+        self.retry_budget = RetryBudget()
+
+    @property
+    def all_found(self):
+        return all(self.found)
+
+    @property
+    def done(self):
+        return bool(self.all_found or self.blocked or self.no_results)
+
+    def stop_page(self):
+        """배치 중단 시 끝까지 받을 마지막 페이지 (모두 발견: 마지막 발견 페이지, 차단: 0)"""
+        return max(found['page'] for found in self.found) if self.all_found else 0
+
+    def _elapsed(self):
+        return time.time() - self.start_time
+
+    def check_timeout(self, action=None):
+        """전체 타임아웃 체크 (초과 시 차단 처리)
+
+        Args:
+            action: 출력 문구 (예: '조기 종료', None이면 출력 안함)
+
+        Returns:
+            bool: 타임아웃 여부
+        """
+        if not self.deadline.expired:
+            return False
+        elapsed = self._elapsed()
+        self.blocked = True
+        self.block_error = f'TOTAL_TIMEOUT_{int(elapsed)}s'
+        if self.verbose and action:
+            print(f"  🛑 전체 타임아웃 ({int(elapsed)}초) → {action}")
+        return True
+
+    def start_tier(self, batch_idx):
+        """배치 시작
+
+        모두 발견한 뒤에도 마지막 발견 페이지보다 앞인데 아직 받지 않은 페이지는 요청
+        (힌트 Tier가 1페이지부터 시작하지 않는 경우, actual_rank에 필요)
+
+        Returns:
+            list: 요청할 페이지 (빈 목록이면 검색 종료)
+        """
+        pages = self.batches[batch_idx]
+        if self.all_found and not self.blocked:
+            stop_page = self.stop_page()
+            pages = [p for p in pages if p < stop_page and p not in self.page_counts]
+            if not pages or self.deadline.expired:
+                return []
+        elif self.done or self.check_timeout('조기 종료'):
+            return []
+        self.tiers_searched += 1
+        if self.verbose:
+            print(f"  Tier {batch_idx + 1}: {_pages_label(pages)}")
+        return pages
+
+    def _collect_cookies(self, result):
+        # 응답 쿠키 수집 (필수)
+        self.cookies.update(result['response_cookies_full'])
+        self.total_bytes += result.get('size', 0)
+
+    def _add_products(self, result):
+        self.products_seen += len(result['products'])
+        if not self.keep_products:
+            return
+        for product in result['products']:
+            product['_page'] = result['page']
+            self.all_products.append(product)
+
+    def _set_found(self, result, label=''):
+        """페이지 매칭 반영 (미발견 타겟 또는 더 앞 페이지 매칭만)
+
+        Returns:
+            bool: 새로 반영한 매칭 여부
+        """
+        updated = False
+        for idx, (product, match_type) in sorted(result['match'].items()):
+            found = self.found[idx]
+            if found is not None and found['page'] <= result['page']:
+                continue
+            product['_page'] = product['page'] = result['page']
+            self.found[idx] = product
+            self.found_position[idx] = _page_position(result['products'], product)
+            self.id_match_type[idx] = match_type
+            # 스크린샷용 HTML 저장
+            self.found_html[idx] = result['html'] if self.save_html and result.get('html') else None
+            updated = True
+            if self.verbose:
+                target = f" [{self.matcher.targets[idx][0]}]" if len(self.found) > 1 else ''
+                print(f"  [{timestamp()}] ✅ {label}발견! Page {result['page']}, Rank {product['rank']} "
+                      f"({match_type}){target}")
+        return updated
+
+    def add_page(self, result, batch_idx):
+        """배치 페이지 결과 반영 (완료 순서대로)
+
+        Returns:
+            bool: True면 배치 중단 (발견 또는 차단, 나머지 요청 취소)
+        """
+        self._collect_cookies(result)
+
+        if result['success']:
+            self.pages_searched = max(self.pages_searched, result['page'])  # 최대 페이지 추적
+            # 페이지별 (상품 수, 재시도 횟수)
+            retried = result.get('retried', 0)
+            self.page_counts[result['page']] = (result['product_count'], retried)
+            if retried:
+                record_recovered()
+
+            # products는 매칭 상품까지만 포함 (fetch_page에서 조기 종료)
+            self._add_products(result)
+
+            if result['match'] and self._set_found(result):
+                # 모든 타겟 발견 시 현재 배치의 나머지 요청 취소
+                return self.all_found
+
+            if self.verbose:
+                retry_info = f" (retry:{result['retried']})" if result.get('retried', 0) > 0 else ""
+                cache_info = " (캐시)" if result.get('cached') else ""
+                print(f"    Page {result['page']:2d}: {result['product_count']}개{retry_info}{cache_info}")
+            return False
+
+        error = result.get('error', '')
+        retried = result.get('retried', 0)
+        self.page_counts[result['page']] = (-1, retried)  # 에러 페이지는 -1로 표시
+        if error:
+            self.page_errors.append({'page': result['page'], 'error': error, 'retried': result.get('retried', 0)})
+        if self.verbose:
+            retry_info = f" (retry:{result.get('retried', 0)})" if result.get('retried', 0) > 0 else ""
+            print(f"    Page {result['page']:2d}: ❌ {error}{retry_info}")
+
+        # 챌린지(403 포함) 페이지, HTTP/2 스트림 에러는 차단으로 처리 (가장 흔한 차단 방식)
+        kind = result.get('error_kind')
+        if kind in BLOCKING_KINDS:
+            self.blocked = True
+            self.block_error = 'HTTP2_PROTOCOL_ERROR' if kind == ERR_H2_STREAM else error
+            return True
+
+        # 첫 Tier 첫 페이지 (기본 1페이지) 타임아웃/연결 실패/프록시 에러 시 조기 종료 (프록시 문제)
+        if batch_idx == 0 and result['page'] == self.batches[0][0] and kind in PROXY_FAILURE_KINDS:
+            self.blocked = True
+            self.block_error = 'PROXY_TIMEOUT'  # 서버 보고용 기존 값 유지 (프록시 에러 포함)
+            if self.verbose:
+                print(f"  🛑 {result['page']}페이지 {'프록시 에러' if kind == ERR_PROXY else '타임아웃'} → 조기 종료")
+            return True
+
+        return False
+
+    def add_late(self, results):
+        """모두 발견 후 완료된 앞 페이지 반영 (배치의 완료 결과, 페이지 순서)
+
+        - 앞 페이지 상품 수가 빠지면 actual_rank가 작게 계산됨
+        - 앞 페이지에서도 매칭되면 그 페이지가 실제 첫 발견 위치
+        """
+        if not self.all_found:
+            return
+        stop_page = self.stop_page()
+        for late in results:
+            if not late['success'] or late['page'] >= stop_page or late['page'] in self.page_counts:
+                continue
+
+            self.total_bytes += late.get('size', 0)
+            self.pages_searched = max(self.pages_searched, late['page'])
+            self.page_counts[late['page']] = (late['product_count'], late.get('retried', 0))
+            self._add_products(late)
+
+            if late['match']:
+                self._set_found(late, label='앞 페이지에서 ')
+
+    def retry_pages(self, pages):
+        """배치 완료 후 재시도할 실패 페이지 (모두 발견/blocked가 아닌 경우만)"""
+        if self.all_found or self.blocked:
+            return []
+        # 타임아웃 체크
+        if self.check_timeout('재시도 생략'):
+            return []
+        # 현재 배치에서 실패한 페이지 찾기 (page_counts에서 -1인 페이지)
+        failed_pages = [p for p in pages if self.page_counts.get(p, (0, 0))[0] == -1]
+        if failed_pages and self.verbose:
+            print(f"  🔄 실패 페이지 재시도: {failed_pages}")
+        return failed_pages
+
+    def can_retry(self):
+        """재시도 전 체크 (모두 발견/차단/타임아웃이면 중단)"""
+        if self.all_found or self.blocked:
+            return False
+        return not self.check_timeout()
+
+    def plan_retries(self, pages):
+        """배치 실패 페이지 재시도 계획 (재시도 패스, 페이지당 1번씩)
+
+        페이지마다 재시도 예산 1 차감 (소진되면 남은 페이지는 재시도 안 함)
+
+        Returns:
+            list: 다시 요청할 페이지
+        """
+        retry_pages = self.retry_pages(pages)
+        if not retry_pages or not self.can_retry():
+            return []
+        planned = []
+        for p in retry_pages:
+            if not self.retry_budget.spend():
+                if self.verbose:
+                    print(f"  ⚠️ 재시도 예산 소진 → {p}페이지부터 재시도 생략")
+                break
+            planned.append(p)
+        return planned
+
+    def stop_scope(self):
+        """add_page가 검색 종료를 알린 뒤 배치 요청 취소 기준
+
+        Returns:
+            tuple: (끝까지 받을 마지막 페이지, 취소 사유)
+                   모두 발견: (마지막 발견 페이지, 'found'), 차단: (0, 'blocked')
+        """
+        return (self.stop_page(), 'found') if self.all_found else (0, 'blocked')
+
+    def take_retry(self, retry_page, result):
+        """재시도 패스 결과 반영 (취소된 요청, 모두 발견 후 마지막 발견 페이지 뒤 결과는 무시)
+
+        Returns:
+            int 또는 None: 모두 발견되면 끝까지 받을 마지막 페이지 (뒤 재시도는 취소), 아니면 None
+        """
+        if result.get('error_kind') == ERR_CANCELLED or (self.all_found and retry_page > self.stop_page()):
+            return None
+        self.add_retry(retry_page, result)
+        return self.stop_page() if self.all_found else None
+
+    def add_retry(self, retry_page, result):
+        """실패 페이지 재시도 결과 반영"""
+        self._collect_cookies(result)
+
+        if result['success']:
+            self.pages_searched = max(self.pages_searched, result['page'])
+            retried = result.get('retried', 0) + self.page_counts.get(retry_page, (0, 0))[1] + 1  # 기존 재시도 + 배치 재시도
+            self.page_counts[result['page']] = (result['product_count'], retried)
+            self._add_products(result)
+            record_recovered()
+
+            if not (result['match'] and self._set_found(result, label='[재시도] ')) and self.verbose:
+                print(f"    Page {result['page']:2d}: {result['product_count']}개 (재시도 성공)")
+        else:
+            # 재시도도 실패 - 기존 에러 유지, 재시도 횟수만 업데이트
+            prev_retried = self.page_counts.get(retry_page, (0, 0))[1]
+            self.page_counts[retry_page] = (-1, prev_retried + 1)
+            if self.verbose:
+                print(f"    Page {retry_page:2d}: ❌ 재시도 실패")
+
+    def end_tier(self, batch_idx, results):
+        """1페이지를 포함한 Tier 완료 후 검색 결과가 0개면 조기 종료
+
+        no_results는 쿠팡이 명시적으로 "검색결과 없음"을 반환한 경우에만 True
+        에러(타임아웃 등)로 인한 0개는 no_results = False
+        (힌트 Tier가 뒤 페이지부터면 그 Tier가 비어도 1페이지 Tier까지 진행)
+
+        Args:
+            results: 배치의 완료 결과 (취소된 요청 제외)
+        """
+        if 1 in self.batches[batch_idx] and self.products_seen == 0 and not self.blocked:
+            # 에러 없이 성공한 요청 중 "검색결과 없음" 페이지가 있는지 확인
+            is_coupang_no_results = any(
+                r.get('page_type') == PAGE_NO_RESULTS for r in results if r.get('success')
+            )
+
+            if is_coupang_no_results:
+                self.no_results = True  # 쿠팡이 명시적으로 검색결과 없음 반환
+                if self.verbose:
+                    print(f"  ⚠️ 쿠팡 검색결과 없음 - 조기 종료")
+            else:
+                self.no_results = False  # 에러로 인한 0개 (타임아웃 등)
+                if self.verbose:
+                    print(f"  ⚠️ 검색 결과 없음 - 조기 종료")
+
+    def actual_rank(self, idx):
+        """타겟의 실제 순위 = 앞 페이지 상품 수 합 + 발견 페이지 내 순위 (미발견이면 None)
+
+        앞 페이지는 상품 수(product_count)만 사용, 에러 페이지(-1)는 0개로 계산
+        """
+        found = self.found[idx]
+        if not found:
+            return None
+        before = sum(count for page, (count, _) in self.page_counts.items() if page < found['page'] and count > 0)
+        return before + self.found_position[idx]
+
+    def result(self):
+        """최종 결과 (search_products 반환 형식)"""
+        all_products = self.all_products
+        page_counts = self.page_counts
+        blocked = self.blocked
+        block_error = self.block_error
+
+        if self.keep_products:
+            # 보관한 전체 상품에 실제 순위 기록 (반환은 기존 dict 형태, json 직렬화 가능)
+            all_products.sort(key=lambda p: (p['_page'], p.get('rank') or 999))
+            for i, product in enumerate(all_products):
+                product['actual_rank'] = i + 1
+            all_products = [product.to_dict() for product in all_products]
+
+        targets = []
+        for idx, found in enumerate(self.found):
+            t_p_id, t_i_id, t_v_id = self.matcher.targets[idx]
+            actual_rank = self.actual_rank(idx)
+            if found:
+                # 발견 상품은 기존 dict 형태로 반환 (표시 필드 확정, 페이지 DOM 참조 해제)
+                found['actual_rank'] = actual_rank
+                found = found.to_dict()
+            targets.append({
+                'product_id': id_text(t_p_id),
+                'item_id': id_text(t_i_id),
+                'vendor_item_id': id_text(t_v_id),
+                'found': found,
+                'page': found['page'] if found else None,
+                'actual_rank': actual_rank,
+                'id_match_type': self.id_match_type[idx],
+                'found_html': self.found_html[idx],
+            })
+
+        # 페이지별 상품 수 정렬 (1페이지부터)
+        sorted_page_counts = dict(sorted(page_counts.items()))
+
+        # 에러 페이지(-1)가 1개라도 있으면 blocked 처리 (미발견 타겟이 있을 때만)
+        # 완성도를 맞추지 못하면 실패 - 에러 페이지에 상품이 있었을 수 있음
+        # page_counts 값은 (count, retried) 튜플
+        # count: 0 = 정상 응답이지만 상품 없음, -1 = 에러
+        if not self.all_found and not blocked and page_counts:
+            error_pages = sum(1 for v in page_counts.values() if v[0] == -1)
+            total_pages = len(page_counts)
+            if error_pages > 0:
+                blocked = True
+                block_error = f'INCOMPLETE_{error_pages}/{total_pages}'
+
+        # 튜플을 문자열로 변환: (63, 0) -> "63", (63, 2) -> "63(r2)", (-1, 1) -> "-1(r1)"
+        page_counts_str = {}
+        for page, (count, retried) in sorted_page_counts.items():
+            if retried > 0:
+                page_counts_str[page] = f"{count}(r{retried})"
+            else:
+                page_counts_str[page] = str(count)
+
+        return {
+            'targets': targets,  # 타겟별 결과 (입력 순서)
+            'all_products': all_products,  # keep_products=True인 경우만 (기본: 빈 리스트)
+            'blocked': blocked,
+            'block_error': block_error,
+            'page_errors': self.page_errors,
+            'page_counts': page_counts_str,  # 페이지별 상품 수 {1: "72", 2: "72(r1)", 13: "-1(r2)"}
+            'total_bytes': self.total_bytes,
+            'trace_id': self.trace_id,
+            'response_cookies': self.cookies.response_cookies(),
+            'response_cookies_full': self.cookies.response_cookies_full(),  # (name, domain, path)별 최신 1개
+            'no_results': self.no_results,  # 쿠팡이 "검색결과 없음" 응답 (정상적인 미발견)
+            'pages_searched': self.pages_searched,  # 성공적으로 검색 완료한 최대 페이지
+            'tiers_searched': self.tiers_searched  # 실행한 Tier 수 (요청 왕복 횟수)
+        }
+
+
+def _retry_failed_pages(state, pages, query, tls_profile, proxy, save_html=False):
+    """배치 실패 페이지 재시도 (공용 실행기로 동시 요청, 페이지당 1번씩)
+
+    - 재시도 계획/결과 반영은 _SearchState.plan_retries/take_retry
+    - 재시도로 모두 발견되면 마지막 발견 페이지 뒤 재시도는 취소 (앞 페이지는 actual_rank에 필요)
+    """
+    retry_pages = state.plan_retries(pages)
+    if not retry_pages:
+        return
+
+    executor = get_fetch_executor()
+    tokens = {p: CancelToken() for p in retry_pages}
+    futures = {
+        executor.submit(
+            proxy, fetch_page, p, query, state.trace_id, state.cookies, tls_profile, proxy, save_html,
+            max_retries=1, matcher=state.matcher, cancel=tokens[p], deadline=state.deadline,
+            retry_budget=state.retry_budget
+        ): p for p in retry_pages
+    }
+
+    keep_until = None
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=futures.get):
+                if future.cancelled():
+                    continue
+                stop = state.take_retry(futures[future], future.result())
+                if stop is not None and keep_until is None:
+                    # 뒤 재시도는 중단만 하고 기다리지 않음
+                    keep_until = stop
+                    _cancel_pages(futures, tokens, keep_until, 'found')
+                    pending = {f for f in pending if futures[f] <= keep_until}
+    finally:
+        if pending:  # 예외로 빠져나온 경우: 남은 요청 중단 (완료는 실행기에서 정리)
+            _cancel_pages(futures, tokens, 0, 'error')
+
+
+def _cancel_pages(futures, tokens, keep_until, reason):
+    """keep_until 뒤 페이지 요청 취소 (시작 전이면 실행 취소, 진행 중이면 토큰으로 전송 중단)
+
+    취소한 요청의 완료는 기다리지 않음 (공용 실행기가 정리, 결과는 사용 안 함)
+    """
+    for future, page in futures.items():
+        if page > keep_until:
+            future.cancel()
+            tokens[page].cancel(reason)
+
+
+def search_products(query, targets, cookies, tls_profile, proxy, max_page=13, verbose=True, save_html=False,
+                    total_timeout=20, deadline=None, hint_page=None, keep_products=False):
+    """여러 타겟 상품 검색 (한 번의 페이지 순회로 모든 타겟 매칭)
+
+    같은 키워드의 여러 상품을 타겟별로 따로 검색하지 않고 페이지를 한 번만 요청/추출.
+    타겟 매칭은 ID 해시 인덱스 (TargetMatcher), 우선순위는 search_product와 같음
+    (타겟별로 페이지 순서상 첫 매칭 상품, 그 상품의 최고 우선순위 매칭 타입).
+    모든 타겟을 발견하면 검색 종료 (마지막 발견 페이지보다 뒤 페이지 요청 취소).
+
+    Args:
+        query: 검색어
+        targets: 타겟 목록, 각 타겟은 dict {product_id, item_id, vendor_item_id}
+                 또는 (product_id, item_id, vendor_item_id) (item_id/vendor_item_id 선택)
+        나머지: search_product와 동일
+
+    Returns:
+        dict: search_product 결과에서 found/actual_rank/id_match_type/found_html 대신
+            targets: [{product_id, item_id, vendor_item_id, found, page, actual_rank,
+                       id_match_type, found_html}, ...] (입력 순서)
+            - blocked=True면 미발견 타겟 결과는 확정 아님 (발견 타겟 결과는 유효)
+    """
+    state = _SearchState(query, targets, cookies, max_page=max_page, verbose=verbose, save_html=save_html,
+                         total_timeout=total_timeout, deadline=deadline, hint_page=hint_page,
+                         keep_products=keep_products)
+
+    for batch_idx in range(len(state.batches)):
+        pages = state.start_tier(batch_idx)
+        if not pages:
+            break
+
+        # 공용 실행기에 페이지 작업 제출 (전체/프록시별 동시 요청 수 제한)
+        # 페이지별 취소 토큰: 발견/차단 시 진행 중인 전송도 중단
+        executor = get_fetch_executor()
+        tokens = {p: CancelToken() for p in pages}
+        futures = {
+            executor.submit(
+                proxy, fetch_page, p, query, state.trace_id, state.cookies, tls_profile, proxy, save_html,
+                matcher=state.matcher, cancel=tokens[p], deadline=state.deadline, retry_budget=state.retry_budget
+            ): p for p in pages
+        }
+
+        keep_until = max(pages)
+        try:
+            for future in as_completed(futures):
+                if state.add_page(future.result(), batch_idx):
+                    # 모두 발견 시 마지막 발견 페이지 뒤만, 차단 시 전부 취소 (앞 페이지는 actual_rank에 필요)
+                    keep_until, reason = state.stop_scope()
+                    _cancel_pages(futures, tokens, keep_until, reason)
+                    break
+        finally:
+            # 남은 앞 페이지 완료 대기 (완료된 앞 페이지/검색결과 없음 판단에 사용)
+            # 취소한 뒤 페이지는 기다리지 않음 (검색 결과를 중단된 요청에 묶지 않음)
+            wait([f for f, p in futures.items() if p <= keep_until])
+
+        results = [f.result() for f in sorted(futures, key=futures.get)
+                   if futures[f] <= keep_until and not f.cancelled()]
+        state.add_late(results)
+
+        # 실패 페이지 동시 재시도 (1번씩, 재시도 예산 안에서)
+        _retry_failed_pages(state, pages, query, tls_profile, proxy, save_html)
+
+        state.end_tier(batch_idx, results)
+
+    return state.result()
+
+
+def _single_result(result):
+    """search_products 결과 → search_product 결과 형식 (타겟 1개)"""
+    result = dict(result)
+    target = result.pop('targets')[0]
+    result['found'] = target['found']
+    result['actual_rank'] = target['actual_rank']
+    result['id_match_type'] = target['id_match_type']  # 매칭 타입 추가
+    result['found_html'] = target['found_html']
+    return result
 
 
 def search_product(query, target_product_id, cookies, tls_profile, proxy,
                    target_item_id=None, target_vendor_item_id=None,
                    max_page=13, verbose=True, save_html=False,
-                   total_timeout=20):
+                   total_timeout=20, deadline=None, hint_page=None, keep_products=False):
     """상품 검색 (점진적 배치)
 
     배치 전략:
     - Tier 1: 1페이지만 (대부분 여기서 발견)
     - Tier 2: 2-5페이지 동시 (미발견 시)
     - Tier 3: 6-13페이지 동시 (미발견 시)
+    - 표본이 쌓이면 발견 페이지 분포로 학습한 Tier (work.tiers)
+    - hint_page 지정 시: 힌트 ±1페이지를 포함한 구간 동시 → 앞 페이지/나머지 (work.history.plan_batches)
 
     매칭 우선순위:
     1. product_id + item_id + vendor_item_id (완전 매칭)
@@ -220,6 +1173,9 @@ def search_product(query, target_product_id, cookies, tls_profile, proxy,
     5. vendor_item_id만
     6. item_id만
 
+    여러 타겟: search_products (한 번의 페이지 순회로 매칭, 이 함수는 타겟 1개 래퍼)
+    비동기 버전: work.search_async.search_product_async (같은 배치/결과 형식)
+
     Args:
         query: 검색어
         target_product_id: 타겟 상품 ID
@@ -232,12 +1188,18 @@ def search_product(query, target_product_id, cookies, tls_profile, proxy,
         verbose: 상세 출력
         save_html: HTML 저장 여부 (스크린샷용)
         total_timeout: 전체 타임아웃 (초, 기본 20초)
+        deadline: 상위 마감 시간 (Deadline, 선택)
+                  total_timeout과 함께 적용, 모든 요청 타임아웃/재시도 대기가 남은 시간 이내
+        hint_page: 마지막 발견 페이지 (순위 이력, 선택)
+        keep_products: 전체 상품 보관 (all_products, 상품별 actual_rank 기록)
+                       기본은 보관하지 않고 발견 상품 순위만 페이지별 상품 수 누적으로 계산
 
     Returns:
         dict: {
             found: 발견 상품 정보 또는 None,
             id_match_type: 매칭 타입 (full_match, product_vendor, product_item, product_only, vendor_only, item_only),
-            all_products: 모든 상품 리스트,
+            all_products: 모든 상품 리스트 (keep_products=True인 경우만, 아니면 빈 리스트)
+                          (found와 같이 상품 dict, json 직렬화 가능),
             blocked: 차단 여부,
             block_error: 차단 에러 메시지,
             total_bytes: 총 트래픽,
@@ -246,285 +1208,7 @@ def search_product(query, target_product_id, cookies, tls_profile, proxy,
             found_html: 상품 발견 페이지 HTML (save_html=True인 경우)
         }
     """
-    import time
-    start_time = time.time()
-
-    trace_id = generate_trace_id()
-    if verbose:
-        print(f"\n[{timestamp()}] 검색 중... (traceId: {trace_id})")
-
-    found = None
-    found_html = None  # 상품 발견 페이지 HTML
-    id_match_type = None  # 매칭 타입
-    all_products = []
-    blocked = False
-    block_error = ''
-    page_errors = []  # 각 페이지별 에러 수집
-    page_counts = {}  # 페이지별 상품 수 {1: 72, 2: 72, ...}
-    total_bytes = 0
-    all_response_cookies = {}
-    all_response_cookies_full = []
-    pages_searched = 0  # 성공적으로 검색한 페이지 수
-
-    # 배치 정의 (빈 배치 제외)
-    batches = [
-        [1],                    # Tier 1: 1페이지 단독
-        [2, 3, 4, 5],           # Tier 2: 2-5페이지 동시
-        list(range(6, min(max_page + 1, 14)))  # Tier 3: 6-13페이지 동시
-    ]
-    batches = [b for b in batches if b]  # 빈 배치 제거
-
-    cookies_ref = cookies.copy()  # 쿠키 업데이트용
-
-    # 검색 결과 없음 플래그 (1페이지 0개면 조기 종료)
-    no_results = False
-
-    for batch_idx, pages in enumerate(batches):
-        if found or blocked or no_results:
-            break
-
-        # 전체 타임아웃 체크
-        elapsed = time.time() - start_time
-        if elapsed >= total_timeout:
-            blocked = True
-            block_error = f'TOTAL_TIMEOUT_{int(elapsed)}s'
-            if verbose:
-                print(f"  🛑 전체 타임아웃 ({int(elapsed)}초) → 조기 종료")
-            break
-
-        if verbose:
-            tier_name = ['1페이지', '2-5페이지', f'6-{max_page}페이지'][batch_idx]
-            print(f"  Tier {batch_idx + 1}: {tier_name}")
-
-        with ThreadPoolExecutor(max_workers=len(pages)) as executor:
-            futures = {
-                executor.submit(
-                    fetch_page, p, query, trace_id, cookies_ref, tls_profile, proxy, save_html
-                ): p for p in pages
-            }
-
-            for future in as_completed(futures):
-                result = future.result()
-
-                # 응답 쿠키 수집 (필수)
-                all_response_cookies.update(result['response_cookies'])
-                cookies_ref.update(result['response_cookies'])  # 다음 요청에 반영
-                all_response_cookies_full.extend(result['response_cookies_full'])
-
-                total_bytes += result.get('size', 0)
-
-                if result['success']:
-                    pages_searched = max(pages_searched, result['page'])  # 최대 페이지 추적
-                    # 페이지별 (상품 수, 재시도 횟수)
-                    retried = result.get('retried', 0)
-                    page_counts[result['page']] = (len(result['products']), retried)
-
-                    for product in result['products']:
-                        product['_page'] = result['page']
-                        all_products.append(product)
-
-                        if not found:
-                            matched, match_type = _match_product(
-                                product, target_product_id, target_item_id, target_vendor_item_id
-                            )
-                            if matched:
-                                found = product
-                                found['page'] = result['page']
-                                id_match_type = match_type
-                                # 스크린샷용 HTML 저장
-                                if save_html and result.get('html'):
-                                    found_html = result['html']
-                                if verbose:
-                                    print(f"  [{timestamp()}] ✅ 발견! Page {result['page']}, Rank {product['rank']} ({match_type})")
-                                # 상품 발견 시 현재 배치의 나머지 요청 취소 및 루프 종료
-                                for f in futures:
-                                    f.cancel()
-                                break  # for product 루프 종료
-
-                    # 상품 발견 시 for future 루프 종료
-                    if found:
-                        break
-
-                    if verbose:
-                        retry_info = f" (retry:{result['retried']})" if result.get('retried', 0) > 0 else ""
-                        print(f"    Page {result['page']:2d}: {len(result['products'])}개{retry_info}")
-                else:
-                    error = result.get('error', '')
-                    retried = result.get('retried', 0)
-                    page_counts[result['page']] = (-1, retried)  # 에러 페이지는 -1로 표시
-                    if error:
-                        page_errors.append({'page': result['page'], 'error': error, 'retried': result.get('retried', 0)})
-                    if verbose:
-                        retry_info = f" (retry:{result.get('retried', 0)})" if result.get('retried', 0) > 0 else ""
-                        print(f"    Page {result['page']:2d}: ❌ {error}{retry_info}")
-
-                    # HTTP/2 스트림 에러도 차단으로 처리 (가장 흔한 차단 방식)
-                    if (error == 'BLOCKED_403' or
-                        error.startswith('CHALLENGE_') or
-                        'HTTP/2 stream' in error or
-                        'curl: (92)' in error):
-                        blocked = True
-                        if 'HTTP/2 stream' in error or 'curl: (92)' in error:
-                            block_error = 'HTTP2_PROTOCOL_ERROR'
-                        else:
-                            block_error = error
-                        for f in futures:
-                            f.cancel()
-                        break
-
-                    # 1페이지 타임아웃 시 조기 종료 (프록시 문제)
-                    if (batch_idx == 0 and result['page'] == 1 and
-                        ('timed out' in error.lower() or 'curl: (28)' in error or
-                         'Could not connect' in error or 'curl: (7)' in error)):
-                        blocked = True
-                        block_error = 'PROXY_TIMEOUT'
-                        if verbose:
-                            print(f"  🛑 1페이지 타임아웃 → 조기 종료")
-                        for f in futures:
-                            f.cancel()
-                        break
-
-        # 배치 완료 후 실패한 페이지 재시도 (found/blocked가 아닌 경우만)
-        if not found and not blocked:
-            # 타임아웃 체크
-            elapsed = time.time() - start_time
-            if elapsed >= total_timeout:
-                blocked = True
-                block_error = f'TOTAL_TIMEOUT_{int(elapsed)}s'
-                if verbose:
-                    print(f"  🛑 전체 타임아웃 ({int(elapsed)}초) → 재시도 생략")
-            else:
-                # 현재 배치에서 실패한 페이지 찾기 (page_counts에서 -1인 페이지)
-                failed_pages = [p for p in pages if page_counts.get(p, (0, 0))[0] == -1]
-
-                if failed_pages and verbose:
-                    print(f"  🔄 실패 페이지 재시도: {failed_pages}")
-
-                # 실패 페이지 순차적으로 재시도 (1번씩)
-                for retry_page in failed_pages:
-                    # 재시도 전 타임아웃 체크
-                    elapsed = time.time() - start_time
-                    if found or blocked or elapsed >= total_timeout:
-                        if elapsed >= total_timeout:
-                            blocked = True
-                            block_error = f'TOTAL_TIMEOUT_{int(elapsed)}s'
-                        break
-
-                    result = fetch_page(retry_page, query, trace_id, cookies_ref, tls_profile, proxy, save_html, max_retries=1)
-
-                    # 응답 쿠키 수집
-                    all_response_cookies.update(result['response_cookies'])
-                    cookies_ref.update(result['response_cookies'])
-                    all_response_cookies_full.extend(result['response_cookies_full'])
-                    total_bytes += result.get('size', 0)
-
-                    if result['success']:
-                        pages_searched = max(pages_searched, result['page'])
-                        retried = result.get('retried', 0) + page_counts.get(retry_page, (0, 0))[1] + 1  # 기존 재시도 + 배치 재시도
-                        page_counts[result['page']] = (len(result['products']), retried)
-
-                        for product in result['products']:
-                            product['_page'] = result['page']
-                            all_products.append(product)
-
-                            if not found:
-                                matched, match_type = _match_product(
-                                    product, target_product_id, target_item_id, target_vendor_item_id
-                                )
-                                if matched:
-                                    found = product
-                                    found['page'] = result['page']
-                                    id_match_type = match_type
-                                    if save_html and result.get('html'):
-                                        found_html = result['html']
-                                    if verbose:
-                                        print(f"  [{timestamp()}] ✅ 발견! Page {result['page']}, Rank {product['rank']} ({match_type}) [재시도]")
-                                    break
-
-                        if verbose and not found:
-                            print(f"    Page {result['page']:2d}: {len(result['products'])}개 (재시도 성공)")
-                    else:
-                        # 재시도도 실패 - 기존 에러 유지, 재시도 횟수만 업데이트
-                        prev_retried = page_counts.get(retry_page, (0, 0))[1]
-                        page_counts[retry_page] = (-1, prev_retried + 1)
-                        if verbose:
-                            print(f"    Page {retry_page:2d}: ❌ 재시도 실패")
-
-        # Tier 1 완료 후 검색 결과가 0개면 조기 종료
-        # no_results는 쿠팡이 명시적으로 "검색결과 없음"을 반환한 경우에만 True
-        # 에러(타임아웃 등)로 인한 0개는 no_results = False
-        if batch_idx == 0 and len(all_products) == 0 and not blocked:
-            # 에러 없이 성공한 요청 중 "검색결과 없음" 페이지가 있는지 확인
-            is_coupang_no_results = any(
-                f.result().get('is_no_results_page', False)
-                for f in futures if f.done() and not f.cancelled() and f.result().get('success')
-            )
-
-            if is_coupang_no_results:
-                no_results = True  # 쿠팡이 명시적으로 검색결과 없음 반환
-                if verbose:
-                    print(f"  ⚠️ 쿠팡 검색결과 없음 - 조기 종료")
-            else:
-                no_results = False  # 에러로 인한 0개 (타임아웃 등)
-                if verbose:
-                    print(f"  ⚠️ 검색 결과 없음 - 조기 종료")
-
-    # 실제 순위 계산
-    all_products.sort(key=lambda p: (p['_page'], p.get('rank') or 999))
-    for i, product in enumerate(all_products):
-        product['actual_rank'] = i + 1
-
-    actual_rank = None
-    if found:
-        # found 상품의 actual_rank 찾기 (uniqueKey로 매칭)
-        found_key = found.get('uniqueKey')
-        for product in all_products:
-            if product.get('uniqueKey') == found_key:
-                actual_rank = product['actual_rank']
-                break
-
-    # 페이지별 상품 수 정렬 (1페이지부터)
-    sorted_page_counts = dict(sorted(page_counts.items()))
-
-    # 에러 페이지(-1)가 1개라도 있으면 blocked 처리 (상품 미발견 시에만)
-    # 완성도를 맞추지 못하면 실패 - 에러 페이지에 상품이 있었을 수 있음
-    # page_counts 값은 (count, retried) 튜플
-    # count: 0 = 정상 응답이지만 상품 없음, -1 = 에러
-    if not found and not blocked and page_counts:
-        error_pages = sum(1 for v in page_counts.values() if v[0] == -1)
-        total_pages = len(page_counts)
-        if error_pages > 0:
-            blocked = True
-            block_error = f'INCOMPLETE_{error_pages}/{total_pages}'
-
-    # 튜플을 문자열로 변환: (63, 0) -> "63", (63, 2) -> "63(r2)", (-1, 1) -> "-1(r1)"
-    page_counts_str = {}
-    for page, (count, retried) in sorted_page_counts.items():
-        if retried > 0:
-            page_counts_str[page] = f"{count}(r{retried})"
-        else:
-            page_counts_str[page] = str(count)
-
-    return {
-        'found': found,
-        'actual_rank': actual_rank,
-        'id_match_type': id_match_type,  # 매칭 타입 추가
-        'all_products': all_products,
-        'blocked': blocked,
-        'block_error': block_error,
-        'page_errors': page_errors,
-        'page_counts': page_counts_str,  # 페이지별 상품 수 {1: "72", 2: "72(r1)", 13: "-1(r2)"}
-        'total_bytes': total_bytes,
-        'trace_id': trace_id,
-        'response_cookies': all_response_cookies,
-        'response_cookies_full': all_response_cookies_full,
-        'found_html': found_html,
-        'no_results': no_results,  # 쿠팡이 "검색결과 없음" 응답 (정상적인 미발견)
-        'pages_searched': pages_searched  # 성공적으로 검색 완료한 최대 페이지
-    }
-
-
-if __name__ == '__main__':
-    print("검색 모듈 테스트")
-    print("=" * 60)
-    print("사용법: search.py는 직접 실행하지 않고 모듈로 import하여 사용")
+    return _single_result(search_products(
+        query, [(target_product_id, target_item_id, target_vendor_item_id)], cookies, tls_profile, proxy,
+        max_page=max_page, verbose=verbose, save_html=save_html, total_timeout=total_timeout,
+        deadline=deadline, hint_page=hint_page, keep_products=keep_products))
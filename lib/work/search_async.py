@@ -0,0 +1,205 @@
+"""
+비동기 검색 모듈 - curl-cffi AsyncSession
+
+search_product/search_products의 asyncio 버전 (같은 배치 전략/매칭/결과 형식)
+- 페이지 요청은 AsyncSession(libcurl multi) 하나로 처리 → 스레드 하나가 수백 개 요청을 동시 처리
+- 요청/대기(I/O)만 비동기로 하고 나머지는 동기 검색과 공용:
+  페이지 요청 재시도/분류는 search._PageFetch, 검색 진행 상태/재시도 계획/결과 생성은 search._SearchState
+- 발견/차단 시 요청 취소는 동기 검색과 같은 CancelToken (전송 중단, 대기 중 재시도 생략, 취소 통계)
+  취소한 뒤 페이지 요청은 기다리지 않음
+- 페이지 추출(파싱)은 이벤트 루프에서 실행 (scan/selectolax 기준 페이지당 수 ms)
+
+사용법:
+    async with create_async_session() as session:
+        results = await asyncio.gather(*[
+            search_product_async(query, product_id, cookies, tls_profile, proxy, session=session)
+            for query, product_id, ... in tasks
+        ])
+"""
+
+import asyncio
+
+from curl_cffi.requests import AsyncSession
+
+from work.request import make_request_async
+from work.search import _SearchState, _PageFetch, _single_result, _request_cookies
+from work.cancel import CancelToken
+
+# 세션당 동시 요청 수 (libcurl multi 핸들 수)
+ASYNC_MAX_CLIENTS = 200
+
+
+def create_async_session(max_clients=None):
+    """검색용 AsyncSession 생성 (쿠키 저장소 미사용, 요청마다 쿠키 전달)
+
+    Args:
+        max_clients: 동시 요청 수 (기본: ASYNC_MAX_CLIENTS)
+
+    Returns:
+        AsyncSession: async with로 사용 (종료 시 연결 정리)
+    """
+    return AsyncSession(max_clients=max_clients or ASYNC_MAX_CLIENTS, discard_cookies=True)
+
+
+async def fetch_page_async(session, page_num, query, trace_id, cookies, tls_profile, proxy, save_html=False,
+                           max_retries=2, matcher=None, cancel=None, deadline=None, retry_budget=None):
+    """단일 페이지 검색 (fetch_page의 비동기 버전, 같은 결과 형식/재시도 규칙)
+
+    Args:
+        session: AsyncSession
+        나머지: fetch_page와 동일
+    """
+    fetch = _PageFetch(page_num, query, trace_id, tls_profile, save_html, max_retries, matcher,
+                       cancel, deadline, retry_budget)
+    while fetch.begin():
+        try:
+            resp = await make_request_async(session, fetch.url, _request_cookies(cookies), tls_profile, proxy,
+                                            cancel=cancel, deadline=deadline)
+            retry = fetch.on_response(resp)
+        except Exception as e:
+            retry = fetch.on_error(e)
+        if retry:
+            await _retry_wait_async(cancel, fetch.delay)
+    return fetch.result
+
+
+async def _retry_wait_async(cancel, delay):
+    """재시도 전 대기 (취소되면 바로 반환)"""
+    if cancel is None:
+        await asyncio.sleep(delay)
+    else:
+        await cancel.wait_async(delay)
+
+
+async def _retry_failed_pages_async(session, state, pages, query, tls_profile, proxy, save_html=False):
+    """배치 실패 페이지 재시도 (search._retry_failed_pages의 비동기 버전)"""
+    retry_pages = state.plan_retries(pages)
+    if not retry_pages:
+        return
+
+    tokens = {p: CancelToken() for p in retry_pages}
+    tasks = {
+        asyncio.ensure_future(fetch_page_async(
+            session, p, query, state.trace_id, state.cookies, tls_profile, proxy, save_html,
+            max_retries=1, matcher=state.matcher, cancel=tokens[p], deadline=state.deadline,
+            retry_budget=state.retry_budget
+        )): p for p in retry_pages
+    }
+
+    keep_until = None
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=tasks.get):
+                stop = state.take_retry(tasks[task], task.result())
+                if stop is not None and keep_until is None:
+                    # 뒤 재시도는 중단만 하고 기다리지 않음
+                    keep_until = stop
+                    pending = _cancel_pages(tasks, tokens, keep_until, 'found', pending)
+    finally:
+        if pending:  # 예외/바깥 취소로 빠져나온 경우: 남은 요청 중단
+            _cancel_pages(tasks, tokens, 0, 'error', pending)
+
+
+# 기다리지 않고 중단한 요청 태스크 (완료 전 GC 방지)
+_detached = set()
+
+
+def _cancel_pages(tasks, tokens, keep_until, reason, pending=()):
+    """keep_until 뒤 페이지 요청 취소 (토큰 → 요청 태스크 바로 취소), 완료는 기다리지 않음
+
+    Returns:
+        set: pending 중 계속 기다릴 태스크 (keep_until 이하 페이지)
+    """
+    for task, page in tasks.items():
+        if page > keep_until:
+            tokens[page].cancel(reason)
+            if not task.done():
+                _detached.add(task)
+                task.add_done_callback(_detached.discard)
+    return {task for task in pending if tasks[task] <= keep_until}
+
+
+async def search_products_async(query, targets, cookies, tls_profile, proxy, max_page=13, verbose=True,
+                                save_html=False, total_timeout=20, deadline=None, hint_page=None, keep_products=False,
+                                session=None):
+    """여러 타겟 상품 검색 (search_products의 비동기 버전)
+
+    배치 전략/매칭 우선순위/반환값은 search_products와 동일.
+    모두 발견/차단 시 배치의 나머지 요청은 취소하되, 마지막 발견 페이지보다 앞 페이지 요청은
+    끝까지 기다림 (앞 페이지 상품 수가 actual_rank에 필요).
+
+    Args:
+        session: AsyncSession (None이면 이 검색용으로 만들고 종료)
+        나머지: search_products와 동일
+
+    Returns:
+        dict: search_products와 동일
+    """
+    if session is None:
+        async with create_async_session() as own_session:
+            return await search_products_async(
+                query, targets, cookies, tls_profile, proxy, max_page, verbose, save_html,
+                total_timeout, deadline, hint_page, keep_products, session=own_session)
+
+    state = _SearchState(query, targets, cookies, max_page=max_page, verbose=verbose, save_html=save_html,
+                         total_timeout=total_timeout, deadline=deadline, hint_page=hint_page,
+                         keep_products=keep_products)
+
+    for batch_idx in range(len(state.batches)):
+        pages = state.start_tier(batch_idx)
+        if not pages:
+            break
+
+        # 페이지별 취소 토큰: 발견/차단 시 진행 중인 전송도 중단
+        tokens = {p: CancelToken() for p in pages}
+        tasks = {
+            asyncio.ensure_future(fetch_page_async(
+                session, p, query, state.trace_id, state.cookies, tls_profile, proxy, save_html,
+                matcher=state.matcher, cancel=tokens[p], deadline=state.deadline, retry_budget=state.retry_budget
+            )): p for p in pages
+        }
+
+        keep_until = max(pages)
+        try:
+            for next_done in asyncio.as_completed(list(tasks)):
+                if state.add_page(await next_done, batch_idx):
+                    # 모두 발견 시 마지막 발견 페이지 뒤만, 차단 시 전부 취소 (앞 페이지는 actual_rank에 필요)
+                    keep_until, reason = state.stop_scope()
+                    _cancel_pages(tasks, tokens, keep_until, reason)
+                    break
+        finally:
+            # 남은 앞 페이지 완료 대기 (예외로 빠져나온 경우 포함), 취소한 뒤 페이지는 기다리지 않음
+            await asyncio.gather(*[t for t, p in tasks.items() if p <= keep_until], return_exceptions=True)
+
+        results = [task.result() for task in sorted(tasks, key=tasks.get)
+                   if tasks[task] <= keep_until and not task.cancelled()]
+        state.add_late(results)
+
+        # 실패 페이지 동시 재시도 (1번씩, 재시도 예산 안에서)
+        await _retry_failed_pages_async(session, state, pages, query, tls_profile, proxy, save_html)
+
+        state.end_tier(batch_idx, results)
+
+    return state.result()
+
+
+async def search_product_async(query, target_product_id, cookies, tls_profile, proxy,
+                               target_item_id=None, target_vendor_item_id=None,
+                               max_page=13, verbose=True, save_html=False,
+                               total_timeout=20, deadline=None, hint_page=None, keep_products=False,
+                               session=None):
+    """상품 검색 (search_product의 비동기 버전, search_products_async 타겟 1개 래퍼)
+
+    Args:
+        session: AsyncSession (None이면 이 검색용으로 만들고 종료)
+        나머지: search_product와 동일
+
+    Returns:
+        dict: search_product와 동일
+    """
+    return _single_result(await search_products_async(
+        query, [(target_product_id, target_item_id, target_vendor_item_id)], cookies, tls_profile, proxy,
+        max_page=max_page, verbose=verbose, save_html=save_html, total_timeout=total_timeout,
+        deadline=deadline, hint_page=hint_page, keep_products=keep_products, session=session))
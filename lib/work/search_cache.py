@@ -0,0 +1,134 @@
+"""
+검색 결과 페이지 캐시 (검색어, 페이지, 플랫폼) → 추출한 랭킹 상품
+
+작업 할당에서 같은 키워드가 몇 분 안에 여러 상품에 반복되면 같은 검색 페이지를 다시 받지 않음:
+- 키: 정규화한 검색어 + 페이지 + 플랫폼 (pc/mobile, TLS 프로필 기준 - 플랫폼별 검색 결과가 다름)
+- 값: HTML 원본 대신 페이지 전체 랭킹 상품(표시 필드 확정) + 페이지 유형 + 응답 크기
+- TTL(SEARCH_CACHE_TTL) 지나면 만료 (순위 변동 반영), 크기 제한 LRU
+- 적중/미적중/만료 + 절약한 응답 바이트 통계
+
+기본 꺼짐 (SEARCH_CACHE_SIZE = 0, work.py --search-cache로 활성화)
+Note: 캐시 적중 페이지는 응답 쿠키/HTML 원본이 없음 (save_html 검색은 캐시 미사용)
+"""
+
+import threading
+
+from common.cache import LRUCache
+
+# 최대 페이지 수 (0이면 캐시 안함)
+SEARCH_CACHE_SIZE = 0
+
+# 페이지 유효 시간 (초)
+SEARCH_CACHE_TTL = 300
+
+
+def normalize_query(query):
+    """캐시 키용 검색어 정규화 (앞뒤/연속 공백 정리, 소문자)"""
+    return ' '.join(query.split()).lower()
+
+
+class SearchPageCache:
+    """검색 결과 페이지 캐시 (스레드 안전)
+
+    사용법:
+        cache = SearchPageCache(1000, ttl=300)
+        cache.put('노트북', 1, 'pc', page_type, ranking, size)
+        entry = cache.get('노트북', 1, 'pc')   # {page_type, ranking, size} 또는 None
+        cache.stats()  # LRUCache 통계 + bytes_saved
+    """
+
+    def __init__(self, capacity=None, ttl=None):
+        """
+        Args:
+            capacity: 최대 페이지 수 (기본 SEARCH_CACHE_SIZE, 0이면 저장 안함)
+            ttl: 페이지 유효 시간 (초, 기본 SEARCH_CACHE_TTL)
+        """
+        self._cache = LRUCache(SEARCH_CACHE_SIZE if capacity is None else capacity,
+                               ttl=SEARCH_CACHE_TTL if ttl is None else ttl)
+        self._lock = threading.Lock()
+        self._bytes_saved = 0
+
+    @property
+    def enabled(self):
+        return self._cache.capacity > 0
+
+    def get(self, query, page, platform):
+        """캐시 조회 (적중 시 절약 바이트 기록)
+
+        Returns:
+            dict: {page_type, ranking: 상품 튜플 (공유 객체, 복사해서 사용), size} 또는 None
+        """
+        entry = self._cache.get((normalize_query(query), page, platform))
+        if entry is not None:
+            with self._lock:
+                self._bytes_saved += entry['size']
+        return entry
+
+    def put(self, query, page, platform, page_type, ranking, size):
+        """성공 페이지 저장
+
+        Args:
+            page_type: 응답 분류 (work.classify PAGE_OK 또는 PAGE_NO_RESULTS)
+            ranking: 페이지 전체 랭킹 상품 튜플 (표시 필드 확정)
+            size: 응답 본문 크기 (적중 시 절약 바이트)
+        """
+        self._cache.put((normalize_query(query), page, platform),
+                        {'page_type': page_type, 'ranking': ranking, 'size': size})
+
+    def configure(self, capacity=None, ttl=None):
+        """크기/유효 시간 변경 (None이면 유지)"""
+        if capacity is not None:
+            self._cache.resize(capacity)
+        if ttl is not None:
+            self._cache.set_ttl(ttl)
+
+    def clear(self):
+        """항목 및 통계 초기화"""
+        self._cache.clear()
+        with self._lock:
+            self._bytes_saved = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def stats(self):
+        """통계 스냅샷
+
+        Returns:
+            dict: {size, capacity, ttl, hits, misses, evictions, expired, hit_rate, bytes_saved}
+        """
+        stats = self._cache.stats()
+        with self._lock:
+            stats['bytes_saved'] = self._bytes_saved
+        return stats
+
+
+# ============================================================================
+# 프로세스 공용 인스턴스
+# ============================================================================
+_cache = SearchPageCache()
+
+
+def get_search_cache():
+    """공용 검색 결과 페이지 캐시"""
+    return _cache
+
+
+def set_search_cache(size=None, ttl=None):
+    """공용 캐시 크기/유효 시간 변경
+
+    Args:
+        size: 최대 페이지 수 (0이면 캐시 끔, None이면 유지)
+        ttl: 페이지 유효 시간 (초, None이면 유지)
+    """
+    global SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL
+    if size is not None:
+        SEARCH_CACHE_SIZE = max(0, int(size))
+    if ttl is not None:
+        SEARCH_CACHE_TTL = ttl
+    _cache.configure(SEARCH_CACHE_SIZE if size is not None else None, ttl)
+
+
+def get_search_cache_stats():
+    """공용 캐시 통계 스냅샷 (SearchPageCache.stats 참고)"""
+    return _cache.stats()
@@ -0,0 +1,206 @@
+"""
+검색 Tier 구성 학습 모듈
+
+고정 Tier([1], [2-5], [6-13]) 대신 실제 발견 페이지 분포로 Tier 경계를 계산:
+- 최근 검색 결과 (발견 페이지 / 미발견 시 검색한 페이지 수) 롤링 히스토그램
+- 비용 = 요청 페이지 수 + Tier 왕복 수 × TIER_ROUND_TRIP_COST (왕복 1회 = 페이지 N개 비용)
+- Tier는 앞 Tier에서 끝나지 않은 검색만 실행 → 기대 비용 최소 분할을 DP로 계산
+  (Tier 크기는 TIER_MAX_PAGES 이하 = 프록시별 동시 요청 한도)
+
+Note: 발견 Tier의 뒤 페이지는 취소되지만 (search_product) 비용 계산은 Tier 전체로 근사
+"""
+
+import threading
+from collections import deque, Counter
+
+# 롤링 히스토그램 크기 (최근 검색 결과 수)
+TIER_WINDOW = 5000
+
+# 학습 Tier를 쓰기 위한 최소 표본 수 (미만이면 기본 Tier)
+TIER_MIN_SAMPLES = 200
+
+# Tier당 최대 페이지 수 (동시 요청 한도, executor.FETCH_PER_PROXY와 동일)
+TIER_MAX_PAGES = 8
+
+# Tier 왕복 1회 비용 (페이지 요청 수 환산, 클수록 Tier 수를 줄임)
+TIER_ROUND_TRIP_COST = 3.0
+
+# Tier 재계산 주기 (새 결과 수)
+TIER_REPLAN_EVERY = 50
+
+
+def default_batches(last_page=13):
+    """기본 Tier: [1], [2-5], [6-13] (빈 배치 제외)"""
+    batches = [
+        [1],                    # Tier 1: 1페이지 단독
+        [2, 3, 4, 5],           # Tier 2: 2-5페이지 동시
+        list(range(6, last_page + 1))  # Tier 3: 6-13페이지 동시
+    ]
+    return [b for b in batches if b]  # 빈 배치 제거
+
+
+def expected_cost(batches, tail):
+    """Tier 구성의 기대 요청 페이지 수 / 기대 Tier 수
+
+    Args:
+        batches: 페이지 배치 목록
+        tail: tail[k] = k페이지까지로 끝나지 않을 확률 (tail[0] = 1)
+
+    Returns:
+        tuple: (기대 페이지 수, 기대 Tier 수)
+    """
+    pages = tiers = 0.0
+    for batch in batches:
+        reach = tail[batch[0] - 1] if batch[0] - 1 < len(tail) else 0.0
+        pages += reach * len(batch)
+        tiers += reach
+    return pages, tiers
+
+
+def optimize_batches(tail, last_page, max_pages=None, round_trip_cost=None):
+    """기대 비용 최소 Tier 분할 (DP, O(last_page × max_pages))
+
+    f[b] = min_a f[a-1] + tail[a-1] × ((b - a + 1) + round_trip_cost)
+
+    Args:
+        tail: tail[k] = k페이지까지로 끝나지 않을 확률 (길이 last_page 이상)
+        last_page: 마지막 페이지
+        max_pages: Tier당 최대 페이지 수 (기본 TIER_MAX_PAGES)
+        round_trip_cost: Tier 왕복 비용 (기본 TIER_ROUND_TRIP_COST)
+
+    Returns:
+        list: 페이지 배치 목록
+    """
+    max_pages = max(1, max_pages or TIER_MAX_PAGES)
+    round_trip_cost = TIER_ROUND_TRIP_COST if round_trip_cost is None else round_trip_cost
+    best = [0.0] + [float('inf')] * last_page
+    start = [0] * (last_page + 1)
+    for b in range(1, last_page + 1):
+        # 큰 Tier부터 확인 → 비용이 같으면 Tier 수가 적은 쪽
+        for a in range(max(1, b - max_pages + 1), b + 1):
+            cost = best[a - 1] + tail[a - 1] * ((b - a + 1) + round_trip_cost)
+            if cost < best[b]:
+                best[b] = cost
+                start[b] = a
+    batches = []
+    b = last_page
+    while b > 0:
+        batches.append(list(range(start[b], b + 1)))
+        b = start[b] - 1
+    return batches[::-1]
+
+
+class TierModel:
+    """발견 페이지 롤링 히스토그램 + 학습 Tier (스레드 안전)
+
+    사용법:
+        model = TierModel()
+        model.observe(found_page=9, pages_needed=9)       # 발견
+        model.observe(found_page=None, pages_needed=13)   # 미발견
+        model.plan(13)        # 표본 부족이면 기본 Tier
+        model.histogram()     # {samples, found, not_found}
+    """
+
+    def __init__(self, window=None, min_samples=None):
+        self.window = window or TIER_WINDOW
+        self.min_samples = TIER_MIN_SAMPLES if min_samples is None else min_samples
+        self.max_pages = TIER_MAX_PAGES
+        self.round_trip_cost = TIER_ROUND_TRIP_COST
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=self.window)
+        self._since_plan = 0
+        self._plans = {}
+
+    def observe(self, found_page, pages_needed):
+        """검색 결과 기록
+
+        Args:
+            found_page: 발견 페이지 (미발견이면 None)
+            pages_needed: 검색 종료에 필요했던 페이지 수 (발견이면 found_page)
+        """
+        with self._lock:
+            self._outcomes.append((found_page, pages_needed or found_page or 0))
+            self._since_plan += 1
+            if self._since_plan >= TIER_REPLAN_EVERY:
+                self._since_plan = 0
+                self._plans.clear()
+
+    def load(self, outcomes):
+        """저장된 결과로 히스토그램 채우기 (시간순 (found_page, pages_needed) 목록)"""
+        with self._lock:
+            self._outcomes.extend(outcomes)
+            self._plans.clear()
+
+    def configure(self, enabled=None, max_pages=None, round_trip_cost=None):
+        """학습 옵션 변경 (None이면 유지)"""
+        with self._lock:
+            if enabled is not None:
+                self.enabled = enabled
+            if max_pages is not None:
+                self.max_pages = max(1, int(max_pages))
+            if round_trip_cost is not None:
+                self.round_trip_cost = float(round_trip_cost)
+            self._plans.clear()
+
+    def __len__(self):
+        return len(self._outcomes)
+
+    def histogram(self):
+        """히스토그램 스냅샷
+
+        Returns:
+            dict: {samples, found: {페이지: 건수}, not_found: {검색 페이지 수: 건수}}
+        """
+        with self._lock:
+            outcomes = list(self._outcomes)
+        found = Counter(page for page, _ in outcomes if page)
+        not_found = Counter(needed for page, needed in outcomes if not page)
+        return {'samples': len(outcomes), 'found': dict(sorted(found.items())),
+                'not_found': dict(sorted(not_found.items()))}
+
+    def tail(self, last_page):
+        """tail[k] = k페이지까지로 끝나지 않을 확률 (k = 0..last_page)
+
+        가상 표본 1개(전체 페이지 필요)를 더해 관측 없는 뒤 페이지도 0이 되지 않게 함
+        """
+        with self._lock:
+            needed = [min(n, last_page) for _, n in self._outcomes]
+        counts = Counter(needed)
+        total = len(needed) + 1
+        remaining = total
+        tail = []
+        for k in range(last_page + 1):
+            remaining -= counts.get(k, 0)
+            tail.append(remaining / total)
+        return tail
+
+    def plan(self, last_page=13):
+        """현재 Tier 구성 (학습 비활성/표본 부족이면 기본 Tier)
+
+        Returns:
+            list: 페이지 배치 목록
+        """
+        if not self.enabled or len(self._outcomes) < self.min_samples:
+            return default_batches(last_page)
+        plan = self._plans.get(last_page)
+        if plan is None:
+            plan = optimize_batches(self.tail(last_page), last_page, self.max_pages, self.round_trip_cost)
+            self._plans[last_page] = plan
+        return [list(b) for b in plan]
+
+
+# ============================================================================
+# 프로세스 공용 인스턴스
+# ============================================================================
+_model = TierModel()
+
+
+def get_tier_model():
+    """공용 Tier 모델"""
+    return _model
+
+
+def observe_search(found_page, pages_needed):
+    """공용 Tier 모델에 검색 결과 기록 (TierModel.observe 참고)"""
+    _model.observe(found_page, pages_needed)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+검색 Tier 리포트
+
+순위 이력 DB(work.py --history)의 최근 검색 결과 로그로:
+- 발견 페이지 / 미발견 검색 페이지 수 히스토그램
+- 학습 Tier 구성과 기본 Tier([1], [2-5], [6-13]) 기대 비용 비교
+  (기대 요청 페이지 수, 기대 Tier 왕복 수)
+
+사용법:
+  python3 tier_report.py
+  python3 tier_report.py --db data/rank_history.db --max-page 13
+  python3 tier_report.py --tier-pages 6 --tier-cost 5
+"""
+
+import sys
+import os
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib'))
+
+from work.history import RankHistory
+from work.tiers import (
+    TierModel, default_batches, expected_cost, TIER_WINDOW, TIER_MAX_PAGES, TIER_ROUND_TRIP_COST,
+)
+
+
+def format_batches(batches):
+    return ' '.join(f"[{b[0]}]" if len(b) == 1 else f"[{b[0]}-{b[-1]}]" for b in batches)
+
+
+def print_histogram(title, counts, total, width=40):
+    print(f"\n{title}")
+    if not counts:
+        print("  (없음)")
+        return
+    peak = max(counts.values())
+    for key, count in counts.items():
+        bar = '#' * max(1, round(count / peak * width))
+        print(f"  {key:>3} | {bar:<{width}} {count:6d} ({count / total * 100:5.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검색 Tier 리포트 (발견 페이지 분포 → Tier 구성)')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(__file__), 'data', 'rank_history.db'),
+                        help='순위 이력 DB 경로 (기본: data/rank_history.db)')
+    parser.add_argument('--window', type=int, default=TIER_WINDOW,
+                        help=f'최근 결과 수 (기본: {TIER_WINDOW})')
+    parser.add_argument('--max-page', type=int, default=13, help='최대 페이지 (기본: 13)')
+    parser.add_argument('--tier-pages', type=int, default=TIER_MAX_PAGES,
+                        help=f'Tier당 최대 페이지 수 (기본: {TIER_MAX_PAGES})')
+    parser.add_argument('--tier-cost', type=float, default=TIER_ROUND_TRIP_COST,
+                        help=f'Tier 왕복 1회 비용 (페이지 요청 수 환산, 기본: {TIER_ROUND_TRIP_COST})')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"순위 이력 DB 없음: {args.db}")
+        sys.exit(1)
+
+    history = RankHistory(args.db)
+    model = TierModel(window=args.window, min_samples=0)
+    model.configure(max_pages=args.tier_pages, round_trip_cost=args.tier_cost)
+    model.load(history.recent_outcomes(args.window))
+    history.close()
+
+    hist = model.histogram()
+    total = hist['samples']
+    print(f"검색 결과: {total}건 | 발견 {sum(hist['found'].values())} | 미발견 {sum(hist['not_found'].values())}")
+    if not total:
+        return
+    print_histogram("발견 페이지", hist['found'], total)
+    print_histogram("미발견 검색 페이지 수", hist['not_found'], total)
+
+    last_page = min(args.max_page, 13)
+    tail = model.tail(last_page)
+    print(f"\nTier 구성 (Tier당 최대 {args.tier_pages}페이지, 왕복 비용 {args.tier_cost}페이지)")
+    print(f"  {'':6s} {'구성':32s} {'기대 페이지':>10s} {'기대 Tier':>9s} {'비용':>7s}")
+    for name, batches in (('기본', default_batches(last_page)), ('학습', model.plan(last_page))):
+        pages, tiers = expected_cost(batches, tail)
+        print(f"  {name:6s} {format_batches(batches):32s} {pages:10.2f} {tiers:9.2f} "
+              f"{pages + tiers * args.tier_cost:7.2f}")
+    if total < TierModel().min_samples:
+        print(f"\n  ⚠️ 표본 {total}건 < {TierModel().min_samples}건: work.py는 아직 기본 Tier 사용")
+
+
+if __name__ == '__main__':
+    main()
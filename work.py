@@ -50,6 +50,18 @@ from urllib3.util.retry import Retry
 
 # 직접 모듈 import (8088 HTTP API 대신)
 from api.rank_checker import check_rank as _check_rank
+from extractor.search_extractor import (
+    PARSER_BACKENDS, set_default_parser, set_region_parsing, set_scan_verification, get_scan_stats, get_region_stats,
+    get_verify_stats
+)
+from work.search import PAGE_CACHE_SIZE, set_page_cache_size, get_page_cache_stats
+from work.search_cache import SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL, set_search_cache, get_search_cache_stats
+from work.executor import FETCH_MAX_IN_FLIGHT, FETCH_PER_PROXY, set_fetch_limits, get_fetch_stats
+from work.cancel import get_cancel_stats
+from work.errors import get_error_stats
+from work.retry import get_retry_stats
+from work.history import set_history_db, get_history
+from work.tiers import TIER_MAX_PAGES, TIER_ROUND_TRIP_COST, get_tier_model
 
 # API 설정 (3302만 사용, 8088 제거)
 WORK_API = 'http://mkt.techb.kr:3302'
@@ -527,6 +539,50 @@ def run_parallel(args):
             time.sleep(1)
     except KeyboardInterrupt:
         print(f"\n\n중단. {stats['total']}회 | 발견:{stats['found']} 미발견:{stats['not_found']} 실패:{stats['failed']}")
+        if args.parser == 'scan':
+            scan = get_scan_stats()
+            print(f"scan 파서: {scan['pages']}페이지 | 폴백:{scan['fallbacks']} 검증:{scan['verified']} 불일치:{scan['mismatches']}")
+        else:
+            region = get_region_stats()
+            if region['pages']:
+                print(f"구간 파싱: {region['region_pages']}/{region['pages']}페이지 | "
+                      f"평균 {region['avg_skipped'] / 1024:.0f}K자 건너뜀")
+            for name, verify in get_verify_stats().items():
+                print(f"{name} 파서 검증: {verify['verified']}페이지 | 불일치:{verify['mismatches']}")
+        cache = get_page_cache_stats()
+        if cache['hits'] or cache['misses']:
+            print(f"페이지 캐시: 적중 {cache['hits']}/{cache['hits'] + cache['misses']} "
+                  f"({cache['hit_rate'] * 100:.1f}%) | 축출:{cache['evictions']} | {cache['size']}/{cache['capacity']}")
+        search_cache = get_search_cache_stats()
+        if search_cache['hits'] or search_cache['misses']:
+            print(f"검색 페이지 캐시: 적중 {search_cache['hits']}/{search_cache['hits'] + search_cache['misses']} "
+                  f"({search_cache['hit_rate'] * 100:.1f}%) | 만료:{search_cache['expired']} | "
+                  f"축출:{search_cache['evictions']} | 절약 {search_cache['bytes_saved'] / 1024 / 1024:.1f}MB")
+        fetch = get_fetch_stats()
+        if fetch['submitted']:
+            print(f"요청 실행기: {fetch['completed']}/{fetch['submitted']}건 | 취소:{fetch['cancelled']} | "
+                  f"최대 동시 {fetch['peak_in_flight']}/{fetch['max_in_flight']} | 최대 대기 {fetch['peak_queued']} | "
+                  f"평균 대기 {fetch['avg_wait_ms']:.1f}ms")
+        cancel = get_cancel_stats()
+        if cancel['aborted'] or cancel['skipped']:
+            print(f"요청 취소: 전송 중단 {cancel['aborted']} | 시작 전 {cancel['skipped']} | 파싱 생략 {cancel['skipped_parses']} | "
+                  f"절약 추정 {cancel['saved_bytes'] / 1024 / 1024:.1f}MB, {cancel['saved_seconds']:.1f}초")
+        errors = get_error_stats()
+        if errors:
+            print("요청 에러: " + ' | '.join(f"{kind}:{count}" for kind, count in errors.items()))
+        retry = get_retry_stats()
+        if retry['spent'] or retry['denied']:
+            print(f"재시도: 사용 {retry['spent']} | 복구 {retry['recovered']} | 예산 부족 {retry['denied']} | "
+                  f"복구당 {retry['per_recovery']:.1f}회")
+        history = get_history()
+        if history and history.stats()['lookups']:
+            hist = history.stats()
+            print(f"순위 이력: 힌트 {hist['hits']}/{hist['lookups']} ({hist['hit_rate'] * 100:.1f}%) | "
+                  f"기록 {hist['records']} | 저장 {len(history)}건")
+        tiers = get_tier_model()
+        if len(tiers):
+            layout = ' '.join(f"[{b[0]}]" if len(b) == 1 else f"[{b[0]}-{b[-1]}]" for b in tiers.plan(args.max_page))
+            print(f"검색 Tier: {layout} (표본 {len(tiers)}건)")
 
 
 def main():
@@ -538,9 +594,47 @@ def main():
     parser.add_argument('--task-id', type=int, help='특정 task ID')
     parser.add_argument('--verbose', '-v', action='store_true', default=True)
     parser.add_argument('--debug', '-d', action='store_true', help='디버그 모드 (할당 응답 출력)')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, help='HTML 파서 백엔드 (기본: html.parser)')
+    parser.add_argument('--region-parse', action='store_true',
+                        help='DOM 파서가 상품 리스트 구간만 파싱 (빠르지만 잘못된 마크업에서 전체 파싱과 다를 수 있음)')
+    parser.add_argument('--scan-verify', type=float, default=0.0,
+                        help='파서 검증 샘플 비율 (scan/lxml/selectolax 결과를 html.parser와 비교, 0.0~1.0, '
+                             '불일치 페이지는 logs/scan_mismatch/에 저장)')
+    parser.add_argument('--page-cache', type=int, default=PAGE_CACHE_SIZE,
+                        help=f'파싱 결과 캐시 페이지 수 (본문 해시 기준, 0이면 끔, 기본: {PAGE_CACHE_SIZE})')
+    parser.add_argument('--search-cache', type=int, default=SEARCH_CACHE_SIZE,
+                        help=f'검색 결과 페이지 캐시 수 (검색어+페이지+플랫폼 기준, 0이면 끔, 기본: {SEARCH_CACHE_SIZE})')
+    parser.add_argument('--search-cache-ttl', type=float, default=SEARCH_CACHE_TTL,
+                        help=f'검색 결과 페이지 캐시 유효 시간 (초, 기본: {SEARCH_CACHE_TTL})')
+    parser.add_argument('--fetch-limit', type=int, default=FETCH_MAX_IN_FLIGHT,
+                        help=f'전체 동시 페이지 요청 수 (기본: {FETCH_MAX_IN_FLIGHT})')
+    parser.add_argument('--proxy-limit', type=int, default=FETCH_PER_PROXY,
+                        help=f'프록시별 동시 페이지 요청 수 (0이면 제한 없음, 기본: {FETCH_PER_PROXY})')
+    parser.add_argument('--history', default='',
+                        help='순위 이력 DB 경로 (마지막 발견 페이지부터 검색, 예: data/rank_history.db, 기본: 끔)')
+    parser.add_argument('--fixed-tiers', action='store_true',
+                        help='학습 Tier 대신 고정 Tier [1], [2-5], [6-13] 사용')
+    parser.add_argument('--tier-pages', type=int, default=TIER_MAX_PAGES,
+                        help=f'학습 Tier당 최대 페이지 수 (동시 요청 한도, 기본: {TIER_MAX_PAGES})')
+    parser.add_argument('--tier-cost', type=float, default=TIER_ROUND_TRIP_COST,
+                        help=f'Tier 왕복 1회 비용 (페이지 요청 수 환산, 기본: {TIER_ROUND_TRIP_COST})')
 
     args = parser.parse_args()
 
+    if args.parser:
+        set_default_parser(args.parser)
+    if args.region_parse:
+        set_region_parsing(True)
+    if args.scan_verify > 0:
+        set_scan_verification(args.scan_verify,
+                              mismatch_dir=os.path.join(os.path.dirname(__file__), 'logs', 'scan_mismatch'))
+    set_page_cache_size(args.page_cache)
+    set_search_cache(args.search_cache, args.search_cache_ttl)
+    set_fetch_limits(args.fetch_limit, args.proxy_limit)
+    get_tier_model().configure(enabled=not args.fixed_tiers, max_pages=args.tier_pages,
+                               round_trip_cost=args.tier_cost)
+    set_history_db(args.history)
+
     if args.parallel:
         run_parallel(args)
     elif args.loop: